@@ -3,10 +3,10 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant import config as hass_config
 import homeassistant.helpers.config_validation as cv
 
@@ -16,17 +16,28 @@ from .const import (
     PLATFORMS,
     DEVICE_MANUFACTURER, 
     DEVICE_MODEL_MEMBER,
-    DEVICE_MODEL_CHORE,
     DEVICE_SW_VERSION,
+    LOGGER,
     )
 from .storage_manager import SimpleChoresStorageManager
-from .coordinator import SimpleChoresCoordinator
-from .member import Member
+from .coordinator import SimpleChoresCoordinator, async_register_chore_device
+from .entity_map import ChoreEntityMap
+from .scheduler import SimpleChoresScheduler
+from .member import Member, TRACKER_PERIODS
 from . import services
 
 # Configuration schema for config-entry only integration
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Unique ID suffixes of the member sensors
+MEMBER_SENSOR_SUFFIXES = (
+    *(f"points_earned_{period}" for period in TRACKER_PERIODS),
+    *(f"chores_{period}" for period in TRACKER_PERIODS),
+    "pending_chores",
+    "overdue_chores",
+    "assigned_chore_entities",
+)
+
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     """Set up integration via YAML (not used)."""
     return True
@@ -36,6 +47,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     
     storage = SimpleChoresStorageManager(hass)
     await storage.async_load()
+    if storage.store.migrated:
+        # Data saved before member IDs had its devices and entities keyed by name
+        await _async_migrate_member_registry(hass, entry, storage)
 
     # If this is the very first run (storage file didn't exist), create members from config entry
     # We check if storage.data is empty (not just members) to distinguish first run from "all members deleted"
@@ -53,10 +67,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     device_reg = dr.async_get(hass)
     all_members = storage.get_members()
     
-    for member_name in all_members:
+    for member_name, member in all_members.items():
         device_reg.async_get_or_create(
             config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, f"member_{member_name}")},
+            identifiers={(DOMAIN, f"member_{member.member_id}")},
             name=member_name,
             manufacturer=DEVICE_MANUFACTURER,
             model=DEVICE_MODEL_MEMBER,
@@ -67,39 +81,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     all_chores = storage.get_chores()
     
     for chore_id, chore in all_chores.items():
-        device = device_reg.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, f"chore_{chore_id}")},
-            name=chore.name,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL_CHORE,
-            sw_version=DEVICE_SW_VERSION,
-        )
-        
-        # Assign to area if specified
-        if chore.area_id:
-            device_reg.async_update_device(device.id, area_id=chore.area_id)
+        async_register_chore_device(hass, entry.entry_id, chore_id, chore)
+
+    # Resolve service targets to chores without going through entity states
+    entity_map = ChoreEntityMap(hass, entry.entry_id)
+    entity_map.async_setup()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "storage": storage,
         "coordinator": coordinator,
+        "entity_map": entity_map,
     }
 
-    # Set up midnight timer to check for period resets
-    async def _handle_midnight(now):
-        """Handle midnight event to check period resets."""
-        await coordinator.async_refresh_data()
-    
-    # Trigger at midnight every day
-    unsub = async_track_time_change(
-        hass,
-        _handle_midnight,
-        hour=0,
-        minute=0,
-        second=0,
-    )
-    hass.data[DOMAIN][entry.entry_id]["unsub_midnight"] = unsub
+    # Move chores to pending/overdue and reset period counters at the exact time
+    scheduler = SimpleChoresScheduler(hass, storage, coordinator)
+    scheduler.async_start()
+    hass.data[DOMAIN][entry.entry_id]["scheduler"] = scheduler
 
     # Set up services (only once for the integration)
     if len(hass.data[DOMAIN]) == 1:
@@ -110,15 +108,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     return True
 
+async def _async_migrate_member_registry(
+    hass: HomeAssistant, entry: ConfigEntry, storage: SimpleChoresStorageManager
+) -> None:
+    """Re-key member devices and sensors from the member name to the member ID."""
+    device_reg = dr.async_get(hass)
+    # Look every device up before re-keying any, as a name may look like an ID
+    devices = [
+        (device, member.member_id)
+        for name, member in storage.get_members().items()
+        if (device := device_reg.async_get_device(identifiers={(DOMAIN, f"member_{name}")}))
+    ]
+    for device, member_id in devices:
+        device_reg.async_update_device(device.id, new_identifiers={(DOMAIN, f"member_{member_id}")})
+
+    prefix = f"{DOMAIN}_"
+
+    @callback
+    def migrate_unique_id(entity_entry: er.RegistryEntry) -> dict | None:
+        if entity_entry.domain != Platform.SENSOR or not entity_entry.unique_id.startswith(prefix):
+            return None
+        for suffix in MEMBER_SENSOR_SUFFIXES:
+            if not entity_entry.unique_id.endswith(f"_{suffix}"):
+                continue
+            member_id = storage.get_member_id(entity_entry.unique_id[len(prefix):-len(suffix) - 1])
+            if member_id is not None:
+                return {"new_unique_id": f"{DOMAIN}_member_{member_id}_{suffix}"}
+        return None
+
+    await er.async_migrate_entries(hass, entry.entry_id, migrate_unique_id)
+    LOGGER.debug(f"Migrated {len(devices)} member device(s) to member IDs")
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        # Unsubscribe from midnight timer
+        # Stop the scheduler timer
         entry_data = hass.data[DOMAIN].pop(entry.entry_id)
-        if "unsub_midnight" in entry_data:
-            entry_data["unsub_midnight"]()
+        entry_data["scheduler"].async_stop()
+        entry_data["entity_map"].async_stop()
+        
+        # Write any changes still waiting in the write-behind buffer
+        await entry_data["storage"].async_flush()
         
         # Unload services if this was the last entry
         if not hass.data[DOMAIN]:
@@ -131,4 +163,4 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove a config entry and clean up storage."""
     # Remove the storage file when the integration is deleted
     storage = SimpleChoresStorageManager(hass)
-    await storage.store.async_remove()
+    await storage.async_remove()
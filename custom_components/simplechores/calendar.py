@@ -0,0 +1,145 @@
+"""Calendar platform for SimpleChores."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import List, Set
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    CALENDAR_HORIZON_DAYS,
+)
+from .coordinator import SimpleChoresCoordinator
+from .index import OccurrenceIndex
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the SimpleChores calendar."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    async_add_entities([ChoresCalendar(coordinator, entry)])
+
+
+class ChoresCalendar(CoordinatorEntity, CalendarEntity):
+    """Calendar showing the upcoming occurrences of all chores.
+
+    Occurrences are expanded into an OccurrenceIndex once, up to
+    CALENDAR_HORIZON_DAYS ahead (or further, once a later range is asked
+    for). Chores the storage reports as changed are re-expanded together,
+    once per event loop turn, and everything is expanded again only when
+    the day changes.
+    """
+
+    def __init__(self, coordinator: SimpleChoresCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._attr_name = "Chores"
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_chores"
+        self._attr_icon = "mdi:calendar-check"
+        self._index = OccurrenceIndex()
+        self._changed: Set[str] = set()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Follow chore changes in storage."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.storage.async_add_chore_listener(self._async_chores_changed)
+        )
+        self.async_on_remove(self._async_cancel_flush)
+
+    @callback
+    def _async_chores_changed(self, chore_ids: List[str]) -> None:
+        """Remember changed chores and re-expand them on the next loop turn."""
+        if self._index.until is None:
+            return
+        self._changed.update(chore_ids)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, 0, self._async_flush_changes)
+
+    @callback
+    def _async_flush_changes(self, _now: datetime) -> None:
+        """Re-expand the changed chores and write the state once."""
+        self._unsub_flush = None
+        self._apply_changes()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_flush(self) -> None:
+        """Cancel a pending flush."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+    def _apply_changes(self) -> None:
+        """Re-expand the chores changed since the last flush."""
+        if not self._changed:
+            return
+        chores = self.coordinator.storage.get_chores()
+        if len(self._changed) > len(chores) // 4:
+            # Sorting everything once beats inserting many chores one by one
+            self._index.rebuild(chores, self._index.today, self._index.until)
+        else:
+            for chore_id in self._changed:
+                self._index.set_chore(chore_id, chores.get(chore_id))
+        self._changed.clear()
+
+    def _ensure_index(self, today: date, last_day: date) -> None:
+        """Expand all chores if the day changed or last_day is past the horizon."""
+        if self._index.today == today and self._index.until >= last_day:
+            # Queries between a change and its flush see the change already
+            self._apply_changes()
+            return
+        self._changed.clear()
+        until = max(last_day, today + timedelta(days=CALENDAR_HORIZON_DAYS))
+        self._index.rebuild(self.coordinator.storage.get_chores(), today, until)
+
+    def _events(self, first_day: date, last_day: date) -> List[CalendarEvent]:
+        """Return the events of the occurrences between two days (inclusive)."""
+        self._ensure_index(dt_util.now().date(), last_day)
+        storage = self.coordinator.storage
+        events = []
+        for day, chore_id, member_id in self._index.lookup(first_day, last_day):
+            chore = storage.get_chore(chore_id)
+            if chore is None:
+                continue
+            assignee = storage.get_member_name(member_id)
+            events.append(CalendarEvent(
+                start=day,
+                end=day + timedelta(days=1),
+                summary=chore.name,
+                description=f"Assigned to {assignee}" if assignee else None,
+                uid=f"{chore_id}_{day.isoformat()}",
+            ))
+        return events
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next upcoming chore."""
+        today = dt_util.now().date()
+        events = self._events(today, today + timedelta(days=CALENDAR_HORIZON_DAYS))
+        return events[0] if events else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> List[CalendarEvent]:
+        """Return the chore occurrences between two points in time.
+
+        Occurrences are all-day events, so every day that overlaps the
+        range is included.
+        """
+        end = dt_util.as_local(end_date)
+        last_day = end.date()
+        if end.time() == datetime.min.time():
+            last_day -= timedelta(days=1)
+        return self._events(dt_util.as_local(start_date).date(), last_day)
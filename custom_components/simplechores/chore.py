@@ -1,13 +1,16 @@
 """Chore class for SimpleChores."""
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List
 from datetime import datetime, date, timedelta
+from itertools import cycle, repeat
 import random
-import calendar
+
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    LOGGER,
     CHORE_STATE_PENDING,
     CHORE_STATE_COMPLETED,
     CHORE_STATE_OVERDUE,
@@ -21,21 +24,124 @@ from .const import (
     FREQUENCY_INTERVAL_DAYS,
     FREQUENCY_SPECIFIC_DAYS,
     FREQUENCY_ANNUAL,
+    RRULE_FREQ_DAILY,
+    RRULE_FREQ_WEEKLY,
+    RRULE_FREQ_MONTHLY,
+    RRULE_FREQ_YEARLY,
+)
+from .recurrence import CompiledRule, RecurrenceRule, compile_rule
+from .serializer import StoredField, compile_from_dict, compile_to_dict
+
+
+def _parse_date(value: date | str | None) -> date | None:
+    """Convert a stored ISO date string to a date.
+
+    Dates are only parsed at the storage boundary; invalid values are
+    dropped with a warning.
+    """
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except (ValueError, TypeError):
+        LOGGER.warning(f"Ignoring invalid date: {value}")
+        return None
+
+
+def _parse_datetime(value: datetime | str | None) -> datetime:
+    """Convert a stored ISO timestamp to a datetime, defaulting to now."""
+    if isinstance(value, datetime):
+        return value
+    if value:
+        try:
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            LOGGER.warning(f"Ignoring invalid timestamp: {value}")
+    return datetime.now()
+
+
+def _format_date(value: date | None) -> str | None:
+    """Convert a date to the ISO string it is stored as."""
+    return value.isoformat() if value is not None else None
+
+
+def _format_datetime(value: datetime) -> str:
+    """Convert a timestamp to the ISO string it is stored as."""
+    return value.isoformat()
+
+
+def _format_dates(values: List[date]) -> List[str]:
+    """Convert a list of dates to the ISO strings they are stored as."""
+    return [value.isoformat() for value in values]
+
+
+def _parse_dates(values: List[date | str]) -> List[date]:
+    """Convert stored ISO date strings to dates, dropping invalid ones."""
+    return [day for day in map(_parse_date, values) if day is not None]
+
+
+def _copy_weeks(value: int | List[int] | None) -> int | List[int] | None:
+    """Copy a week-of-month list so stored data does not alias the chore."""
+    return list(value) if isinstance(value, list) else value
+
+
+def _load_weeks(value: int | List[int] | None) -> List[int] | None:
+    """Read a stored week of month, which older versions kept as a single int."""
+    if isinstance(value, int):
+        return [value]
+    return _copy_weeks(value)
+
+
+# Stored fields of a chore, in storage order
+CHORE_FIELDS = (
+    StoredField("name", default=""),
+    StoredField("points", default=0),
+    StoredField("status", default=CHORE_STATE_PENDING),
+    StoredField("last_completed", dump=_format_date, load=_parse_date),
+    StoredField("due_date", dump=_format_date, load=_parse_date),
+    StoredField("assignment_mode", default=ASSIGN_MODE_ALWAYS),
+    StoredField("assigned_to"),
+    StoredField("possible_assignees", default=(), dump=list, load=list),
+    StoredField("recurrence_pattern", default=FREQUENCY_DAILY),
+    StoredField("recurrence_interval", default=1),
+    StoredField("recurrence_day_of_month"),
+    StoredField("recurrence_week_of_month", dump=_copy_weeks, load=_load_weeks),
+    StoredField("recurrence_specific_weekdays", default=(), dump=list, load=list),
+    StoredField("recurrence_annual_month"),
+    StoredField("recurrence_annual_day"),
+    StoredField("recurrence_setpos", default=(), dump=list, load=list),
+    StoredField("recurrence_until", dump=_format_date, load=_parse_date),
+    StoredField("recurrence_count"),
+    StoredField("recurrence_exdates", default=(), dump=_format_dates, load=_parse_dates),
+    StoredField("area_id"),
+    StoredField("created_at", dump=_format_datetime, load=_parse_datetime),
+    # Set from the storage key on load; the storage key is authoritative
+    StoredField("chore_id", loaded=False),
 )
 
+_chore_to_dict = compile_to_dict(CHORE_FIELDS)
+_chore_kwargs_from_dict = compile_from_dict(CHORE_FIELDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class Chore:
-    """Represents a household chore."""
+    """Represents a household chore.
+
+    Dates are held as native ``date``/``datetime`` values; they are
+    converted from and to ISO strings only by ``from_dict`` and ``to_dict``.
+    Instances are slotted (no per-instance ``__dict__``); chores are live
+    objects mutated in place, so they are not frozen. Assignees are
+    referenced by member ID, so renaming a member does not touch its chores.
+    """
     
     name: str
     points: int = 0
     status: str = CHORE_STATE_PENDING  # pending, completed, overdue
-    last_completed: str | None = None  # ISO format date string
-    due_date: str | None = None  # ISO format date string
+    last_completed: date | None = None
+    due_date: date | None = None
     assignment_mode: str = ASSIGN_MODE_ALWAYS  # always, rotate, random
-    assigned_to: str | None = None  # Current assignee member
-    possible_assignees: List[str] = field(default_factory=list)  # List of members who can be assigned
+    assigned_to: int | None = None  # Member ID of the current assignee
+    possible_assignees: List[int] = field(default_factory=list)  # Member IDs of members who can be assigned
     recurrence_pattern: str = FREQUENCY_DAILY
     recurrence_interval: int = 1 # e.g., every 1 day, every 2 days, etc.
     recurrence_day_of_month: int | None = None # for monthly recurrence on a specific day of the month (1-31, -1 for last day)
@@ -43,51 +149,30 @@ class Chore:
     recurrence_specific_weekdays: List[int] = field(default_factory=list) # for recurrence on specific weekdays (0=Monday, 1=Tuesday, etc.)
     recurrence_annual_month: int | None = None # for annual recurrence on a specific month (1-12)
     recurrence_annual_day: int | None = None # for annual recurrence on a specific day (1-365, -1 for last day of the year)
+    recurrence_setpos: List[int] = field(default_factory=list)  # positions among a month's matching days (BYSETPOS, -1 for last)
+    recurrence_until: date | None = None  # last day the chore may recur on (UNTIL)
+    recurrence_count: int | None = None  # occurrences left after the current due date (COUNT), None for no limit
+    recurrence_exdates: List[date] = field(default_factory=list)  # days the chore skips (EXDATE)
     area_id: str | None = None  # Home Assistant area ID for this chore
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())  # Timestamp when chore was created
-    chore_id: str = field(init=False)  # Unique ID for the chore, generated
+    created_at: datetime = field(default_factory=datetime.now)  # Timestamp when chore was created
+    chore_id: str | None = field(default=None, init=False)  # Storage key, set when the chore is added to storage
+    _recurrence: CompiledRule | None = field(default=None, init=False, repr=False, compare=False)  # Compiled recurrence rule cache
     
     def __post_init__(self):
-        self.chore_id = self._generate_chore_id()
-    
-    def _generate_chore_id(self) -> str:
-        """Generate a unique ID for the chore based on its name, creation time and area_id."""
-        base_id = f"{self.name}_{self.created_at}"
-        if self.area_id:
-            base_id += f"_{self.area_id}"
-        # Use a hash to ensure the ID is a valid format and not too long
-        return str(abs(hash(base_id)))[-6:]  # Use last 6 digits of the hash for uniqueness
+        # Accept ISO strings for callers that still pass them
+        self.last_completed = _parse_date(self.last_completed)
+        self.due_date = _parse_date(self.due_date)
+        self.recurrence_until = _parse_date(self.recurrence_until)
+        self.created_at = _parse_datetime(self.created_at)
     
     def to_dict(self) -> Dict:
-        """Convert the Chore dataclass to a dictionary."""
-        return asdict(self)
+        """Convert the Chore dataclass to a dictionary with ISO date strings."""
+        return _chore_to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict) -> Chore:
         """Create a Chore instance from a dictionary."""
-        recurrence_week_of_month = data.get("recurrence_week_of_month")
-        if isinstance(recurrence_week_of_month, int):
-            recurrence_week_of_month = [recurrence_week_of_month]
-
-        return cls(
-            name=data.get("name", ""),
-            points=data.get("points", 0),
-            status=data.get("status", CHORE_STATE_PENDING),
-            last_completed=data.get("last_completed"),
-            due_date=data.get("due_date"),
-            assignment_mode=data.get("assignment_mode", ASSIGN_MODE_ALWAYS),
-            assigned_to=data.get("assigned_to"),
-            possible_assignees=data.get("possible_assignees", []),
-            recurrence_pattern=data.get("recurrence_pattern", FREQUENCY_DAILY),
-            recurrence_interval=data.get("recurrence_interval", 1),
-            recurrence_day_of_month=data.get("recurrence_day_of_month"),
-            recurrence_week_of_month=recurrence_week_of_month,
-            recurrence_specific_weekdays=data.get("recurrence_specific_weekdays", []),
-            recurrence_annual_month=data.get("recurrence_annual_month"),
-            recurrence_annual_day=data.get("recurrence_annual_day"),
-            area_id=data.get("area_id"),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-        )
+        return cls(**_chore_kwargs_from_dict(data))
     
     def mark_completed(self, member_name: str, storage=None, completion_date: date | None = None) -> None:
         """Mark the chore as completed by a specific member.
@@ -98,9 +183,9 @@ class Chore:
             completion_date: Date of completion (defaults to today)
         """
         if completion_date is None:
-            completion_date = date.today()
+            completion_date = dt_util.now().date()
         
-        self.last_completed = completion_date.isoformat()
+        self.last_completed = completion_date
         
         # Calculate and set due date
         self.schedule_due_date(completion_date)
@@ -143,20 +228,32 @@ class Chore:
         elif self.assignment_mode == ASSIGN_MODE_RANDOM:
             if self.possible_assignees:
                 self.assigned_to = random.choice(self.possible_assignees)
+
+    def iter_assignees(self) -> Iterator[int | None]:
+        """Yield the member ID expected to do each occurrence, starting with the current one.
+
+        Rotating chores take turns starting with the current assignee; all
+        other chores are expected to stay with their current assignee.
+        """
+        assignees = self.possible_assignees
+        if self.assignment_mode == ASSIGN_MODE_ROTATE and self.assigned_to in assignees:
+            index = assignees.index(self.assigned_to)
+            return cycle(assignees[index:] + assignees[:index])
+        return repeat(self.assigned_to)
                 
     def mark_pending(self) -> None:
         """Mark the chore as pending."""
         self.status = CHORE_STATE_PENDING
-        self.due_date = date.today().isoformat()
+        self.due_date = dt_util.now().date()
     
     def mark_overdue(self) -> None:
         """Mark the chore as overdue."""
         self.status = CHORE_STATE_OVERDUE
-        self.due_date = (date.today() - timedelta(days=1)).isoformat()
+        self.due_date = dt_util.now().date() - timedelta(days=1)
     
-    def assign_to_member(self, member_name: str) -> None:
-        """Assign this chore to a specific member."""
-        self.assigned_to = member_name
+    def assign_to_member(self, member_id: int) -> None:
+        """Assign this chore to a specific member by member ID."""
+        self.assigned_to = member_id
         
     def is_overdue(self, current_date: date | None = None) -> bool:
         """Check if the chore is overdue based on due_date."""
@@ -164,13 +261,9 @@ class Chore:
             return False
         
         if current_date is None:
-            current_date = date.today()
+            current_date = dt_util.now().date()
         
-        try:
-            due_date = date.fromisoformat(self.due_date)
-            return current_date > due_date and self.status != CHORE_STATE_COMPLETED
-        except (ValueError, TypeError):
-            return False
+        return current_date > self.due_date and self.status != CHORE_STATE_COMPLETED
     
     def update_overdue_status(self, current_date: date | None = None) -> None:
         """Update the overdue status."""
@@ -180,6 +273,27 @@ class Chore:
             # Was overdue but isn't anymore
             self.mark_pending()
 
+    def update_status_for_date(self, current_date: date | None = None) -> bool:
+        """Set the status implied by the due date on current_date.
+
+        The chore is overdue after its due date, pending on it and completed
+        before it. Returns True if the status changed.
+        """
+        if not self.due_date:
+            return False
+
+        if current_date is None:
+            current_date = dt_util.now().date()
+
+        old_status = self.status
+        if self.due_date < current_date:
+            self.status = CHORE_STATE_OVERDUE
+        elif self.due_date == current_date:
+            self.status = CHORE_STATE_PENDING
+        else:
+            self.status = CHORE_STATE_COMPLETED
+        return self.status != old_status
+
     def schedule_due_date(self, from_date: date | None = None) -> None:
         """Calculate and set the due date based on the recurrence pattern.
         
@@ -187,205 +301,94 @@ class Chore:
             from_date: Date to calculate from (defaults to today)
         """
         if from_date is None:
-            from_date = date.today()
-        
-        if self.recurrence_pattern == FREQUENCY_NONE:
-            # No recurrence, leave due_date as None
-            self.due_date = None
-        elif self.recurrence_pattern == FREQUENCY_DAILY:
-            self._schedule_daily(from_date)
-        elif self.recurrence_pattern == FREQUENCY_INTERVAL_DAYS:
-            self._schedule_interval_days(from_date)
-        elif self.recurrence_pattern == FREQUENCY_SPECIFIC_DAYS:
-            self._schedule_specific_days(from_date)
-        elif self.recurrence_pattern == FREQUENCY_MONTHLY_DAY:
-            self._schedule_monthly_day(from_date)
-        elif self.recurrence_pattern == FREQUENCY_MONTHLY_WEEKDAY:
-            self._schedule_monthly_weekday(from_date)
-        elif self.recurrence_pattern == FREQUENCY_ANNUAL:
-            self._schedule_annual(from_date)
-        else:
-            # Unknown pattern, default to daily
-            self._schedule_daily(from_date)
-    
-    def _schedule_daily(self, from_date: date) -> None:
-        """Schedule due date for daily recurrence."""
-        due_date = from_date + timedelta(days=1)
-        self.due_date = due_date.isoformat()
-    
-    def _schedule_interval_days(self, from_date: date) -> None:
-        """Schedule due date based on interval from the last due date."""
-        # Use last_completed or current due_date as base, or from_date if neither exists
-        if self.last_completed:
-            base_date = date.fromisoformat(self.last_completed)
-        elif self.due_date:
-            try:
-                base_date = date.fromisoformat(self.due_date)
-            except (ValueError, TypeError):
-                base_date = from_date
-        else:
-            base_date = from_date
-        
-        due_date = base_date + timedelta(days=self.recurrence_interval)
-        self.due_date = due_date.isoformat()
-    
-    def _schedule_specific_days(self, from_date: date) -> None:
-        """Schedule due date on specific weekdays."""
-        if not self.recurrence_specific_weekdays:
-            # No weekdays specified, default to tomorrow
-            self.due_date = (from_date + timedelta(days=1)).isoformat()
-            return
-        
-        # Find the next occurrence of any specified weekday
-        current_weekday = from_date.weekday()
-        days_ahead = None
-        
-        # Check next 7 days to find the nearest matching weekday
-        for i in range(1, 8):
-            check_date = from_date + timedelta(days=i)
-            if check_date.weekday() in self.recurrence_specific_weekdays:
-                days_ahead = i
-                break
-        
-        if days_ahead is not None:
-            due_date = from_date + timedelta(days=days_ahead)
-            self.due_date = due_date.isoformat()
-        else:
-            # Fallback: just use tomorrow
-            self.due_date = (from_date + timedelta(days=1)).isoformat()
-    
-    def _schedule_monthly_day(self, from_date: date) -> None:
-        """Schedule due date on a specific day of the month."""
-        if self.recurrence_day_of_month is None:
-            self.due_date = (from_date + timedelta(days=30)).isoformat()
-            return
-
-        target_day = self.recurrence_day_of_month
-        if target_day == 0:
-            target_day = 1
-
-        # First, try this month. If the target date is not in the future, use next month.
-        this_month_due = self._resolve_monthly_day_for_month(from_date.year, from_date.month, target_day)
-        if this_month_due > from_date:
-            self.due_date = this_month_due.isoformat()
-            return
-
-        if from_date.month == 12:
-            next_month = 1
-            next_year = from_date.year + 1
-        else:
-            next_month = from_date.month + 1
-            next_year = from_date.year
-
-        next_month_due = self._resolve_monthly_day_for_month(next_year, next_month, target_day)
-        self.due_date = next_month_due.isoformat()
+            from_date = dt_util.now().date()
+        if self.recurrence_count is not None:
+            if self.recurrence_count <= 0:
+                # The last occurrence was done
+                self.due_date = None
+                return
+            self.recurrence_count -= 1
+        self.due_date = self.next_due_date(from_date)
 
-    def _resolve_monthly_day_for_month(self, year: int, month: int, target_day: int) -> date:
-        """Resolve configured monthly day into a valid date for a specific month."""
-        days_in_month = calendar.monthrange(year, month)[1]
+    @property
+    def recurrence(self) -> CompiledRule:
+        """Return the compiled recurrence rule, compiling it on first use.
 
-        if target_day > 0:
-            day = min(target_day, days_in_month)
-        else:
-            # Negative values count backward from month end: -1 last day, -2 second-last, etc.
-            day = days_in_month + target_day + 1
-            day = max(1, day)
+        The compiled rule is kept until invalidate_recurrence() is called,
+        which storage does whenever a chore is updated.
+        """
+        compiled = self._recurrence
+        if compiled is None:
+            compiled = self._recurrence = compile_rule(self.recurrence_rule())
+        return compiled
 
-        return date(year, month, day)
-    
-    def _schedule_monthly_weekday(self, from_date: date) -> None:
-        """Schedule due date on a specific weekday of a specific week in the month."""
-        if self.recurrence_week_of_month is None or not self.recurrence_specific_weekdays:
-            self.due_date = (from_date + timedelta(days=30)).isoformat()
-            return
+    def invalidate_recurrence(self) -> None:
+        """Drop the compiled recurrence rule after the recurrence settings changed."""
+        self._recurrence = None
 
-        if isinstance(self.recurrence_week_of_month, list):
+    def recurrence_rule(self) -> RecurrenceRule:
+        """Return the recurrence rule described by the recurrence settings."""
+        pattern = self.recurrence_pattern
+        limits = {
+            "until": self.recurrence_until,
+            "exdates": frozenset(self.recurrence_exdates),
+        }
+        if pattern == FREQUENCY_NONE:
+            return RecurrenceRule(None, **limits)
+        if pattern == FREQUENCY_INTERVAL_DAYS:
+            return RecurrenceRule(RRULE_FREQ_DAILY, interval=self.recurrence_interval, **limits)
+        weekdays = tuple(self.recurrence_specific_weekdays)
+        if pattern == FREQUENCY_SPECIFIC_DAYS:
+            return RecurrenceRule(
+                RRULE_FREQ_WEEKLY, byday=tuple((None, weekday) for weekday in weekdays), **limits
+            )
+        if pattern == FREQUENCY_MONTHLY_DAY:
+            month_day = self.recurrence_day_of_month
+            return RecurrenceRule(
+                RRULE_FREQ_MONTHLY,
+                bymonthday=1 if month_day == 0 else month_day,
+                bysetpos=tuple(self.recurrence_setpos),
+                **limits,
+            )
+        if pattern == FREQUENCY_MONTHLY_WEEKDAY:
             weeks = self.recurrence_week_of_month
-        else:
-            weeks = [self.recurrence_week_of_month]
-
-        # Search month-by-month for the first candidate after from_date
-        for month_offset in range(0, 24):
-            month = from_date.month + month_offset
-            year = from_date.year + (month - 1) // 12
-            month = ((month - 1) % 12) + 1
-
-            candidates: List[date] = []
-            for week in weeks:
-                if week is None:
-                    continue
-                for weekday in self.recurrence_specific_weekdays:
-                    candidate = self._resolve_monthly_weekday_for_month(year, month, week, weekday)
-                    if candidate is not None and candidate > from_date:
-                        candidates.append(candidate)
-
-            if candidates:
-                self.due_date = min(candidates).isoformat()
-                return
+            if weeks is None:
+                # Without weeks, positions pick from every matching weekday
+                ordinals = [None] if self.recurrence_setpos else []
+            else:
+                ordinals = [week for week in (weeks if isinstance(weeks, list) else [weeks]) if week is not None]
+            return RecurrenceRule(
+                RRULE_FREQ_MONTHLY,
+                byday=tuple((ordinal, weekday) for ordinal in ordinals for weekday in weekdays),
+                bysetpos=tuple(self.recurrence_setpos),
+                **limits,
+            )
+        if pattern == FREQUENCY_ANNUAL:
+            return RecurrenceRule(
+                RRULE_FREQ_YEARLY,
+                bymonth=self.recurrence_annual_month,
+                bymonthday=self.recurrence_annual_day,
+                **limits,
+            )
+        # Daily, and the default for unknown patterns
+        return RecurrenceRule(RRULE_FREQ_DAILY, **limits)
 
-        self.due_date = (from_date + timedelta(days=30)).isoformat()
-
-    def _resolve_monthly_weekday_for_month(
-        self,
-        year: int,
-        month: int,
-        week_of_month: int,
-        target_weekday: int,
-    ) -> date | None:
-        """Resolve one monthly weekday rule into a date for a specific month."""
-        if target_weekday < 0 or target_weekday > 6:
-            return None
-
-        first_of_month = date(year, month, 1)
-        first_weekday = first_of_month.weekday()
-        days_until_target = (target_weekday - first_weekday) % 7
-        first_occurrence = first_of_month + timedelta(days=days_until_target)
-
-        if week_of_month == -1:
-            current_occurrence = first_occurrence
-            last_occurrence = first_occurrence
-
-            while True:
-                next_occurrence = current_occurrence + timedelta(weeks=1)
-                if next_occurrence.month != month:
-                    break
-                last_occurrence = next_occurrence
-                current_occurrence = next_occurrence
-
-            return last_occurrence
-
-        if week_of_month < 1:
-            return None
-
-        occurrence = first_occurrence + timedelta(weeks=week_of_month - 1)
-        if occurrence.month != month:
-            return None
-
-        return occurrence
-    
-    def _schedule_annual(self, from_date: date) -> None:
-        """Schedule due date annually on a specific date."""
-        if self.recurrence_annual_month is None or self.recurrence_annual_day is None:
-            self.due_date = (from_date + timedelta(days=365)).isoformat()
-            return
+    def next_due_date(self, from_date: date) -> date | None:
+        """Return the due date following from_date, without changing the chore."""
+        if self.recurrence_pattern == FREQUENCY_INTERVAL_DAYS:
+            # Intervals count from the last completion or due date
+            from_date = self.last_completed or self.due_date or from_date
+        return self.recurrence.after(from_date)
 
-        # Find the next valid occurrence strictly after from_date.
-        # This naturally handles Feb 29 by selecting the next leap year.
-        for year in range(from_date.year, from_date.year + 9):
-            try:
-                candidate = date(year, self.recurrence_annual_month, self.recurrence_annual_day)
-            except ValueError:
-                continue
+    def iter_occurrences(self, start: date, end: date | None = None) -> Iterator[date]:
+        """Yield the due dates of this chore from start on, without changing it.
 
-            if candidate > from_date:
-                self.due_date = candidate.isoformat()
-                return
-
-        self.due_date = (from_date + timedelta(days=365)).isoformat()
-    
-    
-        
-        
-        
-        
-        
\ No newline at end of file
+        The first occurrence is the current due date; every following one
+        is the due date the chore gets when completed on the previous one.
+        Occurrences before start are skipped and the iteration stops after
+        end (if given).
+        """
+        if self.due_date is None:
+            return iter(())
+        count = None if self.recurrence_count is None else self.recurrence_count + 1
+        return self.recurrence.iterate(self.due_date, start, end, count)
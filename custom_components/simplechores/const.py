@@ -18,13 +18,30 @@ PLATFORMS = [
     Platform.SELECT,
     Platform.NUMBER,
     Platform.DATE,
+    Platform.CALENDAR,
     ]
 
 # Storage and Versioning
 STORAGE_KEY = "simplechores_storage"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2  # 2: members keyed and referenced by member ID
 DATA_CHORES = "chores"
 DATA_MEMBERS = "members"
+DATA_NEXT_MEMBER_ID = "next_member_id"
+DATA_NEXT_CHORE_ID = "next_chore_id"
+SAVE_DELAY = 10  # in seconds, coalesces bursts of changes into one write
+SAVE_MAX_DELAY = 60  # in seconds, upper bound for how long a change stays unsaved
+DATA_JOURNAL_SEQ = "journal_seq"
+JOURNAL_MAX_RECORDS = 100  # journal records before the snapshot is rewritten
+JOURNAL_SNAPSHOT_INTERVAL = 300  # in seconds, snapshot delay for journaled changes
+
+# Calendar
+CALENDAR_HORIZON_DAYS = 92  # days of chore occurrences expanded ahead
+
+# Journal Operations
+JOURNAL_OP_COMPLETION = "completion"
+JOURNAL_OP_RESCHEDULE = "reschedule"
+JOURNAL_OP_POINTS_OFFSET = "points_offset"
+JOURNAL_OP_RESET = "reset"
 
 # Update Interval
 UPDATE_INTERVAL = 10  # in minutes
@@ -75,6 +92,12 @@ FREQUENCY_SPECIFIC_DAYS = "specific_days"
 FREQUENCY_ANNUAL = "annual_day"
 DEFAULT_RECURRENCE_PATTERN = FREQUENCY_DAILY
 
+# Recurrence rule frequencies (RFC 5545 FREQ values)
+RRULE_FREQ_DAILY = "DAILY"
+RRULE_FREQ_WEEKLY = "WEEKLY"
+RRULE_FREQ_MONTHLY = "MONTHLY"
+RRULE_FREQ_YEARLY = "YEARLY"
+
 # Assignment Modes 
 ASSIGN_MODE_ALWAYS = "always"  # Each member does their own (e.g., clean own desk)
 ASSIGN_MODE_ROTATE = "rotate"  # Take turns doing community task
@@ -113,6 +136,16 @@ SERVICE_RESET_POINTS = "reset_points"
 SERVICE_TOGGLE_CHORE = "toggle_chore"
 SERVICE_UPDATE_CHORES = "update_chores"
 SERVICE_RESCHEDULE_CHORE = "reschedule_chore"
+SERVICE_COMPLETE_CHORES = "complete_chores"
+SERVICE_QUERY_CHORES = "query_chores"
+SERVICE_FORECAST = "forecast"
+SERVICE_RECOMPUTE_SCHEDULE = "recompute_schedule"
+
+# Per-chore results in the complete_chores service response
+CHORE_RESULT_COMPLETED = "completed"
+CHORE_RESULT_ALREADY_COMPLETED = "already_completed"
+CHORE_RESULT_NOT_FOUND = "not_found"
+CHORE_RESULT_MEMBER_NOT_FOUND = "member_not_found"
 
 # Chore tracker and point tracker Period Types
 TRACKER_PERIOD_TODAY = "today"
@@ -132,6 +165,7 @@ KEY_LAST_RESET_THIS_YEAR = "last_reset_this_year"
 
 # Member Data Field Keys
 MEMBER_FIELD_NAME = "name"
+MEMBER_FIELD_ID = "member_id"
 MEMBER_FIELD_POINTS_TODAY = "points_earned_today"
 MEMBER_FIELD_POINTS_THIS_WEEK = "points_earned_this_week"
 MEMBER_FIELD_POINTS_THIS_MONTH = "points_earned_this_month"
@@ -142,6 +176,7 @@ MEMBER_FIELD_CHORES_THIS_MONTH = "chores_completed_this_month"
 MEMBER_FIELD_CHORES_THIS_YEAR = "chores_completed_this_year"
 MEMBER_FIELD_PENDING_CHORES = "n_chores_pending"
 MEMBER_FIELD_OVERDUE_CHORES = "n_chores_overdue"
+MEMBER_FIELD_PERIOD_KEYS = "period_keys"
 
 # Field name prefixes
 MEMBER_FIELD_PREFIX_POINTS = "points_earned"
@@ -152,4 +187,7 @@ STORAGE_KEY_PREFIX_LAST_RESET = "last_reset"
 
 # Chore data field keys
 CHORE_FIELD_ASSIGNED_TO = "assigned_to"
-CHORE_FIELD_STATUS = "status"
\ No newline at end of file
+CHORE_FIELD_POSSIBLE_ASSIGNEES = "possible_assignees"
+CHORE_FIELD_STATUS = "status"
+CHORE_FIELD_AREA_ID = "area_id"
+CHORE_FIELD_DUE_DATE = "due_date"
@@ -1,129 +1,218 @@
 # coordinator.py
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     LOGGER,
-    TRACKER_PERIOD_TODAY,
-    TRACKER_PERIOD_THIS_WEEK,
-    TRACKER_PERIOD_THIS_MONTH,
-    TRACKER_PERIOD_THIS_YEAR,
-    DEFAULT_WEEK_START_DAY,
+    DEVICE_MANUFACTURER,
+    DEVICE_MODEL_CHORE,
+    DEVICE_SW_VERSION,
 )
+from .snapshot import SimpleChoresSnapshot, build_snapshot, update_snapshot
+
+# Keys entities subscribe to with async_add_key_listener
+KEY_CHORE = "chore"
+KEY_MEMBER = "member"
+
+# Creates a platform's entities for a chore from its ID and name
+ChoreEntityFactory = Callable[[str, str], List[Entity]]
+
 
 class SimpleChoresCoordinator(DataUpdateCoordinator):
-    """Coordinator for SimpleChores."""
+    """Coordinator for SimpleChores.
+
+    A refresh (or ``async_update_from_storage``) rebuilds the snapshot and
+    updates every entity. Changes to a few chores or members are published
+    with ``async_publish_changes`` instead, which only recomputes those
+    entries and only updates the entities subscribed to their keys.
+
+    Platforms with chore entities register an entity factory together with
+    their ``async_add_entities`` callback, so entities of a single chore can
+    be added or removed at runtime without reloading the config entry.
+    """
 
     def __init__(self, hass, storage_manager):
         super().__init__(
             hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(hours=1),  # Hourly backup check for period resets
+            # No polling: the scheduler refreshes at period boundaries
+            update_interval=None,
         )
 
         self.storage = storage_manager
-        self.data = None  # will hold chores + members
+        self.data: SimpleChoresSnapshot | None = None
+        self._key_listeners: Dict[Tuple[str, str | int], List[Callable[[], None]]] = {}
+        self._chore_platforms: List[Tuple[ChoreEntityFactory, AddEntitiesCallback]] = []
+        self._chore_entities: Dict[str, List[Entity]] = {}
 
     async def async_refresh_data(self):
         """Manually trigger a data refresh."""
         await self.async_request_refresh()
 
-    async def _async_update_data(self):
-        """Fetch latest data and handle period resets."""
+    @callback
+    def async_update_from_storage(self) -> None:
+        """Publish a new snapshot of the storage right away."""
+        self.async_set_updated_data(self._build_snapshot())
+
+    @callback
+    def async_add_key_listener(
+        self, key: Tuple[str, str | int], update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for published changes of one chore or member.
+
+        The key is (KEY_CHORE, chore_id) or (KEY_MEMBER, member_id).
+        """
+        self._key_listeners.setdefault(key, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners = self._key_listeners[key]
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._key_listeners[key]
+
+        return remove_listener
+
+    @callback
+    def async_publish_changes(
+        self,
+        chore_ids: Iterable[str] = (),
+        member_names: Iterable[str] = (),
+    ) -> None:
+        """Publish changed chores and members to the entities subscribed to them.
+
+        The members a changed chore was or is now assigned to are included
+        automatically, since their sensors count the chore.
+        """
+        today = dt_util.now().date()
+        if self.data is None or self.data.today != today:
+            # Day-bound values changed for everyone
+            self.async_update_from_storage()
+            return
+
+        chore_ids = set(chore_ids)
+        member_names = set(member_names)
+        for chore_id in chore_ids:
+            if (chore := self.data.chores.get(chore_id)) is not None and chore.assigned_to:
+                member_names.add(chore.assigned_to)
+            if (chore := self.storage.get_chore(chore_id)) is not None:
+                if (name := self.storage.get_member_name(chore.assigned_to)) is not None:
+                    member_names.add(name)
+
+        self.data = update_snapshot(self.data, self.storage, chore_ids, member_names)
+
+        keys = [(KEY_CHORE, chore_id) for chore_id in chore_ids]
+        for name in member_names:
+            # Names of removed members and old names of renamed ones map to no one
+            if (member_id := self.storage.get_member_id(name)) is not None:
+                keys.append((KEY_MEMBER, member_id))
+        for key in keys:
+            for update_callback in list(self._key_listeners.get(key, ())):
+                update_callback()
+
+    @callback
+    def async_add_chore_platform(
+        self,
+        factory: ChoreEntityFactory,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Register a platform's chore entity factory and add entities for all chores."""
+        self._chore_platforms.append((factory, async_add_entities))
+        entities = []
+        for chore_id, chore in self.storage.get_chores().items():
+            new_entities = factory(chore_id, chore.name)
+            self._chore_entities.setdefault(chore_id, []).extend(new_entities)
+            entities.extend(new_entities)
+        async_add_entities(entities)
+
+    @callback
+    def async_add_chore_entities(self, chore_id: str) -> None:
+        """Register the device of a new chore and add its entities on every platform."""
+        chore = self.storage.get_chore(chore_id)
+        if chore is None:
+            return
+        if self.config_entry is not None:
+            async_register_chore_device(self.hass, self.config_entry.entry_id, chore_id, chore)
+
+        # Entities read the snapshot as soon as they are added
+        self.async_publish_changes(chore_ids=[chore_id])
+        for factory, async_add_entities in self._chore_platforms:
+            new_entities = factory(chore_id, chore.name)
+            self._chore_entities.setdefault(chore_id, []).extend(new_entities)
+            async_add_entities(new_entities)
+        LOGGER.debug(f"Added entities for chore '{chore.name}'")
+
+    async def async_remove_chore_entities(
+        self, chore_id: str, remove_device: bool = True, publish: bool = True
+    ) -> None:
+        """Remove the entities of a chore and, by default, its device.
+
+        Removing the device also removes the chore's entity registry entries.
+        Callers removing many chores pass publish=False and publish the
+        whole change set once.
+        """
+        for entity in self._chore_entities.pop(chore_id, []):
+            if entity.hass is not None:
+                # Deleted chores drop their states; edited ones are re-added right away
+                await entity.async_remove(force_remove=remove_device)
+
+        if remove_device:
+            device_reg = dr.async_get(self.hass)
+            device = device_reg.async_get_device(identifiers={(DOMAIN, f"chore_{chore_id}")})
+            if device:
+                device_reg.async_remove_device(device.id)
+
+        if publish:
+            self.async_publish_changes(chore_ids=[chore_id])
+
+    async def async_reload_chore_entities(self, chore_id: str) -> None:
+        """Recreate the entities of an edited chore, keeping its device."""
+        await self.async_remove_chore_entities(chore_id, remove_device=False)
+        self.async_add_chore_entities(chore_id)
+
+    def _build_snapshot(self) -> SimpleChoresSnapshot:
+        """Compute the snapshot the entities read from."""
+        return build_snapshot(self.storage, dt_util.now().date())
+
+    async def _async_update_data(self) -> SimpleChoresSnapshot:
+        """Compute a fresh snapshot.
+
+        Member counters roll over lazily (see Member), so a refresh at a
+        period boundary only has to update the entities.
+        """
         try:
-            # Check and handle period resets
-            await self._check_and_reset_periods()
-            
-            # later: compute overdue, next due, assignments, etc.
-            return self.storage.data
+            return self._build_snapshot()
         except Exception as err:
             raise UpdateFailed(f"Error updating SimpleChores: {err}")
 
-    async def _check_and_reset_periods(self):
-        """Check if any period boundaries have been crossed and reset counters."""
-        now = datetime.now()
-        save_needed = False
-
-        # Check daily reset (midnight)
-        if self._should_reset_daily(now):
-            self.storage.reset_period_counters(TRACKER_PERIOD_TODAY)
-            self.storage.set_last_reset(TRACKER_PERIOD_TODAY, now.date().isoformat())
-            save_needed = True
-            LOGGER.debug("Reset daily counters")
-
-        # Check weekly reset (start of week)
-        if self._should_reset_weekly(now):
-            self.storage.reset_period_counters(TRACKER_PERIOD_THIS_WEEK)
-            self.storage.set_last_reset(TRACKER_PERIOD_THIS_WEEK, now.date().isoformat())
-            save_needed = True
-            LOGGER.debug("Reset weekly counters")
-
-        # Check monthly reset (1st of month)
-        if self._should_reset_monthly(now):
-            self.storage.reset_period_counters(TRACKER_PERIOD_THIS_MONTH)
-            self.storage.set_last_reset(TRACKER_PERIOD_THIS_MONTH, now.date().isoformat())
-            save_needed = True
-            LOGGER.debug("Reset monthly counters")
-
-        # Check yearly reset (January 1st)
-        if self._should_reset_yearly(now):
-            self.storage.reset_period_counters(TRACKER_PERIOD_THIS_YEAR)
-            self.storage.set_last_reset(TRACKER_PERIOD_THIS_YEAR, now.date().isoformat())
-            save_needed = True
-            LOGGER.debug("Reset yearly counters")
-
-        if save_needed:
-            await self.storage.async_save()
-
-    def _should_reset_daily(self, now: datetime) -> bool:
-        """Check if daily counters should be reset."""
-        last_reset = self.storage.get_last_reset(TRACKER_PERIOD_TODAY)
-        if not last_reset:
-            return True  # First run, initialize
-        
-        last_reset_date = datetime.fromisoformat(last_reset).date()
-        return now.date() > last_reset_date
-
-    def _should_reset_weekly(self, now: datetime) -> bool:
-        """Check if weekly counters should be reset."""
-        last_reset = self.storage.get_last_reset(TRACKER_PERIOD_THIS_WEEK)
-        if not last_reset:
-            return True  # First run, initialize
-        
-        last_reset_date = datetime.fromisoformat(last_reset).date()
-        
-        # Get start of current week (Monday by default)
-        current_week_start = now.date() - timedelta(days=now.weekday() - DEFAULT_WEEK_START_DAY)
-        if now.weekday() < DEFAULT_WEEK_START_DAY:
-            current_week_start -= timedelta(days=7)
-        
-        return last_reset_date < current_week_start
-
-    def _should_reset_monthly(self, now: datetime) -> bool:
-        """Check if monthly counters should be reset."""
-        last_reset = self.storage.get_last_reset(TRACKER_PERIOD_THIS_MONTH)
-        if not last_reset:
-            return True  # First run, initialize
-        
-        last_reset_date = datetime.fromisoformat(last_reset).date()
-        
-        # Check if we've entered a new month
-        return (now.year, now.month) > (last_reset_date.year, last_reset_date.month)
-
-    def _should_reset_yearly(self, now: datetime) -> bool:
-        """Check if yearly counters should be reset."""
-        last_reset = self.storage.get_last_reset(TRACKER_PERIOD_THIS_YEAR)
-        if not last_reset:
-            return True  # First run, initialize
-        
-        last_reset_date = datetime.fromisoformat(last_reset).date()
-        
-        # Check if we've entered a new year
-        return now.year > last_reset_date.year
+
+@callback
+def async_register_chore_device(hass: HomeAssistant, entry_id: str, chore_id: str, chore) -> dr.DeviceEntry:
+    """Get or create the device of a chore and assign it to the chore's area."""
+    device_reg = dr.async_get(hass)
+    device = device_reg.async_get_or_create(
+        config_entry_id=entry_id,
+        identifiers={(DOMAIN, f"chore_{chore_id}")},
+        name=chore.name,
+        manufacturer=DEVICE_MANUFACTURER,
+        model=DEVICE_MODEL_CHORE,
+        sw_version=DEVICE_SW_VERSION,
+    )
+
+    # Assign to area if specified
+    if chore.area_id:
+        device = device_reg.async_update_device(device.id, area_id=chore.area_id)
+    return device
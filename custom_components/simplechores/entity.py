@@ -0,0 +1,200 @@
+"""Base entities for SimpleChores."""
+from __future__ import annotations
+
+from typing import Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    DOMAIN,
+    DEVICE_MANUFACTURER,
+    DEVICE_MODEL_CHORE,
+    DEVICE_MODEL_MEMBER,
+    DEVICE_SW_VERSION,
+)
+from .coordinator import KEY_CHORE, KEY_MEMBER, SimpleChoresCoordinator
+
+
+class SimpleChoresDeviceEntity(CoordinatorEntity):
+    """Base class for entities that belong to a chore or member device.
+
+    The device ID shown in the attributes is looked up once and cached;
+    it is looked up again after a device is created or removed.
+    """
+
+    _device_identifier: Tuple[str, str]
+
+    def __init__(self, coordinator: SimpleChoresCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device_id: str | None = None
+        self._device_id_valid = False
+
+    async def async_added_to_hass(self) -> None:
+        """Resolve the device ID and follow device registry changes."""
+        await super().async_added_to_hass()
+        self._device_id = self._lookup_device_id()
+        self._device_id_valid = True
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._async_device_added_or_removed,
+                event_filter=_device_added_or_removed,
+                run_immediately=True,
+            )
+        )
+
+    @callback
+    def _async_device_added_or_removed(self, event: Event) -> None:
+        """Invalidate the cached device ID."""
+        self._device_id_valid = False
+
+    def _lookup_device_id(self) -> str | None:
+        """Look the device ID up in the device registry."""
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={self._device_identifier}
+        )
+        if device:
+            return device.id
+        return None
+
+    def _get_device_id(self) -> str | None:
+        """Get the device_id for this entity's device."""
+        if not self._device_id_valid:
+            self._device_id = self._lookup_device_id()
+            self._device_id_valid = True
+        return self._device_id
+
+
+@callback
+def _device_added_or_removed(event: Event) -> bool:
+    """Return True for registry events that can change a device lookup."""
+    return event.data["action"] in ("create", "remove")
+
+
+class SimpleChoresChoreEntity(SimpleChoresDeviceEntity):
+    """Base class for entities that belong to a chore.
+
+    Besides full coordinator refreshes, the entity is updated when changes
+    to its chore are published with ``async_publish_changes``. Its
+    DeviceInfo is rebuilt only when the chore's status or assignee changes.
+    """
+
+    def __init__(
+        self,
+        coordinator: SimpleChoresCoordinator,
+        entry: ConfigEntry,
+        chore_id: str,
+        chore_name: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.chore_id = chore_id
+        self.chore_name = chore_name
+        self._entry = entry
+        self._attr_has_entity_name = True
+        self._device_identifier = (DOMAIN, f"chore_{chore_id}")
+        self._device_info_key: Tuple[str | None, str | None] | None = None
+        self._device_info: DeviceInfo | None = None
+        self._related_entity_ids = {
+            "status": f"select.{chore_id}_status",
+            "assigned_to": f"select.{chore_id}_assigned_to",
+            "mark_completed_by": f"select.{chore_id}_mark_completed_by",
+            "points": f"number.{chore_id}_points",
+            "due_date": f"date.{chore_id}_due_date",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to published changes of the chore."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener(
+                (KEY_CHORE, self.chore_id), self._handle_coordinator_update
+            )
+        )
+
+    def _get_related_entity_ids(self) -> dict[str, str]:
+        """Get all related entity IDs for this chore."""
+        return self._related_entity_ids
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information about this chore."""
+        chore = self.coordinator.data.chores.get(self.chore_id)
+        key = (chore.status, chore.assigned_to) if chore else (None, None)
+        if self._device_info is None or key != self._device_info_key:
+            self._device_info_key = key
+            self._device_info = self._build_device_info(*key)
+        return self._device_info
+
+    def _build_device_info(self, status: str | None, assigned_to: str | None) -> DeviceInfo:
+        """Build the DeviceInfo showing the chore's status and assignee."""
+        if status:
+            hw_info = f"{status.capitalize()}"
+            if assigned_to:
+                hw_info += f" • Assigned to {assigned_to}"
+        else:
+            hw_info = "Unknown"
+
+        return DeviceInfo(
+            identifiers={self._device_identifier},
+            name=self.chore_name,
+            manufacturer=DEVICE_MANUFACTURER,
+            model=DEVICE_MODEL_CHORE,
+            sw_version=DEVICE_SW_VERSION,
+            hw_version=hw_info,
+            suggested_area="Chores",
+        )
+
+
+class SimpleChoresMemberEntity(SimpleChoresDeviceEntity):
+    """Base class for entities that belong to a household member.
+
+    Besides full coordinator refreshes, the entity is updated when changes
+    to its member are published with ``async_publish_changes``. The entity
+    and its device are keyed by the member ID, so renaming a member keeps
+    them; the name is looked up from storage.
+    """
+
+    def __init__(
+        self,
+        coordinator: SimpleChoresCoordinator,
+        entry: ConfigEntry,
+        member_id: int,
+        member_name: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.member_id = member_id
+        self._member_name = member_name
+        self._entry = entry
+        self._attr_has_entity_name = True
+        self._device_identifier = (DOMAIN, f"member_{member_id}")
+        self._attr_device_info = DeviceInfo(
+            identifiers={self._device_identifier},
+            name=member_name,
+            manufacturer=DEVICE_MANUFACTURER,
+            model=DEVICE_MODEL_MEMBER,
+            sw_version=DEVICE_SW_VERSION,
+        )
+
+    @property
+    def member_name(self) -> str:
+        """Return the current name of the member."""
+        name = self.coordinator.storage.get_member_name(self.member_id)
+        if name is not None:
+            self._member_name = name
+        return self._member_name
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to published changes of the member."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener(
+                (KEY_MEMBER, self.member_id), self._handle_coordinator_update
+            )
+        )
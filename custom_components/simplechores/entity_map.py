@@ -0,0 +1,96 @@
+"""Map chore entities to chore IDs for SimpleChores."""
+from __future__ import annotations
+
+from typing import Dict
+
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import DOMAIN
+
+# Platforms with chore entities, and the unique ID suffixes they use
+CHORE_ENTITY_PLATFORMS = (Platform.SELECT, Platform.NUMBER, Platform.DATE)
+CHORE_ENTITY_SUFFIXES = ("status", "assigned_to", "mark_completed_by", "points", "due_date")
+
+_UNIQUE_ID_PREFIX = f"{DOMAIN}_"
+_DEVICE_ID_PREFIX = "chore_"
+
+
+def chore_id_from_unique_id(unique_id: str) -> str | None:
+    """Return the chore ID encoded in a chore entity's unique ID."""
+    if not unique_id.startswith(_UNIQUE_ID_PREFIX):
+        return None
+    for suffix in CHORE_ENTITY_SUFFIXES:
+        if unique_id.endswith(f"_{suffix}"):
+            return unique_id[len(_UNIQUE_ID_PREFIX):-len(suffix) - 1] or None
+    return None
+
+
+class ChoreEntityMap:
+    """Resolve entity IDs, unique IDs and device IDs to chore IDs.
+
+    The entity map is built once from the entity registry and then follows
+    registry updates, so lookups neither scan the registry nor depend on
+    entity states being available.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self.entry_id = entry_id
+        self._chore_ids: Dict[str, str] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Build the map from the entity registry and follow its updates."""
+        entity_reg = er.async_get(self.hass)
+        for entry in er.async_entries_for_config_entry(entity_reg, self.entry_id):
+            self._add(entry)
+        self._unsub = self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            run_immediately=True,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the entity registry."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    def chore_id_for_entity(self, entity_id: str) -> str | None:
+        """Return the chore ID of a chore entity."""
+        return self._chore_ids.get(entity_id)
+
+    def chore_id_for_device(self, device_id: str) -> str | None:
+        """Return the chore ID of a chore device."""
+        device = dr.async_get(self.hass).async_get(device_id)
+        if device is None:
+            return None
+        for domain, identifier in device.identifiers:
+            if domain == DOMAIN and identifier.startswith(_DEVICE_ID_PREFIX):
+                return identifier[len(_DEVICE_ID_PREFIX):]
+        return None
+
+    def _add(self, entry: er.RegistryEntry) -> None:
+        """Map a registry entry if it is one of our chore entities."""
+        if entry.config_entry_id != self.entry_id or entry.domain not in CHORE_ENTITY_PLATFORMS:
+            return
+        if (chore_id := chore_id_from_unique_id(entry.unique_id)) is not None:
+            self._chore_ids[entry.entity_id] = chore_id
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Keep the map in sync with created, renamed and removed entities."""
+        action = event.data["action"]
+        entity_id = event.data["entity_id"]
+        if action == "remove":
+            self._chore_ids.pop(entity_id, None)
+            return
+
+        if old_entity_id := event.data.get("old_entity_id"):
+            self._chore_ids.pop(old_entity_id, None)
+        if entry := er.async_get(self.hass).async_get(entity_id):
+            self._add(entry)
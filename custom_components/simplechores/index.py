@@ -0,0 +1,199 @@
+"""Secondary indexes over chores for SimpleChores."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+from .chore import Chore
+from .const import (
+    CHORE_FIELD_ASSIGNED_TO,
+    CHORE_FIELD_STATUS,
+    CHORE_FIELD_AREA_ID,
+    CHORE_FIELD_DUE_DATE,
+)
+
+# Fields that get their own index, in the order of a chore's index key
+INDEXED_FIELDS = (
+    CHORE_FIELD_ASSIGNED_TO,
+    CHORE_FIELD_STATUS,
+    CHORE_FIELD_AREA_ID,
+    CHORE_FIELD_DUE_DATE,
+)
+
+_EMPTY: Set[str] = frozenset()
+
+
+class ChoreIndex:
+    """Map indexed chore field values to the IDs of the chores having them.
+
+    Chores are mutated in place, so the index remembers the key each chore
+    was filed under and moves it only when the storage manager reports a
+    change. ``(assigned_to, status)`` is indexed as a pair as well (by
+    member ID), because that is what the per-member sensors count. Due
+    dates are also bucketed by day ordinal, so the chores due on given days
+    can be found without parsing any dates.
+    """
+
+    def __init__(self) -> None:
+        self._keys: Dict[str, Tuple] = {}
+        self._by_field: Dict[str, Dict[object, Set[str]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        self._by_assignee_status: Dict[Tuple[int | None, str], Set[str]] = {}
+        self._by_due_day: Dict[int, Set[str]] = {}
+
+    @staticmethod
+    def _key(chore: Chore) -> Tuple:
+        """Return the tuple of indexed field values of a chore."""
+        return tuple(getattr(chore, field) for field in INDEXED_FIELDS)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._keys.clear()
+        for index in self._by_field.values():
+            index.clear()
+        self._by_assignee_status.clear()
+        self._by_due_day.clear()
+
+    def add(self, chore_id: str, chore: Chore) -> None:
+        """Index a chore, moving it if its indexed fields changed."""
+        key = self._key(chore)
+        old_key = self._keys.get(chore_id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self._unlink(chore_id, old_key)
+        self._keys[chore_id] = key
+        for field, value in zip(INDEXED_FIELDS, key):
+            self._by_field[field].setdefault(value, set()).add(chore_id)
+        self._by_assignee_status.setdefault(key[:2], set()).add(chore_id)
+        if (day := _due_day(key[3])) is not None:
+            self._by_due_day.setdefault(day, set()).add(chore_id)
+
+    def remove(self, chore_id: str) -> None:
+        """Remove a chore from the index."""
+        old_key = self._keys.pop(chore_id, None)
+        if old_key is not None:
+            self._unlink(chore_id, old_key)
+
+    def _unlink(self, chore_id: str, key: Tuple) -> None:
+        """Remove a chore from the buckets of a key."""
+        for field, value in zip(INDEXED_FIELDS, key):
+            _discard(self._by_field[field], value, chore_id)
+        _discard(self._by_assignee_status, key[:2], chore_id)
+        if (day := _due_day(key[3])) is not None:
+            _discard(self._by_due_day, day, chore_id)
+
+    def lookup(self, field: str, value: object) -> Set[str]:
+        """Return the IDs of the chores whose field equals value.
+
+        The returned set is the index's own; do not modify it.
+        """
+        return self._by_field[field].get(value, _EMPTY)
+
+    def lookup_assigned(self, member_id: int | None, status: str) -> Set[str]:
+        """Return the IDs of the chores assigned to a member ID with a status."""
+        return self._by_assignee_status.get((member_id, status), _EMPTY)
+
+    def lookup_range(self, field: str, start: object = None, end: object = None) -> Set[str]:
+        """Return the IDs of the chores whose field lies within [start, end].
+
+        Either bound may be None for an open range; chores without a value
+        never match. Only the distinct values are compared, so this scales
+        with the number of buckets rather than with the number of chores.
+        """
+        chore_ids: Set[str] = set()
+        for value, bucket in self._by_field[field].items():
+            if value is None:
+                continue
+            if (start is None or value >= start) and (end is None or value <= end):
+                chore_ids.update(bucket)
+        return chore_ids
+
+    def lookup_due_days(self, first_day: int, last_day: int) -> Set[str]:
+        """Return the IDs of the chores due between two day ordinals (inclusive)."""
+        days: Iterable[int]
+        if last_day - first_day < len(self._by_due_day):
+            days = range(first_day, last_day + 1)
+        else:
+            days = [day for day in self._by_due_day if first_day <= day <= last_day]
+        chore_ids: Set[str] = set()
+        for day in days:
+            chore_ids.update(self._by_due_day.get(day, _EMPTY))
+        return chore_ids
+
+
+class OccurrenceIndex:
+    """Sorted index of the expanded occurrences of all chores up to a horizon.
+
+    Each chore is expanded once into ``(day, chore_id, member_id)`` entries,
+    kept sorted by day, so a date range is answered with two bisections.
+    ``set_chore`` re-expands a single changed chore. An overdue chore shows
+    on its due date, on today as it is still to be done, and then from the
+    day after today on, since that is when it recurs once it has been done.
+    """
+
+    def __init__(self) -> None:
+        self.today: date | None = None
+        self.until: date | None = None
+        self._entries: List[Tuple[date, str, int | None]] = []
+        self._days: Dict[str, List[date]] = {}
+
+    def rebuild(self, chores: Mapping[str, Chore], today: date, until: date) -> None:
+        """Expand all chores for the days up to until."""
+        self.today = today
+        self.until = until
+        self._days.clear()
+        entries = []
+        for chore_id, chore in chores.items():
+            occurrences = self._expand(chore)
+            self._days[chore_id] = [day for day, _ in occurrences]
+            entries.extend((day, chore_id, member_id) for day, member_id in occurrences)
+        entries.sort()
+        self._entries = entries
+
+    def set_chore(self, chore_id: str, chore: Chore | None) -> None:
+        """Replace the occurrences of a chore, or drop them if it was deleted."""
+        for day in self._days.pop(chore_id, ()):
+            del self._entries[bisect_left(self._entries, (day, chore_id))]
+        if chore is None or self.until is None:
+            return
+        occurrences = self._expand(chore)
+        self._days[chore_id] = [day for day, _ in occurrences]
+        for day, member_id in occurrences:
+            insort(self._entries, (day, chore_id, member_id))
+
+    def lookup(self, first_day: date, last_day: date) -> List[Tuple[date, str, int | None]]:
+        """Return the occurrences between two days (inclusive), sorted by day."""
+        start = bisect_left(self._entries, (first_day,))
+        end = bisect_left(self._entries, (last_day + timedelta(days=1),))
+        return self._entries[start:end]
+
+    def _expand(self, chore: Chore) -> List[Tuple[date, int | None]]:
+        """Return the occurrences of a chore up to the horizon with their assignees."""
+        due = chore.due_date
+        if due is None or due > self.until:
+            return []
+        assignees = chore.iter_assignees()
+        assignee = next(assignees)
+        occurrences = [(due, assignee)]
+        if due < self.today:
+            occurrences.append((self.today, assignee))
+        following = chore.iter_occurrences(max(due, self.today) + timedelta(days=1), self.until)
+        occurrences.extend(zip(following, assignees))
+        return occurrences
+
+
+def _due_day(due_date: date | None) -> int | None:
+    """Return the day ordinal of a due date, or None if it has none."""
+    return due_date.toordinal() if due_date is not None else None
+
+
+def _discard(index: Dict, value: object, chore_id: str) -> None:
+    """Remove a chore ID from a bucket, dropping the bucket once empty."""
+    bucket = index.get(value)
+    if bucket is not None:
+        bucket.discard(chore_id)
+        if not bucket:
+            del index[value]
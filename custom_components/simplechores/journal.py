@@ -0,0 +1,122 @@
+"""Append-only mutation journal for SimpleChores."""
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Dict, List
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN, LOGGER
+
+
+def journal_path(hass: HomeAssistant) -> str:
+    """Return the path of the journal file next to the storage file."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.journal")
+
+
+class SimpleChoresJournal:
+    """Append-only journal of storage mutations.
+
+    Each record is one JSON line with a sequence number, the operation name
+    and the post-image of every chore and member the operation changed
+    (``None`` for a deleted record). Appending costs O(1) in the size of the
+    store; the snapshot written by the storage manager remembers the last
+    sequence number it contains, so replay only applies the tail.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.path = journal_path(hass)
+        self.seq = 0
+        self._lock = threading.Lock()
+
+    async def async_load(self) -> List[Dict[str, Any]]:
+        """Read all records from disk, ordered by sequence number."""
+        records = await self.hass.async_add_executor_job(self._read)
+        records.sort(key=lambda record: record["seq"])
+        if records:
+            self.seq = max(self.seq, records[-1]["seq"])
+        return records
+
+    async def async_append(self, operation: str, **record: Any) -> Dict[str, Any]:
+        """Append a record for an operation and return it."""
+        self.seq += 1
+        record = {
+            "seq": self.seq,
+            "op": operation,
+            "ts": dt_util.utcnow().isoformat(),
+            **record,
+        }
+        await self.hass.async_add_executor_job(self._append, json_dumps(record))
+        return record
+
+    async def async_compact(self, upto_seq: int) -> int:
+        """Drop records already contained in a snapshot; return how many remain."""
+        return await self.hass.async_add_executor_job(self._compact, upto_seq)
+
+    async def async_remove(self) -> None:
+        """Remove the journal file."""
+        await self.hass.async_add_executor_job(self._remove)
+
+    def _read(self) -> List[Dict[str, Any]]:
+        """Read records, stopping at a truncated trailing line."""
+        records: List[Dict[str, Any]] = []
+        with self._lock:
+            try:
+                with open(self.path, encoding="utf-8") as journal_file:
+                    for line in journal_file:
+                        try:
+                            records.append(json_loads(line))
+                        except ValueError:
+                            LOGGER.warning("Ignoring incomplete record at the end of the journal")
+                            break
+            except FileNotFoundError:
+                pass
+        return records
+
+    def _append(self, line: str) -> None:
+        """Append one line and make sure it reached the disk."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as journal_file:
+                journal_file.write(line + "\n")
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+    def _compact(self, upto_seq: int) -> int:
+        """Rewrite the journal without the records up to upto_seq."""
+        with self._lock:
+            try:
+                with open(self.path, encoding="utf-8") as journal_file:
+                    lines = journal_file.readlines()
+            except FileNotFoundError:
+                return 0
+
+            kept = []
+            for line in lines:
+                try:
+                    if json_loads(line)["seq"] > upto_seq:
+                        kept.append(line)
+                except ValueError:
+                    break
+
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as journal_file:
+                journal_file.writelines(kept)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+            os.replace(temp_path, self.path)
+            return len(kept)
+
+    def _remove(self) -> None:
+        """Delete the journal file if it exists."""
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
@@ -1,15 +1,20 @@
 """Member class for SimpleChores."""
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict
+
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    MEMBER_FIELD_NAME,
+    MEMBER_FIELD_ID,
     TRACKER_PERIOD_TODAY,
     TRACKER_PERIOD_THIS_WEEK,
     TRACKER_PERIOD_THIS_MONTH,
     TRACKER_PERIOD_THIS_YEAR,
-    MEMBER_FIELD_NAME,
+    DEFAULT_WEEK_START_DAY,
     MEMBER_FIELD_POINTS_TODAY,
     MEMBER_FIELD_POINTS_THIS_WEEK,
     MEMBER_FIELD_POINTS_THIS_MONTH,
@@ -20,16 +25,71 @@ from .const import (
     MEMBER_FIELD_CHORES_THIS_YEAR,
     MEMBER_FIELD_PENDING_CHORES,
     MEMBER_FIELD_OVERDUE_CHORES,
+    MEMBER_FIELD_PERIOD_KEYS,
     MEMBER_FIELD_PREFIX_POINTS,
     MEMBER_FIELD_PREFIX_CHORES,
 )
+from .serializer import StoredField, compile_from_dict, compile_to_dict
+
+TRACKER_PERIODS = (
+    TRACKER_PERIOD_TODAY,
+    TRACKER_PERIOD_THIS_WEEK,
+    TRACKER_PERIOD_THIS_MONTH,
+    TRACKER_PERIOD_THIS_YEAR,
+)
+
+
+def period_key(period: str, day: date) -> str:
+    """Return the key of the period containing day (e.g. "2025-06" for a month)."""
+    if period == TRACKER_PERIOD_TODAY:
+        return day.isoformat()
+    if period == TRACKER_PERIOD_THIS_WEEK:
+        week_start = day - timedelta(days=(day.weekday() - DEFAULT_WEEK_START_DAY) % 7)
+        return week_start.isoformat()
+    if period == TRACKER_PERIOD_THIS_MONTH:
+        return f"{day.year:04d}-{day.month:02d}"
+    return f"{day.year:04d}"
+
+
+# Stored fields of a member; the member ID is also the dictionary key in storage
+MEMBER_FIELDS = (
+    StoredField(MEMBER_FIELD_NAME, default=""),
+    StoredField(MEMBER_FIELD_ID, default=0),
+    StoredField(MEMBER_FIELD_POINTS_TODAY, default=0),
+    StoredField(MEMBER_FIELD_POINTS_THIS_WEEK, default=0),
+    StoredField(MEMBER_FIELD_POINTS_THIS_MONTH, default=0),
+    StoredField(MEMBER_FIELD_POINTS_THIS_YEAR, default=0),
+    StoredField(MEMBER_FIELD_CHORES_TODAY, default=0),
+    StoredField(MEMBER_FIELD_CHORES_THIS_WEEK, default=0),
+    StoredField(MEMBER_FIELD_CHORES_THIS_MONTH, default=0),
+    StoredField(MEMBER_FIELD_CHORES_THIS_YEAR, default=0),
+    StoredField(MEMBER_FIELD_PENDING_CHORES, default=0),
+    StoredField(MEMBER_FIELD_OVERDUE_CHORES, default=0),
+    StoredField(MEMBER_FIELD_PERIOD_KEYS, default={}, dump=dict, load=dict),
+)
 
+_member_to_dict = compile_to_dict(MEMBER_FIELDS)
+_member_kwargs_from_dict = compile_from_dict(MEMBER_FIELDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class Member:
-    """Represents a household member."""
+    """Represents a household member.
+
+    Every period's point and chore counters are stamped with the key of the
+    period they were counted in (``period_keys``). A counter whose key is
+    not the current period's reads as 0 and is zeroed on its next write, so
+    nothing has to be reset when a day, week, month or year rolls over.
+
+    ``member_id`` is a stable integer handed out by the storage manager
+    when the member is added (0 until then). Chores reference members by
+    this ID, so the name is only a display value.
+
+    Instances are slotted (no per-instance ``__dict__``).
+    """
     
     name: str
+    member_id: int = 0
     points_earned_today: int = 0
     points_earned_this_week: int = 0
     points_earned_this_month: int = 0
@@ -40,93 +100,99 @@ class Member:
     chores_completed_this_year: int = 0
     n_chores_pending: int = 0
     n_chores_overdue: int = 0
+    period_keys: Dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        # Counters without a period key are taken to belong to the current period
+        today = dt_util.now().date()
+        for period in TRACKER_PERIODS:
+            self.period_keys.setdefault(period, period_key(period, today))
     
-    def to_dict(self) -> Dict[str, int]:
+    def to_dict(self) -> Dict[str, Any]:
         """Convert the Member dataclass to a dictionary."""
-        data = asdict(self)
-        # Remove the 'name' key since it's used as the dictionary key in storage
-        data.pop(MEMBER_FIELD_NAME, None)
-        return data
+        return _member_to_dict(self)
     
     @classmethod
-    def from_dict(cls, name: str, data: Dict[str, int]) -> Member:
+    def from_dict(cls, data: Dict[str, Any]) -> Member:
         """Create a Member instance from a dictionary."""
-        return cls(
-            name=name,
-            points_earned_today=data.get(MEMBER_FIELD_POINTS_TODAY, 0),
-            points_earned_this_week=data.get(MEMBER_FIELD_POINTS_THIS_WEEK, 0),
-            points_earned_this_month=data.get(MEMBER_FIELD_POINTS_THIS_MONTH, 0),
-            points_earned_this_year=data.get(MEMBER_FIELD_POINTS_THIS_YEAR, 0),
-            chores_completed_today=data.get(MEMBER_FIELD_CHORES_TODAY, 0),
-            chores_completed_this_week=data.get(MEMBER_FIELD_CHORES_THIS_WEEK, 0),
-            chores_completed_this_month=data.get(MEMBER_FIELD_CHORES_THIS_MONTH, 0),
-            chores_completed_this_year=data.get(MEMBER_FIELD_CHORES_THIS_YEAR, 0),
-            n_chores_pending=data.get(MEMBER_FIELD_PENDING_CHORES, 0),
-            n_chores_overdue=data.get(MEMBER_FIELD_OVERDUE_CHORES, 0),
-        )
+        return cls(**_member_kwargs_from_dict(data))
+
+    # period keys
+
+    def _is_current(self, period: str, today: date | None) -> bool:
+        """Return True if the counters of a period belong to the current period."""
+        if today is None:
+            today = dt_util.now().date()
+        return self.period_keys.get(period) == period_key(period, today)
+
+    def _roll_over(self, period: str, today: date | None) -> None:
+        """Zero the counters of a period if they belong to an earlier one."""
+        if today is None:
+            today = dt_util.now().date()
+        key = period_key(period, today)
+        if self.period_keys.get(period) != key:
+            setattr(self, f"{MEMBER_FIELD_PREFIX_POINTS}_{period}", 0)
+            setattr(self, f"{MEMBER_FIELD_PREFIX_CHORES}_{period}", 0)
+            self.period_keys[period] = key
         
     # getting and setting points
     
-    def get_points(self, period: str) -> int:
+    def get_points(self, period: str, today: date | None = None) -> int:
         """Get points for a specific period."""
+        if not self._is_current(period, today):
+            return 0
         return getattr(self, f"{MEMBER_FIELD_PREFIX_POINTS}_{period}", 0)
     
-    def set_points(self, period: str, points: int):
+    def set_points(self, period: str, points: int, today: date | None = None):
         """Set points for a specific period."""
+        self._roll_over(period, today)
         setattr(self, f"{MEMBER_FIELD_PREFIX_POINTS}_{period}", points)
     
-    def add_points(self, points: int):
+    def add_points(self, points: int, today: date | None = None):
         """Add points to all periods."""
-        self.points_earned_today += points
-        self.points_earned_this_week += points
-        self.points_earned_this_month += points
-        self.points_earned_this_year += points
+        for period in TRACKER_PERIODS:
+            self.set_points(period, self.get_points(period, today) + points, today)
         
-    def reset_points(self, period: str):
+    def reset_points(self, period: str, today: date | None = None):
         """Reset points for a specific period."""
-        self.set_points(period, 0)
+        self.set_points(period, 0, today)
         
-    def subtract_points(self, points: int):
+    def subtract_points(self, points: int, today: date | None = None):
         """Subtract points from all periods."""
-        self.points_earned_today = max(0, self.points_earned_today - points)
-        self.points_earned_this_week = max(0, self.points_earned_this_week - points)
-        self.points_earned_this_month = max(0, self.points_earned_this_month - points)
-        self.points_earned_this_year = max(0, self.points_earned_this_year - points)
+        for period in TRACKER_PERIODS:
+            self.set_points(period, max(0, self.get_points(period, today) - points), today)
         
-    def reset_all_points(self):
+    def reset_all_points(self, today: date | None = None):
         """Reset points for all periods."""
-        self.points_earned_today = 0
-        self.points_earned_this_week = 0
-        self.points_earned_this_month = 0
-        self.points_earned_this_year = 0
+        for period in TRACKER_PERIODS:
+            self.reset_points(period, today)
     
     # getting and setting chores completed
     
-    def get_chores_completed(self, period: str) -> int:
+    def get_chores_completed(self, period: str, today: date | None = None) -> int:
         """Get chores completed for a specific period."""
+        if not self._is_current(period, today):
+            return 0
         return getattr(self, f"{MEMBER_FIELD_PREFIX_CHORES}_{period}", 0)
     
-    def set_chores_completed(self, period: str, chores_completed: int):
+    def set_chores_completed(self, period: str, chores_completed: int, today: date | None = None):
         """Set chores completed for a specific period."""
+        self._roll_over(period, today)
         setattr(self, f"{MEMBER_FIELD_PREFIX_CHORES}_{period}", chores_completed)
         
-    def add_chore_completed(self):
+    def add_chore_completed(self, today: date | None = None):
         """Increment chores completed for all periods."""
-        self.chores_completed_today += 1
-        self.chores_completed_this_week += 1
-        self.chores_completed_this_month += 1
-        self.chores_completed_this_year += 1
+        for period in TRACKER_PERIODS:
+            self.set_chores_completed(period, self.get_chores_completed(period, today) + 1, today)
         
-    def reset_chores_completed(self, period: str):
+    def reset_chores_completed(self, period: str, today: date | None = None):
         """Reset chores completed for a specific period."""
-        self.set_chores_completed(period, 0)
+        self.set_chores_completed(period, 0, today)
     
-    def reset_all_chores_completed(self):
+    def reset_all_chores_completed(self, today: date | None = None):
         """Reset chores completed for all periods."""
-        self.chores_completed_today = 0
-        self.chores_completed_this_week = 0
-        self.chores_completed_this_month = 0
-        self.chores_completed_this_year = 0
+        for period in TRACKER_PERIODS:
+            self.reset_chores_completed(period, today)
         
     # pending and overdue chores 
     
@@ -3,23 +3,18 @@ from __future__ import annotations
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers import device_registry as dr
 
 from .const import (
     DOMAIN,
     CONF_POINTS_LABEL,
     DEFAULT_POINTS_LABEL,
-    DEVICE_MANUFACTURER,
-    DEVICE_MODEL_CHORE,
-    DEVICE_SW_VERSION,
     ICON_POINTS,
     LOGGER,
 )
 from .coordinator import SimpleChoresCoordinator
+from .entity import SimpleChoresChoreEntity
 
 
 async def async_setup_entry(
@@ -29,21 +24,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up SimpleChores number entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    storage = hass.data[DOMAIN][entry.entry_id]["storage"]
-    
-    # Get chores from storage
-    chores = storage.get_chores()
 
-    entities = []
-    
-    # Create points number entity for each chore
-    for chore_id, chore in chores.items():
-        entities.append(ChorePointsNumber(coordinator, entry, chore_id, chore.name))
+    @callback
+    def async_create_chore_entities(chore_id: str, chore_name: str) -> list[NumberEntity]:
+        """Create the points number entity of a chore."""
+        return [ChorePointsNumber(coordinator, entry, chore_id, chore_name)]
 
-    async_add_entities(entities)
+    # Adds entities for existing chores now and for new chores at runtime
+    coordinator.async_add_chore_platform(async_create_chore_entities, async_add_entities)
 
 
-class ChorePointsNumber(CoordinatorEntity, NumberEntity):
+class ChorePointsNumber(SimpleChoresChoreEntity, NumberEntity):
     """Number entity to set chore points value."""
 
     def __init__(
@@ -54,11 +45,7 @@ class ChorePointsNumber(CoordinatorEntity, NumberEntity):
         chore_name: str,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator)
-        self.chore_id = chore_id
-        self.chore_name = chore_name
-        self._entry = entry
-        self._attr_has_entity_name = True
+        super().__init__(coordinator, entry, chore_id, chore_name)
         points_label = entry.data.get(CONF_POINTS_LABEL, DEFAULT_POINTS_LABEL)
         self._attr_name = points_label
         self._attr_unique_id = f"{DOMAIN}_{chore_id}_points"
@@ -68,55 +55,10 @@ class ChorePointsNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = 1
         self._attr_mode = NumberMode.BOX
 
-    def _get_related_entity_ids(self) -> dict[str, str]:
-        """Get all related entity IDs for this chore."""
-        return {
-            "status": f"select.{self.chore_id}_status",
-            "assigned_to": f"select.{self.chore_id}_assigned_to",
-            "mark_completed_by": f"select.{self.chore_id}_mark_completed_by",
-            "points": f"number.{self.chore_id}_points",
-            "due_date": f"date.{self.chore_id}_due_date",
-        }
-
-    def _get_device_id(self) -> str | None:
-        """Get the device_id for this entity's device."""
-        device_registry = dr.async_get(self.hass)
-        device = device_registry.async_get_device(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")}
-        )
-        if device:
-            return device.id
-        return None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this chore."""
-        # Get chore from storage to show status and assigned member
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
-        
-        if chore:
-            hw_info = f"{chore.status.capitalize()}"
-            if chore.assigned_to:
-                hw_info += f" • Assigned to {chore.assigned_to}"
-        else:
-            hw_info = "Unknown"
-        
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")},
-            name=self.chore_name,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL_CHORE,
-            sw_version=DEVICE_SW_VERSION,
-            hw_version=hw_info,
-            suggested_area="Chores",
-        )
-
     @property
     def native_value(self) -> float:
         """Return the current points value."""
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
+        chore = self.coordinator.data.chores.get(self.chore_id)
         
         if chore is None:
             return 0
@@ -152,8 +94,8 @@ class ChorePointsNumber(CoordinatorEntity, NumberEntity):
         storage.update_chore(self.chore_id, chore)
         await storage.async_save()
         
-        # Force immediate coordinator refresh to update all entities
-        await self.coordinator.async_refresh()
+        # Update the entities of this chore and of its assignee
+        self.coordinator.async_publish_changes(chore_ids=[self.chore_id])
         
         LOGGER.info(
             f"Chore '{self.chore_name}' points updated to {int(value)}"
@@ -45,10 +45,11 @@ from .member import Member
 from .chore import Chore
 import time
 import random
-from datetime import date, datetime
+from datetime import datetime
 
 from homeassistant.helpers import device_registry as dr, area_registry as ar
 from homeassistant.helpers import selector
+from homeassistant.util import dt as dt_util
 
 
 
@@ -62,6 +63,15 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
         self._chore_data = {}  # Temporary storage for chore data during flow
         self._chore_mode = None  # Track if we're in 'add' or 'edit' mode
 
+    @staticmethod
+    def _member_names(storage, member_ids: list[int]) -> list[str]:
+        """Translate the member IDs stored in a chore to member names for a form."""
+        return [
+            name
+            for member_id in member_ids
+            if (name := storage.get_member_name(member_id)) is not None
+        ]
+
     async def async_step_init(self, user_input: Optional[dict[str, Any]] = None) -> FlowResult:
         """Main menu - select between managing members or chores."""
         return self.async_show_menu(
@@ -104,7 +114,7 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
                     device_reg = dr.async_get(self.hass)
                     device_reg.async_get_or_create(
                         config_entry_id=self.config_entry.entry_id,
-                        identifiers={(DOMAIN, f"member_{new_member_name}")},
+                        identifiers={(DOMAIN, f"member_{new_member.member_id}")},
                         name=new_member_name,
                         manufacturer=DEVICE_MANUFACTURER,
                         model=DEVICE_MODEL_MEMBER,
@@ -176,40 +186,48 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             assignment_mode = user_input.get("assignment_mode", ASSIGN_MODE_ALWAYS)
             
-            # Update selected chores with new member and assignment mode
+            # Validate all selected chores first; storage hands out live
+            # chore objects, so nothing may be modified until all pass
+            member_id = storage.get_member_id(self._selected_member)
+            pending_updates = []
             for chore_id in selected_chore_ids:
                 chore = storage.get_chore(chore_id)
                 if chore:
                     # Add new member to possible_assignees if not already there
-                    if self._selected_member not in chore.possible_assignees:
-                        chore.possible_assignees.append(self._selected_member)
+                    possible_assignees = list(chore.possible_assignees)
+                    if member_id not in possible_assignees:
+                        possible_assignees.append(member_id)
                     
-                    # Validate and update assignment mode
+                    # Validate assignment mode
                     if assignment_mode == ASSIGN_MODE_ALWAYS:
                         # For always mode, need exactly one assignee
-                        if len(chore.possible_assignees) == 1:
-                            chore.assignment_mode = ASSIGN_MODE_ALWAYS
-                            chore.assigned_to = chore.possible_assignees[0]
-                        else:
+                        if len(possible_assignees) != 1:
                             # More than one assignee, cannot use always mode
                             errors["assignment_mode"] = "always_mode_one_person"
                             break
                     elif assignment_mode in [ASSIGN_MODE_ROTATE, ASSIGN_MODE_RANDOM]:
                         # For rotate/random mode, need at least two assignees
-                        if len(chore.possible_assignees) >= 2:
-                            chore.assignment_mode = assignment_mode
-                            # Keep current assignment or assign to new member if needed
-                            if not chore.assigned_to or chore.assigned_to not in chore.possible_assignees:
-                                chore.assigned_to = chore.possible_assignees[0]
-                        else:
+                        if len(possible_assignees) < 2:
                             # Only one assignee, cannot use rotate/random mode
                             errors["assignment_mode"] = "rotate_random_two_people"
                             break
                     
-                    storage.update_chore(chore_id, chore)
+                    pending_updates.append((chore_id, chore, possible_assignees))
             
             if not errors:
-                await storage.async_save()
+                # Update selected chores with new member and assignment mode
+                async with storage.async_batch():
+                    for chore_id, chore, possible_assignees in pending_updates:
+                        chore.possible_assignees = possible_assignees
+                        if assignment_mode == ASSIGN_MODE_ALWAYS:
+                            chore.assignment_mode = ASSIGN_MODE_ALWAYS
+                            chore.assigned_to = possible_assignees[0]
+                        elif assignment_mode in [ASSIGN_MODE_ROTATE, ASSIGN_MODE_RANDOM]:
+                            chore.assignment_mode = assignment_mode
+                            # Keep current assignment or assign to new member if needed
+                            if not chore.assigned_to or chore.assigned_to not in possible_assignees:
+                                chore.assigned_to = possible_assignees[0]
+                        storage.update_chore(chore_id, chore)
                 
                 # Clear temporary data
                 self._selected_member = None
@@ -296,64 +314,28 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
                 
                 # Handle name change
                 if new_name != self._selected_member:
-                    # Update member name in storage
-                    member.name = new_name
-                    storage.delete_member(self._selected_member)
-                    storage.add_member(member)
-                    
-                    # Update all chores that reference this member
-                    chores = storage.get_chores()
-                    for chore_id, chore in chores.items():
-                        modified = False
-                        
-                        # Update assigned_to if it's the renamed member
-                        if chore.assigned_to == self._selected_member:
-                            chore.assigned_to = new_name
-                            modified = True
-                        
-                        # Update possible_assignees if it contains the renamed member
-                        if self._selected_member in chore.possible_assignees:
-                            chore.possible_assignees = [
-                                new_name if assignee == self._selected_member else assignee
-                                for assignee in chore.possible_assignees
-                            ]
-                            modified = True
-                        
-                        if modified:
-                            storage.update_chore(chore_id, chore)
-                    
-                    # Update device registry
+                    # Chores, the device and the entities all use the member ID,
+                    # so only the member record and the device name change
+                    storage.rename_member(self._selected_member, new_name)
                     device_reg = dr.async_get(self.hass)
-                    
-                    # Remove old device
-                    old_device = device_reg.async_get_device(
-                        identifiers={(DOMAIN, f"member_{self._selected_member}")}
-                    )
-                    if old_device:
-                        device_reg.async_remove_device(old_device.id)
-                    
-                    # Create new device
-                    device_reg.async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        identifiers={(DOMAIN, f"member_{new_name}")},
-                        name=new_name,
-                        manufacturer=DEVICE_MANUFACTURER,
-                        model=DEVICE_MODEL_MEMBER,
-                        sw_version=DEVICE_SW_VERSION,
+                    device = device_reg.async_get_device(
+                        identifiers={(DOMAIN, f"member_{member.member_id}")}
                     )
+                    if device:
+                        device_reg.async_update_device(device.id, name=new_name)
                 else:
                     # Just update existing member data
                     storage.update_member(member)
                 
                 await storage.async_save()
                 
-                # Refresh coordinator
+                # Publish the member under its new name; every chore's entities
+                # show member names, so they are published as well
                 coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]["coordinator"]
-                await coordinator.async_refresh_data()
-                
-                # Reload if name changed to recreate entities
-                if new_name != self._selected_member:
-                    await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+                coordinator.async_publish_changes(
+                    chore_ids=list(storage.get_chores()) if new_name != self._selected_member else (),
+                    member_names={self._selected_member, new_name},
+                )
                 
                 return self.async_create_entry(title="", data={})
         
@@ -462,7 +444,7 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
             chores = storage.get_chores()
             if self._selected_chore in chores:
                 chore = chores[self._selected_chore]
-                default_assignees = chore.possible_assignees
+                default_assignees = self._member_names(storage, chore.possible_assignees)
                 default_assignment_mode = chore.assignment_mode
         
         if user_input is not None:
@@ -802,13 +784,20 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
         storage = self.hass.data[DOMAIN][self.config_entry.entry_id]["storage"]
         members = storage.get_members()
         
+        # Chores reference their assignees by member ID
+        assignee_names = self._chore_data.get("assignees", list(members.keys()))
+        assignees = [
+            member_id
+            for name in assignee_names
+            if (member_id := storage.get_member_id(name)) is not None
+        ]
+        
         # Handle area_id "none" conversion
         area_id = self._chore_data.get("area_id")
         if area_id == "none":
             area_id = None
         
         if self._chore_mode == "add":
-            # Create unique ID for chore (slugified name + timestamp)
             chore_name = self._chore_data["chore_name"]
             
             # Create the chore with all collected data
@@ -816,7 +805,7 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
                 name=chore_name,
                 points=self._chore_data.get("points", 0),
                 assignment_mode=self._chore_data.get("assignment_mode", ASSIGN_MODE_ALWAYS),
-                possible_assignees=self._chore_data.get("assignees", list(members.keys())),
+                possible_assignees=assignees,
                 recurrence_pattern=self._chore_data.get(CONF_RECURRENCE_PATTERN, FREQUENCY_DAILY),
                 recurrence_interval=self._chore_data.get(CONF_RECURRENCE_INTERVAL, 1),
                 recurrence_day_of_month=self._chore_data.get(CONF_RECURRENCE_DAY_OF_MONTH),
@@ -825,11 +814,10 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
                 recurrence_annual_month=self._chore_data.get(CONF_RECURRENCE_ANNUAL_MONTH),
                 recurrence_annual_day=self._chore_data.get(CONF_RECURRENCE_ANNUAL_DAY),
                 area_id=area_id,
-                created_at=datetime.now().isoformat()
+                created_at=datetime.now()
             )
             
             # Assign initial member if needed
-            assignees = self._chore_data.get("assignees", [])
             assignment_mode = self._chore_data.get("assignment_mode", ASSIGN_MODE_ALWAYS)
             if assignment_mode == ASSIGN_MODE_ALWAYS and assignees:
                 chore.assigned_to = assignees[0]
@@ -839,10 +827,11 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
                 chore.assigned_to = random.choice(assignees)
             
             # Set the first due date to today
-            chore.due_date = date.today().isoformat()
+            chore.due_date = dt_util.now().date()
             
             # Add to storage
-            storage.add_chore(chore.chore_id, chore)
+            chore_id = storage.allocate_chore_id()
+            storage.add_chore(chore_id, chore)
             
         else:  # edit mode
             chore_id = self._selected_chore
@@ -856,7 +845,7 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
             chore.points = self._chore_data.get("points", 10)
             chore.area_id = area_id
             chore.assignment_mode = self._chore_data.get("assignment_mode", ASSIGN_MODE_ALWAYS)
-            chore.possible_assignees = self._chore_data.get("assignees", [])
+            chore.possible_assignees = assignees
             chore.recurrence_pattern = self._chore_data.get(CONF_RECURRENCE_PATTERN, FREQUENCY_DAILY)
             chore.recurrence_interval = self._chore_data.get(CONF_RECURRENCE_INTERVAL, 1)
             chore.recurrence_day_of_month = self._chore_data.get(CONF_RECURRENCE_DAY_OF_MONTH)
@@ -884,13 +873,17 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
         # Save storage
         await storage.async_save()
         
+        # Add or recreate only this chore's entities instead of reloading the entry
+        coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]["coordinator"]
+        if self._chore_mode == "add":
+            coordinator.async_add_chore_entities(chore_id)
+        else:
+            await coordinator.async_reload_chore_entities(chore_id)
+        
         # Clear temporary data
         self._chore_data = {}
         self._selected_chore = None
         
-        # Reload entry to create/update device and entities
-        await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-        
         return self.async_create_entry(title="", data={})
 
     async def async_step_edit_chore(self, user_input: Optional[dict[str, Any]] = None) -> FlowResult:
@@ -913,7 +906,7 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
                     "points": chore.points,
                     "area_id": chore.area_id or "none",
                     "assignment_mode": chore.assignment_mode,
-                    "assignees": chore.possible_assignees,
+                    "assignees": self._member_names(storage, chore.possible_assignees),
                     CONF_RECURRENCE_PATTERN: chore.recurrence_pattern,
                     CONF_RECURRENCE_INTERVAL: chore.recurrence_interval,
                     CONF_RECURRENCE_DAY_OF_MONTH: chore.recurrence_day_of_month,
@@ -987,17 +980,9 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
                 storage.delete_chore(chore_id)
                 await storage.async_save()
                 
-                # Remove device
-                device_reg = dr.async_get(self.hass)
-                device = device_reg.async_get_device(
-                    identifiers={(DOMAIN, f"chore_{chore_id}")}
-                )
-                if device:
-                    device_reg.async_remove_device(device.id)
-                
-                # Refresh coordinator
+                # Remove the chore's entities and device
                 coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]["coordinator"]
-                await coordinator.async_refresh_data()
+                await coordinator.async_remove_chore_entities(chore_id)
             
             return self.async_create_entry(title="", data={})
         
@@ -1023,25 +1008,17 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
         
         if user_input is not None:
             if user_input.get("confirm"):
-                device_reg = dr.async_get(self.hass)
-                
-                # Delete all chores
-                for chore_id in list(chores.keys()):
-                    # Remove device
-                    device = device_reg.async_get_device(
-                        identifiers={(DOMAIN, f"chore_{chore_id}")}
-                    )
-                    if device:
-                        device_reg.async_remove_device(device.id)
-                    
-                    # Remove from storage
-                    storage.delete_chore(chore_id)
+                coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]["coordinator"]
                 
-                await storage.async_save()
+                # Delete all chores in one batch (one index update, one save)
+                async with storage.async_batch() as deleted:
+                    for chore_id in list(chores.keys()):
+                        storage.delete_chore(chore_id)
                 
-                # Refresh coordinator
-                coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]["coordinator"]
-                await coordinator.async_refresh_data()
+                # Remove the chores' entities and devices
+                for chore_id in deleted:
+                    await coordinator.async_remove_chore_entities(chore_id, publish=False)
+                coordinator.async_publish_changes(chore_ids=deleted)
             
             return self.async_create_entry(title="", data={})
         
@@ -1073,10 +1050,11 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
             self._selected_member = user_input.get("member")
             
             # Check if member has any assigned chores
+            member_id = storage.get_member_id(self._selected_member)
             chores = storage.get_chores()
             has_assigned_chores = any(
-                chore.assigned_to == self._selected_member or 
-                self._selected_member in chore.possible_assignees
+                chore.assigned_to == member_id or 
+                member_id in chore.possible_assignees
                 for chore in chores.values()
             )
             
@@ -1124,44 +1102,47 @@ class SimpleChoresOptionsFlow(config_entries.OptionsFlow):
         """Finalize member deletion and reassign chores if needed."""
         storage = self.hass.data[DOMAIN][self.config_entry.entry_id]["storage"]
         member_to_delete = self._selected_member
+        member_id = storage.get_member_id(member_to_delete)
+        reassign_id = storage.get_member_id(reassign_to)
         
-        # Update all chores
-        chores = storage.get_chores()
-        for chore_id, chore in chores.items():
-            modified = False
-            
-            # If chore is assigned to deleted member, reassign it
-            if chore.assigned_to == member_to_delete:
-                chore.assigned_to = reassign_to
-                modified = True
-            
-            # Remove deleted member from possible_assignees
-            if member_to_delete in chore.possible_assignees:
-                chore.possible_assignees.remove(member_to_delete)
-                modified = True
-            
-            # Add reassign_to member to possible_assignees if not already there
-            if reassign_to and reassign_to not in chore.possible_assignees:
-                chore.possible_assignees.append(reassign_to)
-                modified = True
-            
-            # If only one possible assignee remains, switch to "always" mode
-            if len(chore.possible_assignees) == 1 and chore.assignment_mode in [ASSIGN_MODE_ROTATE, ASSIGN_MODE_RANDOM]:
-                chore.assignment_mode = ASSIGN_MODE_ALWAYS
-                chore.assigned_to = chore.possible_assignees[0]
-                modified = True
-            
-            if modified:
-                storage.update_chore(chore_id, chore)
+        # Update all chores and remove the member in one batch (one save)
+        async with storage.async_batch():
+            chores = storage.get_chores()
+            for chore_id, chore in chores.items():
+                modified = False
+                
+                # If chore is assigned to deleted member, reassign it
+                if chore.assigned_to == member_id:
+                    chore.assigned_to = reassign_id
+                    modified = True
+                
+                # Remove deleted member from possible_assignees
+                if member_id in chore.possible_assignees:
+                    chore.possible_assignees.remove(member_id)
+                    modified = True
+                
+                # Add reassign_to member to possible_assignees if not already there
+                if reassign_id and reassign_id not in chore.possible_assignees:
+                    chore.possible_assignees.append(reassign_id)
+                    modified = True
+                
+                # If only one possible assignee remains, switch to "always" mode
+                if len(chore.possible_assignees) == 1 and chore.assignment_mode in [ASSIGN_MODE_ROTATE, ASSIGN_MODE_RANDOM]:
+                    chore.assignment_mode = ASSIGN_MODE_ALWAYS
+                    chore.assigned_to = chore.possible_assignees[0]
+                    modified = True
+                
+                if modified:
+                    storage.update_chore(chore_id, chore)
         
-        # Remove member from storage
-        if storage.delete_member(member_to_delete):
-            await storage.async_save()
-            
+            # Remove member from storage
+            deleted = storage.delete_member(member_to_delete)
+        
+        if deleted:
             # Remove device
             device_reg = dr.async_get(self.hass)
             device = device_reg.async_get_device(
-                identifiers={(DOMAIN, f"member_{member_to_delete}")}
+                identifiers={(DOMAIN, f"member_{member_id}")}
             )
             if device:
                 device_reg.async_remove_device(device.id)
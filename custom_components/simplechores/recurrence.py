@@ -0,0 +1,345 @@
+"""Compiled recurrence rules for SimpleChores.
+
+A RecurrenceRule describes when a chore recurs with the parts of an
+RFC 5545 RRULE that chores need (FREQ, INTERVAL, BYMONTH, BYMONTHDAY,
+BYDAY, BYSETPOS, UNTIL and COUNT) plus EXDATE. compile_rule() turns a rule
+into a CompiledRule once; compiled rules are cached by value, so chores
+with the same schedule share one.
+
+Rules are evaluated relative to the day they are asked about (the day a
+chore is completed) rather than to a fixed DTSTART. Two differences from
+RFC 5545 keep the schedules chores have always had: a BYMONTHDAY past the
+end of a month falls on its last day instead of skipping the month, and a
+rule that cannot produce a date falls back to a fixed step.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterator, List, Sequence, Tuple
+
+from .const import (
+    RRULE_FREQ_DAILY,
+    RRULE_FREQ_WEEKLY,
+    RRULE_FREQ_MONTHLY,
+    RRULE_FREQ_YEARLY,
+)
+
+# How far ahead monthly and yearly rules look before falling back
+MONTHS_AHEAD = 24
+YEARS_AHEAD = 9
+
+# Days per month in a common year
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Months kept in the month table; 4800 months cover the 400 year Gregorian cycle
+MONTH_TABLE_SIZE = 4800
+
+# Fixed steps of rules that cannot produce a date
+MONTHLY_FALLBACK = timedelta(days=30)
+YEARLY_FALLBACK = timedelta(days=365)
+
+
+@dataclass(frozen=True, slots=True)
+class RecurrenceRule:
+    """An RFC 5545 style recurrence rule.
+
+    ``freq`` is None for chores that do not recur. ``byday`` holds
+    ``(ordinal, weekday)`` pairs with Monday as 0; an ordinal of None
+    matches every such weekday of the month, 1 the first and -1 the last.
+    ``bysetpos`` picks positions from the sorted days a monthly rule
+    matches within one month. INTERVAL only applies to daily rules.
+    """
+
+    freq: str | None
+    interval: int = 1
+    bymonth: int | None = None
+    bymonthday: int | None = None
+    byday: Tuple[Tuple[int | None, int], ...] = ()
+    bysetpos: Tuple[int, ...] = ()
+    until: date | None = None
+    exdates: FrozenSet[date] = frozenset()
+
+
+class CompiledRule:
+    """A recurrence rule compiled into a step function.
+
+    ``step`` returns the day the rule matches next after a given day,
+    before UNTIL and EXDATE are applied. Rules that advance by a fixed
+    ``period`` can skip ahead arithmetically when iterating.
+    """
+
+    __slots__ = ("rule", "_step", "_period")
+
+    def __init__(
+        self,
+        rule: RecurrenceRule,
+        step: Callable[[date], date] | None,
+        period: timedelta | None = None,
+    ) -> None:
+        self.rule = rule
+        self._step = step
+        self._period = period
+
+    def after(self, day: date) -> date | None:
+        """Return the first occurrence after day, or None if the rule has ended."""
+        step = self._step
+        if step is None:
+            return None
+        following = step(day)
+        exdates = self.rule.exdates
+        while following in exdates:
+            following = step(following)
+        until = self.rule.until
+        if until is not None and following > until:
+            return None
+        return following
+
+    def iterate(
+        self,
+        first: date,
+        start: date | None = None,
+        end: date | None = None,
+        count: int | None = None,
+    ) -> Iterator[date]:
+        """Yield first and the occurrences following it.
+
+        Occurrences before start are skipped and the iteration stops after
+        end or UNTIL, or once count occurrences (skipped ones included)
+        have been produced.
+        """
+        until = self.rule.until
+        if until is not None and (end is None or until < end):
+            end = until
+        day: date | None = first
+        if start is not None and first < start:
+            period = self._period
+            if period is not None:
+                if count is not None:
+                    count -= self.count(first, start - timedelta(days=1))
+                # Jump straight to the first occurrence on or after start
+                day = first + period * -((first - start).days // period.days)
+                if day in self.rule.exdates:
+                    day = self.after(day)
+            elif count is None:
+                day = self.after(start - timedelta(days=1))
+        while day is not None and (end is None or day <= end):
+            if count is not None:
+                if count <= 0:
+                    return
+                count -= 1
+            if start is None or day >= start:
+                yield day
+            day = self.after(day)
+
+    def count(self, first: date, end: date) -> int:
+        """Return how many occurrences iterate(first, end=end) yields.
+
+        Fixed-period rules count on day ordinals, without visiting the
+        occurrences; other rules are iterated.
+        """
+        until = self.rule.until
+        if until is not None and until < end:
+            end = until
+        if first > end:
+            return 0
+        period = self._period
+        if period is None:
+            return sum(1 for _ in self.iterate(first, end=end))
+        days = period.days
+        first_ordinal = first.toordinal()
+        excluded = sum(
+            1
+            for exdate in self.rule.exdates
+            if first < exdate <= end and (exdate.toordinal() - first_ordinal) % days == 0
+        )
+        return (end.toordinal() - first_ordinal) // days + 1 - excluded
+
+
+def _fixed(rule: RecurrenceRule, period: timedelta) -> CompiledRule:
+    """Compile a rule that advances by a fixed period."""
+
+    def step(day: date) -> date:
+        return day + period
+
+    return CompiledRule(rule, step, period)
+
+
+def _compile_weekly(rule: RecurrenceRule) -> CompiledRule:
+    """Compile a rule matching a set of weekdays."""
+    weekdays = {weekday for _, weekday in rule.byday if 0 <= weekday <= 6}
+    if not weekdays:
+        return _fixed(rule, timedelta(days=1))
+    # Days from each weekday to the next matching one
+    gaps = [
+        timedelta(days=next(i for i in range(1, 8) if (weekday + i) % 7 in weekdays))
+        for weekday in range(7)
+    ]
+
+    def step(day: date) -> date:
+        return day + gaps[day.weekday()]
+
+    return CompiledRule(rule, step)
+
+
+@lru_cache(maxsize=MONTH_TABLE_SIZE)
+def month_table(year: int, month: int) -> Tuple[int, int]:
+    """Return the weekday of the first day (Monday is 0) and the length of a month."""
+    leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    days_in_month = 29 if month == 2 and leap else DAYS_IN_MONTH[month - 1]
+    return date(year, month, 1).weekday(), days_in_month
+
+
+def _clamp_month_day(month_day: int, days_in_month: int) -> int:
+    """Resolve a day of the month, negative counting from the end, into the month."""
+    if month_day > 0:
+        return min(month_day, days_in_month)
+    return max(1, days_in_month + month_day + 1)
+
+
+def _compile_monthly(rule: RecurrenceRule) -> CompiledRule:
+    """Compile a rule matching days of the month or weekdays of the month."""
+    month_day = rule.bymonthday
+    byday = [(ordinal, weekday) for ordinal, weekday in rule.byday if 0 <= weekday <= 6 and ordinal != 0]
+    if month_day is None and not byday:
+        return _fixed(rule, MONTHLY_FALLBACK)
+    setpos = rule.bysetpos
+
+    if not byday and not setpos:
+        # One day per month: this month's, or else next month's
+        def step(day: date) -> date:
+            year, month = day.year, day.month
+            candidate = _clamp_month_day(month_day, month_table(year, month)[1])
+            if candidate > day.day:
+                return date(year, month, candidate)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            return date(year, month, _clamp_month_day(month_day, month_table(year, month)[1]))
+
+        return CompiledRule(rule, step)
+
+    @lru_cache(maxsize=MONTHS_AHEAD * 2)
+    def month_days(year: int, month: int) -> Tuple[int, ...]:
+        """Return the matching days of a month in order."""
+        first_weekday, days_in_month = month_table(year, month)
+        days = set()
+        if month_day is not None:
+            days.add(_clamp_month_day(month_day, days_in_month))
+        for ordinal, weekday in byday:
+            # Day of the month of the first and of the last such weekday
+            first = (weekday - first_weekday) % 7 + 1
+            if ordinal is None:
+                days.update(range(first, days_in_month + 1, 7))
+            elif ordinal > 0:
+                day = first + 7 * (ordinal - 1)
+                if day <= days_in_month:
+                    days.add(day)
+            else:
+                last = first + 7 * ((days_in_month - first) // 7)
+                day = last + 7 * (ordinal + 1)
+                if day >= 1:
+                    days.add(day)
+        ordered = sorted(days)
+        if setpos:
+            size = len(ordered)
+            ordered = sorted({
+                ordered[position - 1 if position > 0 else position]
+                for position in setpos
+                if 0 < position <= size or -size <= position < 0
+            })
+        return tuple(ordered)
+
+    def step(day: date) -> date:
+        year, month = day.year, day.month
+        after = day.day
+        for _ in range(MONTHS_AHEAD):
+            days = month_days(year, month)
+            index = bisect_right(days, after)
+            if index < len(days):
+                return date(year, month, days[index])
+            after = 0
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return day + MONTHLY_FALLBACK
+
+    return CompiledRule(rule, step)
+
+
+def _compile_yearly(rule: RecurrenceRule) -> CompiledRule:
+    """Compile a rule matching one date of the year."""
+    month, month_day = rule.bymonth, rule.bymonthday
+    try:
+        # 2000 is a leap year, so any date that exists in some year is valid
+        date(2000, month, month_day)
+    except (TypeError, ValueError):
+        return _fixed(rule, YEARLY_FALLBACK)
+
+    if (month, month_day) != (2, 29):
+        # The date exists in every year
+        def step(day: date) -> date:
+            candidate = date(day.year, month, month_day)
+            return candidate if candidate > day else date(day.year + 1, month, month_day)
+
+        return CompiledRule(rule, step)
+
+    def step(day: date) -> date:
+        # Years without February 29 are skipped
+        for year in range(day.year, day.year + YEARS_AHEAD):
+            try:
+                candidate = date(year, month, month_day)
+            except ValueError:
+                continue
+            if candidate > day:
+                return candidate
+        return day + YEARLY_FALLBACK
+
+    return CompiledRule(rule, step)
+
+
+@lru_cache(maxsize=1024)
+def compile_rule(rule: RecurrenceRule) -> CompiledRule:
+    """Compile a recurrence rule, reusing the compiled form of equal rules."""
+    if rule.freq is None:
+        return CompiledRule(rule, None)
+    if rule.freq == RRULE_FREQ_WEEKLY:
+        return _compile_weekly(rule)
+    if rule.freq == RRULE_FREQ_MONTHLY:
+        return _compile_monthly(rule)
+    if rule.freq == RRULE_FREQ_YEARLY:
+        return _compile_yearly(rule)
+    interval = max(1, rule.interval) if rule.freq == RRULE_FREQ_DAILY else 1
+    return _fixed(rule, timedelta(days=interval))
+
+
+def next_occurrences(rules: Sequence[CompiledRule], firsts: Sequence[int], start: int) -> List[int | None]:
+    """Return the first occurrence on or after a day for many rules at once.
+
+    ``firsts`` holds the day ordinal of each rule's first occurrence and
+    ``start`` the day ordinal to look from; the result holds a day ordinal
+    per rule, or None if the rule ends before start. Fixed-period rules are
+    advanced with integer arithmetic on the ordinals. Every other rule
+    yields the same day for all firsts before start, so that day is
+    computed once per distinct rule.
+    """
+    last_skipped = date.fromordinal(start - 1)
+    shared: Dict[CompiledRule, int | None] = {}
+    results: List[int | None] = []
+    append = results.append
+    for rule, first in zip(rules, firsts):
+        period = rule._period
+        if first >= start or (period is not None and not rule.rule.exdates):
+            if first < start:
+                days = period.days
+                first += days * -((first - start) // days)
+            until = rule.rule.until
+            append(None if until is not None and first > until.toordinal() else first)
+        elif period is not None:
+            # The phase of the period matters once days are skipped
+            following = next(rule.iterate(date.fromordinal(first), last_skipped + timedelta(days=1)), None)
+            append(None if following is None else following.toordinal())
+        else:
+            if rule not in shared:
+                following = rule.after(last_skipped)
+                shared[rule] = None if following is None else following.toordinal()
+            append(shared[rule])
+    return results
@@ -0,0 +1,202 @@
+"""Exact-time scheduler for SimpleChores."""
+from __future__ import annotations
+
+import heapq
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER
+from .coordinator import SimpleChoresCoordinator
+from .storage_manager import SimpleChoresStorageManager
+
+# Heap keys: ("chore", chore_id) for due-date transitions, PERIODS_KEY for
+# the next period boundary (midnight, which is also where weeks, months
+# and years start).
+CHORE_KEY = "chore"
+PERIODS_KEY = ("periods",)
+
+
+class SimpleChoresScheduler:
+    """Fire chore status transitions and period resets at their exact time.
+
+    The next transition instant of every chore (start of the due date:
+    pending; end of the due date: overdue) and the next period boundary are
+    kept in a min-heap. A single point-in-time timer is armed for the
+    earliest entry. Rescheduling a key only records its new time; outdated
+    heap entries are skipped when they reach the top.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        storage: SimpleChoresStorageManager,
+        coordinator: SimpleChoresCoordinator,
+    ) -> None:
+        self.hass = hass
+        self.storage = storage
+        self.coordinator = coordinator
+        self._heap: List[Tuple[datetime, Tuple[str, ...]]] = []
+        self._entries: Dict[Tuple[str, ...], datetime] = {}
+        self._armed_at: datetime | None = None
+        self._firing_at: datetime | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._unsub_storage: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Bring chore statuses up to date and schedule all transitions."""
+        now = dt_util.utcnow()
+        today = dt_util.as_local(now).date()
+        if self.storage.update_chore_statuses(today):
+            self.storage.async_schedule_save()
+
+        for chore_id in self.storage.get_chores():
+            self._schedule_chore(chore_id, now)
+        self._schedule(PERIODS_KEY, _next_midnight(now))
+        self._unsub_storage = self.storage.async_add_chore_listener(self._async_chores_changed)
+        self._arm()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer and stop following storage changes."""
+        if self._unsub_storage is not None:
+            self._unsub_storage()
+            self._unsub_storage = None
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_at = None
+        self._heap.clear()
+        self._entries.clear()
+
+    @property
+    def next_fire(self) -> datetime | None:
+        """Return when the timer fires next."""
+        return self._armed_at
+
+    @callback
+    def _async_chores_changed(self, chore_ids: List[str]) -> None:
+        """Reschedule chores after they were added, updated or deleted."""
+        if self._firing_at is not None:
+            # Changes made while handling due entries; _async_fire re-arms
+            for chore_id in chore_ids:
+                self._schedule_chore(chore_id, self._firing_at)
+            return
+        now = dt_util.utcnow()
+        for chore_id in chore_ids:
+            self._schedule_chore(chore_id, now)
+        self._arm()
+
+    def _schedule_chore(self, chore_id: str, now: datetime) -> None:
+        """Record the next transition of a chore, or drop it if there is none."""
+        key = (CHORE_KEY, chore_id)
+        chore = self.storage.get_chore(chore_id)
+        when = _next_transition(chore.due_date, now) if chore else None
+        if when is None:
+            self._entries.pop(key, None)
+        else:
+            self._schedule(key, when)
+
+    def _schedule(self, key: Tuple[str, ...], when: datetime) -> None:
+        """Record the time of a key, pushing a heap entry if it changed."""
+        if self._entries.get(key) == when:
+            return
+        self._entries[key] = when
+        heapq.heappush(self._heap, (when, key))
+        # Outdated entries are only dropped lazily; rebuild if they pile up
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [(when, key) for key, when in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _peek(self) -> datetime | None:
+        """Return the earliest valid entry time, discarding outdated entries."""
+        while self._heap:
+            when, key = self._heap[0]
+            if self._entries.get(key) == when:
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    def _arm(self) -> None:
+        """Arm the timer for the earliest entry if it is not armed for it yet."""
+        when = self._peek()
+        if when == self._armed_at:
+            return
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_at = when
+        if when is not None:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self.hass, self._async_fire, when
+            )
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Handle every entry that is due."""
+        self._unsub_timer = None
+        self._armed_at = None
+        today = dt_util.as_local(now).date()
+        chores_changed = []
+        periods_due = False
+        self._firing_at = now
+
+        while (when := self._peek()) is not None and when <= now:
+            _, key = heapq.heappop(self._heap)
+            del self._entries[key]
+            if key == PERIODS_KEY:
+                periods_due = True
+                self._schedule(PERIODS_KEY, _next_midnight(now))
+                continue
+
+            chore_id = key[1]
+            chore = self.storage.get_chore(chore_id)
+            if chore is not None and _update_status(chore, today):
+                LOGGER.debug(f"Chore '{chore.name}' is now {chore.status}")
+                # The storage listener schedules the next transition
+                self.storage.update_chore(chore_id, chore)
+                chores_changed.append(chore_id)
+            else:
+                self._schedule_chore(chore_id, now)
+
+        self._firing_at = None
+        self._arm()
+
+        if chores_changed:
+            self.storage.async_schedule_save()
+        if periods_due:
+            # Counters roll over lazily; the refresh shows the new period's values
+            self.hass.async_create_task(self.coordinator.async_refresh())
+        elif chores_changed:
+            self.coordinator.async_publish_changes(chore_ids=chores_changed)
+
+
+def _update_status(chore, today: date) -> bool:
+    """Update a chore's status for today, ignoring invalid due dates."""
+    try:
+        return chore.update_status_for_date(today)
+    except (ValueError, TypeError):
+        LOGGER.warning(f"Invalid due_date for chore '{chore.name}': {chore.due_date}")
+        return False
+
+
+def _next_midnight(now: datetime) -> datetime:
+    """Return the start of the next local day as UTC."""
+    tomorrow = dt_util.as_local(now).date() + timedelta(days=1)
+    return dt_util.as_utc(dt_util.start_of_local_day(tomorrow))
+
+
+def _next_transition(due_date: date | None, now: datetime) -> datetime | None:
+    """Return the next instant a chore due on due_date changes status."""
+    if due_date is None:
+        return None
+
+    for boundary in (due_date, due_date + timedelta(days=1)):
+        when = dt_util.as_utc(dt_util.start_of_local_day(boundary))
+        if when > now:
+            return when
+    return None
@@ -1,28 +1,24 @@
 """Select platform for SimpleChores."""
 from __future__ import annotations
 
-from datetime import date, timedelta
-
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers import area_registry as ar
-from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    DEVICE_MANUFACTURER,
-    DEVICE_MODEL_CHORE,
-    DEVICE_SW_VERSION,
     LOGGER,
     CHORE_STATE_PENDING,
     CHORE_STATE_COMPLETED,
     CHORE_STATE_OVERDUE,
+    JOURNAL_OP_COMPLETION,
+    JOURNAL_OP_RESCHEDULE,
 )
 from .coordinator import SimpleChoresCoordinator
+from .entity import SimpleChoresChoreEntity
 
 
 async def async_setup_entry(
@@ -32,23 +28,21 @@ async def async_setup_entry(
 ) -> None:
     """Set up SimpleChores select entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    storage = hass.data[DOMAIN][entry.entry_id]["storage"]
-    
-    # Get chores from storage
-    chores = storage.get_chores()
 
-    entities = []
-    
-    # Create select entities for each chore
-    for chore_id, chore in chores.items():
-        entities.append(ChoreStatusSelect(coordinator, entry, chore_id, chore.name))
-        entities.append(ChoreAssigneeSelect(coordinator, entry, chore_id, chore.name))
-        entities.append(ChoreCompletedBySelect(coordinator, entry, chore_id, chore.name))
+    @callback
+    def async_create_chore_entities(chore_id: str, chore_name: str) -> list[SelectEntity]:
+        """Create the select entities of a chore."""
+        return [
+            ChoreStatusSelect(coordinator, entry, chore_id, chore_name),
+            ChoreAssigneeSelect(coordinator, entry, chore_id, chore_name),
+            ChoreCompletedBySelect(coordinator, entry, chore_id, chore_name),
+        ]
 
-    async_add_entities(entities)
+    # Adds entities for existing chores now and for new chores at runtime
+    coordinator.async_add_chore_platform(async_create_chore_entities, async_add_entities)
 
 
-class ChoreAssigneeSelect(CoordinatorEntity, SelectEntity):
+class ChoreAssigneeSelect(SimpleChoresChoreEntity, SelectEntity):
     """Select entity to change who a chore is assigned to."""
 
     def __init__(
@@ -59,72 +53,22 @@ class ChoreAssigneeSelect(CoordinatorEntity, SelectEntity):
         chore_name: str,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self.chore_id = chore_id
-        self.chore_name = chore_name
-        self._entry = entry
-        self._attr_has_entity_name = True
+        super().__init__(coordinator, entry, chore_id, chore_name)
         self._attr_name = "Assigned to"
         self._attr_unique_id = f"{DOMAIN}_{chore_id}_assigned_to"
         self._attr_icon = "mdi:account-arrow-right"
         self._attr_entity_id = f"{DOMAIN}.{chore_id}_assigned_to"
 
-    def _get_related_entity_ids(self) -> dict[str, str]:
-        """Get all related entity IDs for this chore."""
-        return {
-            "status": f"select.{self.chore_id}_status",
-            "assigned_to": f"select.{self.chore_id}_assigned_to",
-            "mark_completed_by": f"select.{self.chore_id}_mark_completed_by",
-            "points": f"number.{self.chore_id}_points",
-            "due_date": f"date.{self.chore_id}_due_date",
-        }
-
-    def _get_device_id(self) -> str | None:
-        """Get the device_id for this entity's device."""
-        device_registry = dr.async_get(self.hass)
-        device = device_registry.async_get_device(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")}
-        )
-        if device:
-            return device.id
-        return None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this chore."""
-        # Get chore from storage to show status and assigned member
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
-        
-        if chore:
-            hw_info = f"{chore.status.capitalize()}"
-            if chore.assigned_to:
-                hw_info += f" • Assigned to {chore.assigned_to}"
-        else:
-            hw_info = "Unknown"
-        
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")},
-            name=self.chore_name,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL_CHORE,
-            sw_version=DEVICE_SW_VERSION,
-            hw_version=hw_info,
-            suggested_area="Chores",
-        )
-
     @property
     def options(self) -> list[str]:
         """Return list of possible assignees for this chore."""
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
+        chore = self.coordinator.data.chores.get(self.chore_id)
         
         if chore and chore.possible_assignees:
-            return chore.possible_assignees
+            return list(chore.possible_assignees)
         
         # Fallback to all members if no specific assignees
-        members = storage.get_members()
-        return list(members.keys())
+        return list(self.coordinator.data.members)
 
     @property
     def extra_state_attributes(self) -> dict[str, any]:
@@ -143,8 +87,7 @@ class ChoreAssigneeSelect(CoordinatorEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the currently assigned member."""
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
+        chore = self.coordinator.data.chores.get(self.chore_id)
         
         if chore:
             return chore.assigned_to
@@ -166,21 +109,21 @@ class ChoreAssigneeSelect(CoordinatorEntity, SelectEntity):
             return
         
         # Assign chore to member
-        chore.assign_to_member(option)
+        chore.assign_to_member(member.member_id)
         
         # Update storage
         storage.update_chore(self.chore_id, chore)
         await storage.async_save()
         
-        # Force immediate coordinator refresh to update all entities
-        await self.coordinator.async_refresh()
+        # Update the entities of this chore and of its old and new assignee
+        self.coordinator.async_publish_changes(chore_ids=[self.chore_id])
         
         LOGGER.info(
             f"Chore '{self.chore_name}' assigned to {option}"
         )
 
 
-class ChoreCompletedBySelect(CoordinatorEntity, SelectEntity):
+class ChoreCompletedBySelect(SimpleChoresChoreEntity, SelectEntity):
     """Select entity to mark a chore as completed by a specific member."""
 
     def __init__(
@@ -191,65 +134,15 @@ class ChoreCompletedBySelect(CoordinatorEntity, SelectEntity):
         chore_name: str,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self.chore_id = chore_id
-        self.chore_name = chore_name
-        self._entry = entry
-        self._attr_has_entity_name = True
+        super().__init__(coordinator, entry, chore_id, chore_name)
         self._attr_name = "Mark completed by"
         self._attr_unique_id = f"{DOMAIN}_{chore_id}_mark_completed_by"
         self._attr_icon = "mdi:account-check"
 
-    def _get_related_entity_ids(self) -> dict[str, str]:
-        """Get all related entity IDs for this chore."""
-        return {
-            "status": f"select.{self.chore_id}_status",
-            "assigned_to": f"select.{self.chore_id}_assigned_to",
-            "mark_completed_by": f"select.{self.chore_id}_mark_completed_by",
-            "points": f"number.{self.chore_id}_points",
-            "due_date": f"date.{self.chore_id}_due_date",
-        }
-
-    def _get_device_id(self) -> str | None:
-        """Get the device_id for this entity's device."""
-        device_registry = dr.async_get(self.hass)
-        device = device_registry.async_get_device(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")}
-        )
-        if device:
-            return device.id
-        return None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this chore."""
-        # Get chore from storage to show status and assigned member
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
-        
-        if chore:
-            hw_info = f"{chore.status.capitalize()}"
-            if chore.assigned_to:
-                hw_info += f" • Assigned to {chore.assigned_to}"
-        else:
-            hw_info = "Unknown"
-        
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")},
-            name=self.chore_name,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL_CHORE,
-            sw_version=DEVICE_SW_VERSION,
-            hw_version=hw_info,
-            suggested_area="Chores",
-        )
-
     @property
     def options(self) -> list[str]:
         """Return list of available members."""
-        storage = self.coordinator.storage
-        members = storage.get_members()
-        return list(members.keys())
+        return list(self.coordinator.data.members)
 
     @property
     def extra_state_attributes(self) -> dict[str, any]:
@@ -285,21 +178,28 @@ class ChoreCompletedBySelect(CoordinatorEntity, SelectEntity):
             return
         
         # Mark chore as completed (handles points and counter updates)
-        chore.mark_completed(option, storage, date.today())
+        chore.mark_completed(option, storage, dt_util.now().date())
         
         # Update storage
         storage.update_chore(self.chore_id, chore)
-        await storage.async_save()
+        await storage.async_journal(
+            JOURNAL_OP_COMPLETION,
+            chore_ids=[self.chore_id],
+            member_names=[option],
+            member=option,
+        )
         
-        # Force immediate coordinator refresh to update all entities
-        await self.coordinator.async_refresh()
+        # Update the entities of this chore and of the completing member
+        self.coordinator.async_publish_changes(
+            chore_ids=[self.chore_id], member_names=[option]
+        )
         
         LOGGER.info(
             f"Chore '{self.chore_name}' marked as completed by {option}"
         )
 
 
-class ChoreStatusSelect(CoordinatorEntity, SelectEntity):
+class ChoreStatusSelect(SimpleChoresChoreEntity, SelectEntity):
     """Select entity to change chore status."""
 
     def __init__(
@@ -310,58 +210,11 @@ class ChoreStatusSelect(CoordinatorEntity, SelectEntity):
         chore_name: str,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self.chore_id = chore_id
-        self.chore_name = chore_name
-        self._entry = entry
-        self._attr_has_entity_name = True
+        super().__init__(coordinator, entry, chore_id, chore_name)
         self._attr_name = "Status"
         self._attr_unique_id = f"{DOMAIN}_{chore_id}_status"
         self._attr_icon = "mdi:clipboard-check"
 
-    def _get_related_entity_ids(self) -> dict[str, str]:
-        """Get all related entity IDs for this chore."""
-        return {
-            "status": f"select.{self.chore_id}_status",
-            "assigned_to": f"select.{self.chore_id}_assigned_to",
-            "mark_completed_by": f"select.{self.chore_id}_mark_completed_by",
-            "points": f"number.{self.chore_id}_points",
-            "due_date": f"date.{self.chore_id}_due_date",
-        }
-
-    def _get_device_id(self) -> str | None:
-        """Get the device_id for this entity's device."""
-        device_registry = dr.async_get(self.hass)
-        device = device_registry.async_get_device(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")}
-        )
-        if device:
-            return device.id
-        return None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this chore."""
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
-        
-        if chore:
-            hw_info = f"{chore.status.capitalize()}"
-            if chore.assigned_to:
-                hw_info += f" • Assigned to {chore.assigned_to}"
-        else:
-            hw_info = "Unknown"
-        
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")},
-            name=self.chore_name,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL_CHORE,
-            sw_version=DEVICE_SW_VERSION,
-            hw_version=hw_info,
-            suggested_area="Chores",
-        )
-
     @property
     def options(self) -> list[str]:
         """Return list of available status options."""
@@ -370,8 +223,7 @@ class ChoreStatusSelect(CoordinatorEntity, SelectEntity):
     @property
     def extra_state_attributes(self) -> dict[str, any]:
         """Return extra state attributes."""
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
+        chore = self.coordinator.data.chores.get(self.chore_id)
         
         attrs = {
             "integration": DOMAIN,
@@ -389,18 +241,10 @@ class ChoreStatusSelect(CoordinatorEntity, SelectEntity):
             if chore.assigned_to:
                 attrs["assigned_to"] = chore.assigned_to
             
-            # Add due_date attribute
+            # Add due_date and due_in_days attributes
             if chore.due_date:
-                attrs["due_date"] = chore.due_date
-                
-                # Calculate and add due_in_days
-                try:
-                    due_date = date.fromisoformat(chore.due_date)
-                    today = date.today()
-                    due_in_days = (due_date - today).days
-                    attrs["due_in_days"] = due_in_days
-                except (ValueError, TypeError):
-                    pass
+                attrs["due_date"] = chore.due_date.isoformat()
+                attrs["due_in_days"] = chore.due_in_days
             
             # Add area information
             if chore.area_id:
@@ -416,8 +260,7 @@ class ChoreStatusSelect(CoordinatorEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current status."""
-        storage = self.coordinator.storage
-        chore = storage.get_chore(self.chore_id)
+        chore = self.coordinator.data.chores.get(self.chore_id)
         
         if chore:
             return chore.status
@@ -433,25 +276,37 @@ class ChoreStatusSelect(CoordinatorEntity, SelectEntity):
             return
         
         # Update chore status based on selection
+        operation = JOURNAL_OP_RESCHEDULE
+        completed_by = None
         if option == CHORE_STATE_PENDING:
             chore.mark_pending()
         elif option == CHORE_STATE_OVERDUE:
             chore.mark_overdue()
         elif option == CHORE_STATE_COMPLETED:
+            operation = JOURNAL_OP_COMPLETION
             # When marking as completed manually, use the assigned member if available
             # Otherwise, don't award points to anyone
-            if chore.assigned_to:
-                chore.mark_completed(chore.assigned_to, storage)
+            completed_by = storage.get_member_name(chore.assigned_to)
+            if completed_by:
+                chore.mark_completed(completed_by, storage)
             else:
                 chore.status = CHORE_STATE_COMPLETED
-                chore.last_completed = date.today().isoformat()
+                chore.last_completed = dt_util.now().date()
         
         # Update storage
         storage.update_chore(self.chore_id, chore)
-        await storage.async_save()
+        await storage.async_journal(
+            operation,
+            chore_ids=[self.chore_id],
+            member_names=[completed_by] if completed_by else [],
+            member=completed_by,
+        )
         
-        # Force immediate coordinator refresh to update all entities
-        await self.coordinator.async_refresh()
+        # Update the entities of this chore and of the completing member
+        self.coordinator.async_publish_changes(
+            chore_ids=[self.chore_id],
+            member_names=[completed_by] if completed_by else [],
+        )
         
         LOGGER.info(
             f"Chore '{self.chore_name}' status updated to {option}"
@@ -12,9 +12,6 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers import device_registry as dr
 
 from .const import (
     DOMAIN,
@@ -22,10 +19,6 @@ from .const import (
     CONF_POINTS_LABEL,
     DEFAULT_POINTS_LABEL,
     LOGGER,
-    DEVICE_MANUFACTURER,
-    DEVICE_MODEL_MEMBER,
-    DEVICE_MODEL_CHORE,
-    DEVICE_SW_VERSION,
     ICON_POINTS,
     ICON_CHORES_COMPLETED,
     ICON_PENDING_CHORES,
@@ -34,17 +27,13 @@ from .const import (
     SENSOR_NAME_PENDING_CHORES,
     SENSOR_NAME_OVERDUE_CHORES,
     UNIT_CHORES,
-    DATA_CHORES,
-    CHORE_FIELD_ASSIGNED_TO,
-    CHORE_FIELD_STATUS,
-    CHORE_STATE_PENDING,
-    CHORE_STATE_OVERDUE,
     TRACKER_PERIOD_TODAY,
     TRACKER_PERIOD_THIS_WEEK,
     TRACKER_PERIOD_THIS_MONTH,
     TRACKER_PERIOD_THIS_YEAR,
 )
 from .coordinator import SimpleChoresCoordinator
+from .entity import SimpleChoresChoreEntity, SimpleChoresMemberEntity
 
 
 async def async_setup_entry(
@@ -57,7 +46,7 @@ async def async_setup_entry(
     storage = hass.data[DOMAIN][entry.entry_id]["storage"]
     
     # Get members from storage (not entry.data)
-    member_names = list(storage.get_members().keys())
+    members = list(storage.get_members().values())
     
     # Get chores from storage
     chores = storage.get_chores()
@@ -65,62 +54,40 @@ async def async_setup_entry(
     entities = []
     
     # Member sensors
-    for member_name in member_names:
+    for member in members:
+        member_id, member_name = member.member_id, member.name
         # Points tracking sensors
-        entities.append(MemberPointsSensor(coordinator, entry, member_name, TRACKER_PERIOD_TODAY))
-        entities.append(MemberPointsSensor(coordinator, entry, member_name, TRACKER_PERIOD_THIS_WEEK))
-        entities.append(MemberPointsSensor(coordinator, entry, member_name, TRACKER_PERIOD_THIS_MONTH))
-        entities.append(MemberPointsSensor(coordinator, entry, member_name, TRACKER_PERIOD_THIS_YEAR))
+        entities.append(MemberPointsSensor(coordinator, entry, member_id, member_name, TRACKER_PERIOD_TODAY))
+        entities.append(MemberPointsSensor(coordinator, entry, member_id, member_name, TRACKER_PERIOD_THIS_WEEK))
+        entities.append(MemberPointsSensor(coordinator, entry, member_id, member_name, TRACKER_PERIOD_THIS_MONTH))
+        entities.append(MemberPointsSensor(coordinator, entry, member_id, member_name, TRACKER_PERIOD_THIS_YEAR))
         
         # Chore completion tracking sensors
-        entities.append(MemberChoresSensor(coordinator, entry, member_name, TRACKER_PERIOD_TODAY))
-        entities.append(MemberChoresSensor(coordinator, entry, member_name, TRACKER_PERIOD_THIS_WEEK))
-        entities.append(MemberChoresSensor(coordinator, entry, member_name, TRACKER_PERIOD_THIS_MONTH))
-        entities.append(MemberChoresSensor(coordinator, entry, member_name, TRACKER_PERIOD_THIS_YEAR))
+        entities.append(MemberChoresSensor(coordinator, entry, member_id, member_name, TRACKER_PERIOD_TODAY))
+        entities.append(MemberChoresSensor(coordinator, entry, member_id, member_name, TRACKER_PERIOD_THIS_WEEK))
+        entities.append(MemberChoresSensor(coordinator, entry, member_id, member_name, TRACKER_PERIOD_THIS_MONTH))
+        entities.append(MemberChoresSensor(coordinator, entry, member_id, member_name, TRACKER_PERIOD_THIS_YEAR))
         
         # Status sensors
-        entities.append(MemberPendingChoresSensor(coordinator, entry, member_name))
-        entities.append(MemberOverdueChoresSensor(coordinator, entry, member_name))
-        entities.append(MemberAssignedChoreEntitiesSensor(coordinator, entry, member_name))
+        entities.append(MemberPendingChoresSensor(coordinator, entry, member_id, member_name))
+        entities.append(MemberOverdueChoresSensor(coordinator, entry, member_id, member_name))
+        entities.append(MemberAssignedChoreEntitiesSensor(coordinator, entry, member_id, member_name))
 
     async_add_entities(entities)
 
 
-class SimpleChoresBaseSensor(CoordinatorEntity, SensorEntity):
+class SimpleChoresBaseSensor(SimpleChoresMemberEntity, SensorEntity):
     """Base class for SimpleChores sensors."""
 
     def __init__(
         self,
         coordinator: SimpleChoresCoordinator,
         entry: ConfigEntry,
+        member_id: int,
         member_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.member_name = member_name
-        self._entry = entry
-        self._attr_has_entity_name = True
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this member."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"member_{self.member_name}")},
-            name=self.member_name,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL_MEMBER,
-            sw_version=DEVICE_SW_VERSION,
-        )
-
-    def _get_device_id(self) -> str | None:
-        """Get the device_id for this entity's device."""
-        device_registry = dr.async_get(self.hass)
-        device = device_registry.async_get_device(
-            identifiers={(DOMAIN, f"member_{self.member_name}")}
-        )
-        if device:
-            return device.id
-        return None
+        super().__init__(coordinator, entry, member_id, member_name)
 
     @property
     def extra_state_attributes(self) -> dict[str, any]:
@@ -141,15 +108,16 @@ class MemberPointsSensor(SimpleChoresBaseSensor):
         self,
         coordinator: SimpleChoresCoordinator,
         entry: ConfigEntry,
+        member_id: int,
         member_name: str,
         period: str,
     ) -> None:
         """Initialize the points sensor."""
-        super().__init__(coordinator, entry, member_name)
+        super().__init__(coordinator, entry, member_id, member_name)
         self.period = period
         points_label = entry.data.get(CONF_POINTS_LABEL, DEFAULT_POINTS_LABEL)
         self._attr_name = f"{points_label} earned {period.replace('_', ' ')}"
-        self._attr_unique_id = f"{DOMAIN}_{member_name}_points_earned_{period}"
+        self._attr_unique_id = f"{DOMAIN}_member_{member_id}_points_earned_{period}"
         self._attr_icon = ICON_POINTS
         self._attr_state_class = SensorStateClass.TOTAL
         self._attr_native_unit_of_measurement = points_label.lower()
@@ -157,13 +125,10 @@ class MemberPointsSensor(SimpleChoresBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        # Get member from storage
-        member = self.coordinator.storage.get_member(self.member_name)
+        member = self.coordinator.data.members.get(self.member_name)
         if member is None:
             return 0
-        
-        # Get points for the period
-        return member.get_points(self.period)
+        return member.points[self.period]
 
 
 class MemberChoresSensor(SimpleChoresBaseSensor):
@@ -173,14 +138,15 @@ class MemberChoresSensor(SimpleChoresBaseSensor):
         self,
         coordinator: SimpleChoresCoordinator,
         entry: ConfigEntry,
+        member_id: int,
         member_name: str,
         period: str,
     ) -> None:
         """Initialize the chores sensor."""
-        super().__init__(coordinator, entry, member_name)
+        super().__init__(coordinator, entry, member_id, member_name)
         self.period = period
         self._attr_name = f"{SENSOR_NAME_CHORES_COMPLETED} {period.replace('_', ' ')}"
-        self._attr_unique_id = f"{DOMAIN}_{member_name}_chores_{period}"
+        self._attr_unique_id = f"{DOMAIN}_member_{member_id}_chores_{period}"
         self._attr_icon = ICON_CHORES_COMPLETED
         self._attr_state_class = SensorStateClass.TOTAL
         self._attr_native_unit_of_measurement = UNIT_CHORES
@@ -188,13 +154,10 @@ class MemberChoresSensor(SimpleChoresBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        # Get member from storage
-        member = self.coordinator.storage.get_member(self.member_name)
+        member = self.coordinator.data.members.get(self.member_name)
         if member is None:
             return 0
-        
-        # Get chores completed for the period
-        return member.get_chores_completed(self.period)
+        return member.chores_completed[self.period]
 
 
 class MemberPendingChoresSensor(SimpleChoresBaseSensor):
@@ -204,12 +167,13 @@ class MemberPendingChoresSensor(SimpleChoresBaseSensor):
         self,
         coordinator: SimpleChoresCoordinator,
         entry: ConfigEntry,
+        member_id: int,
         member_name: str,
     ) -> None:
         """Initialize the pending chores sensor."""
-        super().__init__(coordinator, entry, member_name)
+        super().__init__(coordinator, entry, member_id, member_name)
         self._attr_name = SENSOR_NAME_PENDING_CHORES
-        self._attr_unique_id = f"{DOMAIN}_{member_name}_pending_chores"
+        self._attr_unique_id = f"{DOMAIN}_member_{member_id}_pending_chores"
         self._attr_icon = ICON_PENDING_CHORES
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UNIT_CHORES
@@ -217,17 +181,10 @@ class MemberPendingChoresSensor(SimpleChoresBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the number of pending chores."""
-        # Get all chores from storage
-        chores = self.coordinator.storage.data.get(DATA_CHORES, {})
-        
-        # Count pending chores assigned to this member
-        pending_count = 0
-        for chore_id, chore_data in chores.items():
-            if chore_data.get(CHORE_FIELD_ASSIGNED_TO) == self.member_name:
-                if chore_data.get(CHORE_FIELD_STATUS) == CHORE_STATE_PENDING:
-                    pending_count += 1
-        
-        return pending_count
+        member = self.coordinator.data.members.get(self.member_name)
+        if member is None:
+            return 0
+        return len(member.pending_chore_ids)
 
 
 class MemberOverdueChoresSensor(SimpleChoresBaseSensor):
@@ -237,12 +194,13 @@ class MemberOverdueChoresSensor(SimpleChoresBaseSensor):
         self,
         coordinator: SimpleChoresCoordinator,
         entry: ConfigEntry,
+        member_id: int,
         member_name: str,
     ) -> None:
         """Initialize the overdue chores sensor."""
-        super().__init__(coordinator, entry, member_name)
+        super().__init__(coordinator, entry, member_id, member_name)
         self._attr_name = SENSOR_NAME_OVERDUE_CHORES
-        self._attr_unique_id = f"{DOMAIN}_{member_name}_overdue_chores"
+        self._attr_unique_id = f"{DOMAIN}_member_{member_id}_overdue_chores"
         self._attr_icon = ICON_OVERDUE_CHORES
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = UNIT_CHORES
@@ -250,17 +208,10 @@ class MemberOverdueChoresSensor(SimpleChoresBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the number of overdue chores."""
-        # Get all chores from storage
-        chores = self.coordinator.storage.data.get(DATA_CHORES, {})
-        
-        # Count overdue chores assigned to this member
-        overdue_count = 0
-        for chore_id, chore_data in chores.items():
-            if chore_data.get(CHORE_FIELD_ASSIGNED_TO) == self.member_name:
-                if chore_data.get(CHORE_FIELD_STATUS) == CHORE_STATE_OVERDUE:
-                    overdue_count += 1
-        
-        return overdue_count
+        member = self.coordinator.data.members.get(self.member_name)
+        if member is None:
+            return 0
+        return len(member.overdue_chore_ids)
 
 
 class MemberAssignedChoreEntitiesSensor(SimpleChoresBaseSensor):
@@ -270,34 +221,31 @@ class MemberAssignedChoreEntitiesSensor(SimpleChoresBaseSensor):
         self,
         coordinator: SimpleChoresCoordinator,
         entry: ConfigEntry,
+        member_id: int,
         member_name: str,
     ) -> None:
         """Initialize the assigned chore entities sensor."""
-        super().__init__(coordinator, entry, member_name)
+        super().__init__(coordinator, entry, member_id, member_name)
         self._attr_name = "Assigned chore entities"
-        self._attr_unique_id = f"{DOMAIN}_{member_name}_assigned_chore_entities"
+        self._attr_unique_id = f"{DOMAIN}_member_{member_id}_assigned_chore_entities"
         self._attr_icon = "mdi:format-list-bulleted"
 
     @property
     def native_value(self) -> int:
         """Return the count of assigned chores."""
-        chores = self.coordinator.storage.get_chores()
-        assigned_count = sum(
-            1 for chore in chores.values() 
-            if chore.assigned_to == self.member_name
-        )
-        return assigned_count
+        member = self.coordinator.data.members.get(self.member_name)
+        if member is None:
+            return 0
+        return len(member.assigned_chore_ids)
 
     @property
     def extra_state_attributes(self) -> dict[str, any]:
         """Return extra state attributes including list of entity IDs."""
-        chores = self.coordinator.storage.get_chores()
-        
         # Get list of status entity IDs for chores assigned to this member
+        member = self.coordinator.data.members.get(self.member_name)
         entity_ids = [
             f"select.{chore_id}_status"
-            for chore_id, chore in chores.items()
-            if chore.assigned_to == self.member_name
+            for chore_id in (member.assigned_chore_ids if member else ())
         ]
         
         attrs = {
@@ -313,7 +261,7 @@ class MemberAssignedChoreEntitiesSensor(SimpleChoresBaseSensor):
 # === Chore Sensors ===
 
 
-class SimpleChoresChoreBaseSensor(CoordinatorEntity, SensorEntity):
+class SimpleChoresChoreBaseSensor(SimpleChoresChoreEntity, SensorEntity):
     """Base class for Chore sensors."""
 
     def __init__(
@@ -324,55 +272,8 @@ class SimpleChoresChoreBaseSensor(CoordinatorEntity, SensorEntity):
         chore_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.chore_id = chore_id
-        self.chore_name = chore_name
-        self._entry = entry
-        self._attr_has_entity_name = True
+        super().__init__(coordinator, entry, chore_id, chore_name)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this chore."""
-        # Get chore from storage to show status and assigned member
-        chore = self.coordinator.storage.get_chore(self.chore_id)
-        
-        if chore:
-            hw_info = f"{chore.status.capitalize()}"
-            if chore.assigned_to:
-                hw_info += f" • Assigned to {chore.assigned_to}"
-        else:
-            hw_info = "Unknown"
-        
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")},
-            name=self.chore_name,
-            manufacturer=DEVICE_MANUFACTURER,
-            model=DEVICE_MODEL_CHORE,
-            sw_version=DEVICE_SW_VERSION,
-            hw_version=hw_info,
-            suggested_area="Chores",
-        )
-
-    def _get_related_entity_ids(self) -> dict[str, str]:
-        """Get all related entity IDs for this chore."""
-        return {
-            "status": f"select.{self.chore_id}_status",
-            "assigned_to": f"select.{self.chore_id}_assigned_to",
-            "mark_completed_by": f"select.{self.chore_id}_mark_completed_by",
-            "points": f"number.{self.chore_id}_points",
-            "due_date": f"date.{self.chore_id}_due_date",
-        }
-    
-    def _get_device_id(self) -> str | None:
-        """Get the device_id for this entity's device."""
-        device_registry = dr.async_get(self.hass)
-        device = device_registry.async_get_device(
-            identifiers={(DOMAIN, f"chore_{self.chore_id}")}
-        )
-        if device:
-            return device.id
-        return None
-    
     @property
     def extra_state_attributes(self) -> dict[str, any]:
         """Return extra state attributes."""
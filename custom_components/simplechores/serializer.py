@@ -0,0 +1,59 @@
+"""Field-table driven serializers for SimpleChores models."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class StoredField:
+    """How a model attribute is written to and read from storage.
+
+    ``dump`` converts the attribute value to its stored form and ``load``
+    converts a stored value (or ``default`` if the key is missing) back.
+    Fields with ``loaded=False`` are written but not passed to the
+    constructor (e.g. fields with ``init=False``).
+    """
+
+    name: str
+    default: Any = None
+    dump: Callable[[Any], Any] | None = None
+    load: Callable[[Any], Any] | None = None
+    loaded: bool = True
+
+
+def compile_to_dict(fields: Iterable[StoredField]) -> Callable[[Any], Dict[str, Any]]:
+    """Generate a function returning the stored dict of a model instance.
+
+    The function is generated from the field table once, so serializing
+    costs one dict display with a direct attribute read per field.
+    """
+    namespace: Dict[str, Any] = {}
+    items = []
+    for index, stored_field in enumerate(fields):
+        value = f"obj.{stored_field.name}"
+        if stored_field.dump is not None:
+            namespace[f"_dump_{index}"] = stored_field.dump
+            value = f"_dump_{index}({value})"
+        items.append(f"{stored_field.name!r}: {value}")
+    source = "def to_dict(obj):\n    return {" + ", ".join(items) + "}\n"
+    exec(source, namespace)  # noqa: S102 - source is built from the field table only
+    return namespace["to_dict"]
+
+
+def compile_from_dict(fields: Iterable[StoredField]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Generate a function returning the constructor arguments for a stored dict."""
+    namespace: Dict[str, Any] = {}
+    items = []
+    for index, stored_field in enumerate(fields):
+        if not stored_field.loaded:
+            continue
+        namespace[f"_default_{index}"] = stored_field.default
+        value = f"data.get({stored_field.name!r}, _default_{index})"
+        if stored_field.load is not None:
+            namespace[f"_load_{index}"] = stored_field.load
+            value = f"_load_{index}({value})"
+        items.append(f"{stored_field.name!r}: {value}")
+    source = "def from_dict(data):\n    return {" + ", ".join(items) + "}\n"
+    exec(source, namespace)  # noqa: S102 - source is built from the field table only
+    return namespace["from_dict"]
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
 from datetime import date, timedelta
+from itertools import islice
 
 from .const import (
     DOMAIN,
@@ -14,6 +16,14 @@ from .const import (
     SERVICE_TOGGLE_CHORE,
     SERVICE_UPDATE_CHORES,
     SERVICE_RESCHEDULE_CHORE,
+    SERVICE_COMPLETE_CHORES,
+    SERVICE_QUERY_CHORES,
+    SERVICE_FORECAST,
+    SERVICE_RECOMPUTE_SCHEDULE,
+    JOURNAL_OP_COMPLETION,
+    JOURNAL_OP_RESCHEDULE,
+    JOURNAL_OP_POINTS_OFFSET,
+    JOURNAL_OP_RESET,
     TRACKER_PERIOD_TODAY,
     TRACKER_PERIOD_THIS_WEEK,
     TRACKER_PERIOD_THIS_MONTH,
@@ -21,6 +31,13 @@ from .const import (
     CHORE_STATE_PENDING,
     CHORE_STATE_COMPLETED,
     CHORE_STATE_OVERDUE,
+    CHORE_FIELD_STATUS,
+    CHORE_FIELD_AREA_ID,
+    CHORE_FIELD_DUE_DATE,
+    CHORE_RESULT_COMPLETED,
+    CHORE_RESULT_ALREADY_COMPLETED,
+    CHORE_RESULT_NOT_FOUND,
+    CHORE_RESULT_MEMBER_NOT_FOUND,
 )
 
 # Service schemas
@@ -37,17 +54,148 @@ RESET_POINTS_SCHEMA = vol.Schema({
         vol.All(cv.ensure_list, [vol.In([TRACKER_PERIOD_TODAY, TRACKER_PERIOD_THIS_WEEK, TRACKER_PERIOD_THIS_MONTH, TRACKER_PERIOD_THIS_YEAR])]),
 })
 
-TOGGLE_CHORE_SCHEMA = vol.Schema({
-    vol.Required("entity_id"): cv.entity_id,
-    vol.Required("member"): cv.string,
+# Chores can be targeted by entity, chore ID, device or area
+CHORE_TARGET_FIELDS = {
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Optional("chore_id"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional("device_id"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional("area_id"): vol.All(cv.ensure_list, [cv.string]),
+}
+CHORE_TARGET_KEYS = ("entity_id", "chore_id", "device_id", "area_id")
+
+TOGGLE_CHORE_SCHEMA = vol.All(
+    vol.Schema({
+        **CHORE_TARGET_FIELDS,
+        vol.Required("member"): cv.string,
+    }),
+    cv.has_at_least_one_key(*CHORE_TARGET_KEYS),
+)
+
+RESCHEDULE_CHORE_SCHEMA = vol.All(
+    vol.Schema({
+        **CHORE_TARGET_FIELDS,
+        vol.Optional("due_date"): cv.date,
+        vol.Optional("days_from_now"): vol.Coerce(int),
+    }),
+    cv.has_at_least_one_key(*CHORE_TARGET_KEYS),
+)
+
+COMPLETE_CHORES_SCHEMA = vol.All(
+    vol.Schema({
+        **CHORE_TARGET_FIELDS,
+        vol.Optional("assigned_to"): cv.string,
+        vol.Optional("member"): cv.string,
+    }),
+    cv.has_at_least_one_key(*CHORE_TARGET_KEYS, "assigned_to"),
+)
+
+QUERY_CHORES_SCHEMA = vol.Schema({
+    vol.Optional("member"): cv.string,
+    vol.Optional("area_id"): cv.string,
+    vol.Optional("status"): vol.All(
+        cv.ensure_list, [vol.In([CHORE_STATE_PENDING, CHORE_STATE_COMPLETED, CHORE_STATE_OVERDUE])]
+    ),
+    vol.Optional("due_from"): cv.date,
+    vol.Optional("due_to"): cv.date,
+    vol.Optional("sort_by", default="due_date"): vol.In(["due_date", "name", "points"]),
+    vol.Optional("descending", default=False): cv.boolean,
+    vol.Optional("limit", default=50): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+    vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+})
+
+FORECAST_SCHEMA = vol.Schema({
+    vol.Optional("start_date"): cv.date,
+    vol.Optional("days", default=30): vol.All(vol.Coerce(int), vol.Range(min=1, max=366)),
+    vol.Optional("member"): cv.string,
 })
 
-RESCHEDULE_CHORE_SCHEMA = vol.Schema({
-    vol.Required("entity_id"): cv.entity_id,
-    vol.Optional("due_date"): cv.date,
-    vol.Optional("days_from_now"): vol.Coerce(int),
+RECOMPUTE_SCHEDULE_SCHEMA = vol.Schema({
+    vol.Optional("date"): cv.date,
 })
 
+# Sort keys for query_chores; chores without a due date sort last
+QUERY_SORT_KEYS = {
+    "due_date": lambda chore: (chore.due_date is None, chore.due_date or date.min, chore.name),
+    "name": lambda chore: (chore.name.casefold(), chore.due_date or date.min),
+    "points": lambda chore: (chore.points, chore.name),
+}
+
+
+def _iso(value: date | None) -> str | None:
+    """Format a date for a service response."""
+    return value.isoformat() if value is not None else None
+
+
+def _forecast_load(days: dict[date, list[int]]) -> dict:
+    """Format the per-day chore count and points of one member."""
+    return {
+        "chores": sum(chores for chores, _ in days.values()),
+        "points": sum(points for _, points in days.values()),
+        "days": {
+            day.isoformat(): {"chores": chores, "points": points}
+            for day, (chores, points) in sorted(days.items())
+        },
+    }
+
+
+def _resolve_chore_ids(entry_data: dict, data: dict) -> list[str]:
+    """Resolve the chore targets of a service call to chore IDs.
+
+    Targets are resolved through the entity map and the chore index, in
+    call order and without duplicates.
+    """
+    storage = entry_data["storage"]
+    entity_map = entry_data["entity_map"]
+    chore_ids: dict[str, None] = {}
+
+    for entity_id in data.get("entity_id", []):
+        if (chore_id := entity_map.chore_id_for_entity(entity_id)) is None:
+            LOGGER.error(f"Entity {entity_id} is not a SimpleChores chore entity")
+            continue
+        chore_ids[chore_id] = None
+    for chore_id in data.get("chore_id", []):
+        chore_ids[chore_id] = None
+    for device_id in data.get("device_id", []):
+        if (chore_id := entity_map.chore_id_for_device(device_id)) is None:
+            LOGGER.error(f"Device {device_id} is not a SimpleChores chore device")
+            continue
+        chore_ids[chore_id] = None
+    for area_id in data.get("area_id", []):
+        chore_ids.update(dict.fromkeys(sorted(storage.get_chore_ids_by(CHORE_FIELD_AREA_ID, area_id))))
+    if (assigned_to := data.get("assigned_to")) is not None:
+        chore_ids.update(dict.fromkeys(sorted(storage.get_assigned_chore_ids(assigned_to))))
+
+    return list(chore_ids)
+
+
+def _query_chore_ids(storage, data: dict) -> set[str]:
+    """Return the IDs of the chores matching the query_chores filters.
+
+    Every filter is answered by the chore index; the candidate sets are
+    intersected starting with the smallest.
+    """
+    member = data.get("member")
+    statuses = data.get("status")
+    candidates = []
+
+    if member is not None and statuses:
+        candidates.append(set().union(*(storage.get_assigned_chore_ids(member, status) for status in statuses)))
+    elif member is not None:
+        candidates.append(storage.get_assigned_chore_ids(member))
+    elif statuses:
+        candidates.append(set().union(*(storage.get_chore_ids_by(CHORE_FIELD_STATUS, status) for status in statuses)))
+    if (area_id := data.get("area_id")) is not None:
+        candidates.append(storage.get_chore_ids_by(CHORE_FIELD_AREA_ID, area_id))
+    due_from = data.get("due_from")
+    due_to = data.get("due_to")
+    if due_from is not None or due_to is not None:
+        candidates.append(storage.get_chore_ids_in_range(CHORE_FIELD_DUE_DATE, due_from, due_to))
+
+    if not candidates:
+        return set(storage.get_chores())
+    candidates.sort(key=len)
+    return set(candidates[0]).intersection(*candidates[1:])
+
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for SimpleChores."""
@@ -74,8 +222,13 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             member.set_points(period, current_points + offset)
         
         storage.update_member(member)
-        await storage.async_save()
-        await coordinator.async_refresh_data()
+        await storage.async_journal(
+            JOURNAL_OP_POINTS_OFFSET,
+            member_names=[member_name],
+            offset=offset,
+            periods=periods,
+        )
+        coordinator.async_publish_changes(member_names=[member_name])
 
         LOGGER.info(
             f"Updated points for {member_name}: offset={offset}, periods={periods}"
@@ -101,38 +254,20 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             member.reset_points(period)
         
         storage.update_member(member)
-        await storage.async_save()
-        await coordinator.async_refresh_data()
+        await storage.async_journal(JOURNAL_OP_RESET, member_names=[member_name], periods=periods)
+        coordinator.async_publish_changes(member_names=[member_name])
 
         LOGGER.info(f"Reset points for {member_name}: periods={periods}")
 
     async def handle_toggle_chore(call: ServiceCall) -> None:
         """Handle the toggle_chore service call."""
-        entity_id = call.data["entity_id"]
         member_name = call.data["member"]
 
-        # Get entity state to read chore_id from attributes
-        entity_state = hass.states.get(entity_id)
-        if entity_state is None:
-            LOGGER.error(f"Entity {entity_id} not found")
-            return
-        
-        # Get chore_id from entity attributes
-        chore_id = entity_state.attributes.get("chore_id")
-        if chore_id is None:
-            LOGGER.error(f"Entity {entity_id} does not have a chore_id attribute")
-            return
-
         # Get the first config entry
         entry_id = next(iter(hass.data[DOMAIN]))
-        storage = hass.data[DOMAIN][entry_id]["storage"]
-        coordinator = hass.data[DOMAIN][entry_id]["coordinator"]
-
-        # Get chore
-        chore = storage.get_chore(chore_id)
-        if chore is None:
-            LOGGER.error(f"Chore '{chore_id}' not found")
-            return
+        entry_data = hass.data[DOMAIN][entry_id]
+        storage = entry_data["storage"]
+        coordinator = entry_data["coordinator"]
 
         # Get member
         member = storage.get_member(member_name)
@@ -140,29 +275,55 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             LOGGER.error(f"Member '{member_name}' not found")
             return
 
-        # Toggle logic
-        
-        if chore.status == CHORE_STATE_COMPLETED:
-            # If completed, mark as pending
-            chore.mark_pending()
-            LOGGER.info(f"Chore '{chore.name}' marked as pending")
-        else:
-            # If pending or overdue, mark as completed (handles points and counter updates)
-            chore.mark_completed(member_name, storage, date.today())
-            
-            LOGGER.info(
-                f"Chore '{chore.name}' marked as completed by {member_name}, "
-                f"awarded {chore.points} points"
+        completed = []
+        reopened = []
+        for chore_id in _resolve_chore_ids(entry_data, call.data):
+            # Get chore
+            chore = storage.get_chore(chore_id)
+            if chore is None:
+                LOGGER.error(f"Chore '{chore_id}' not found")
+                continue
+
+            # Toggle logic
+            if chore.status == CHORE_STATE_COMPLETED:
+                # If completed, mark as pending
+                chore.mark_pending()
+                reopened.append(chore_id)
+                LOGGER.info(f"Chore '{chore.name}' marked as pending")
+            else:
+                # If pending or overdue, mark as completed (handles points and counter updates)
+                chore.mark_completed(member_name, storage, dt_util.now().date())
+                completed.append(chore_id)
+                LOGGER.info(
+                    f"Chore '{chore.name}' marked as completed by {member_name}, "
+                    f"awarded {chore.points} points"
+                )
+
+            # Update chore in storage
+            storage.update_chore(chore_id, chore)
+
+        if not completed and not reopened:
+            return
+
+        # Immediately update the entities of these chores and the member
+        coordinator.async_publish_changes(
+            chore_ids=completed + reopened, member_names=[member_name]
+        )
+
+        # Append to the journal; the full snapshot is rewritten later
+        if completed:
+            await storage.async_journal(
+                JOURNAL_OP_COMPLETION,
+                chore_ids=completed,
+                member_names=[member_name],
+                member=member_name,
+            )
+        if reopened:
+            await storage.async_journal(
+                JOURNAL_OP_RESCHEDULE,
+                chore_ids=reopened,
+                member=member_name,
             )
-        
-        # Update chore in storage
-        storage.update_chore(chore_id, chore)
-        
-        # Immediately update coordinator data to refresh UI
-        coordinator.async_set_updated_data(storage.data)
-        
-        # Save to disk in background (don't await to avoid blocking)
-        hass.async_create_task(storage.async_save())
 
     async def handle_update_chores(call: ServiceCall) -> None:
         """Handle the update_chores service call."""
@@ -171,54 +332,24 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         storage = hass.data[DOMAIN][entry_id]["storage"]
         coordinator = hass.data[DOMAIN][entry_id]["coordinator"]
 
-        # Get all chores
-        chores = storage.get_chores()
-        today = date.today()
-        updated_count = 0
-
-        for chore_id, chore in chores.items():
-            if chore.due_date is None:
-                continue
-            
-            try:
-                due_date = date.fromisoformat(chore.due_date)
-                old_status = chore.status
-                
-                # Update status based on due date
-                if due_date < today:
-                    chore.status = CHORE_STATE_OVERDUE
-                elif due_date == today:
-                    chore.status = CHORE_STATE_PENDING
-                else:
-                    chore.status = CHORE_STATE_COMPLETED
-                
-                # Only update if status changed
-                if old_status != chore.status:
-                    storage.update_chore(chore_id, chore)
-                    updated_count += 1
-                    LOGGER.debug(
-                        f"Chore '{chore.name}' status updated from {old_status} to {chore.status}"
-                    )
-            except (ValueError, TypeError):
-                LOGGER.warning(f"Invalid due_date for chore '{chore.name}': {chore.due_date}")
-                continue
+        # Check every chore, so statuses set by hand are repaired as well
+        updated = storage.update_chore_statuses(dt_util.now().date(), full=True)
 
         # Save and refresh if any changes were made
-        if updated_count > 0:
+        if updated:
             await storage.async_save()
-            coordinator.async_set_updated_data(storage.data)
-            LOGGER.info(f"Updated {updated_count} chore(s) status based on due dates")
+            coordinator.async_publish_changes(chore_ids=updated)
+            LOGGER.info(f"Updated {len(updated)} chore(s) status based on due dates")
         else:
             LOGGER.debug("No chore status updates needed")
 
     async def handle_reschedule_chore(call: ServiceCall) -> None:
         """Handle the reschedule_chore service call."""
-        entity_id = call.data["entity_id"]
         due_date = call.data.get("due_date")
         days_from_now = call.data.get("days_from_now")
 
         # Calculate the target date
-        today = date.today()
+        today = dt_util.now().date()
         if due_date is not None:
             target_date = due_date
         elif days_from_now is not None:
@@ -227,50 +358,188 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             # Default to today if neither is provided
             target_date = today
 
-        # Get entity state to read chore_id from attributes
-        entity_state = hass.states.get(entity_id)
-        if entity_state is None:
-            LOGGER.error(f"Entity {entity_id} not found")
-            return
-        
-        # Get chore_id from entity attributes
-        chore_id = entity_state.attributes.get("chore_id")
-        if chore_id is None:
-            LOGGER.error(f"Entity {entity_id} does not have a chore_id attribute")
+        # Get the first config entry
+        entry_id = next(iter(hass.data[DOMAIN]))
+        entry_data = hass.data[DOMAIN][entry_id]
+        storage = entry_data["storage"]
+        coordinator = entry_data["coordinator"]
+
+        rescheduled = []
+        for chore_id in _resolve_chore_ids(entry_data, call.data):
+            # Get chore
+            chore = storage.get_chore(chore_id)
+            if chore is None:
+                LOGGER.error(f"Chore '{chore_id}' not found")
+                continue
+
+            # Set the new due date
+            chore.due_date = target_date
+
+            # Update status based on new due date
+            if target_date < today:
+                chore.status = CHORE_STATE_OVERDUE
+            elif target_date == today:
+                chore.status = CHORE_STATE_PENDING
+            else:
+                chore.status = CHORE_STATE_COMPLETED
+
+            # Update chore in storage
+            storage.update_chore(chore_id, chore)
+            rescheduled.append(chore_id)
+            LOGGER.info(f"Chore '{chore.name}' rescheduled to {target_date.isoformat()}")
+
+        if not rescheduled:
             return
 
+        # Immediately update the entities of these chores and their assignees
+        coordinator.async_publish_changes(chore_ids=rescheduled)
+
+        # Append to the journal; the full snapshot is rewritten later
+        await storage.async_journal(
+            JOURNAL_OP_RESCHEDULE,
+            chore_ids=rescheduled,
+            due_date=target_date.isoformat(),
+        )
+
+    async def handle_complete_chores(call: ServiceCall) -> ServiceResponse:
+        """Handle the complete_chores service call.
+
+        All targeted chores are completed in one pass, recorded in a single
+        journal record and published in a single targeted update.
+        """
+        # Get the first config entry
+        entry_id = next(iter(hass.data[DOMAIN]))
+        entry_data = hass.data[DOMAIN][entry_id]
+        storage = entry_data["storage"]
+        coordinator = entry_data["coordinator"]
+
+        chore_ids = _resolve_chore_ids(entry_data, call.data)
+
+        today = dt_util.now().date()
+        results = {}
+        completed = []
+        members_changed = set()
+
+        for chore_id in chore_ids:
+            chore = storage.get_chore(chore_id)
+            if chore is None:
+                results[chore_id] = {"result": CHORE_RESULT_NOT_FOUND}
+                continue
+            if chore.status == CHORE_STATE_COMPLETED:
+                results[chore_id] = {"name": chore.name, "result": CHORE_RESULT_ALREADY_COMPLETED}
+                continue
+
+            # Credit the given member, or whoever the chore is assigned to
+            member_name = call.data.get("member") or storage.get_member_name(chore.assigned_to)
+            if member_name is None or storage.get_member(member_name) is None:
+                results[chore_id] = {"name": chore.name, "result": CHORE_RESULT_MEMBER_NOT_FOUND}
+                continue
+
+            chore.mark_completed(member_name, storage, today)
+            storage.update_chore(chore_id, chore)
+            completed.append(chore_id)
+            members_changed.add(member_name)
+            results[chore_id] = {
+                "name": chore.name,
+                "result": CHORE_RESULT_COMPLETED,
+                "completed_by": member_name,
+                "points": chore.points,
+                "due_date": _iso(chore.due_date),
+            }
+
+        if completed:
+            # One targeted update and one journal record for the whole batch
+            coordinator.async_publish_changes(chore_ids=completed, member_names=members_changed)
+            await storage.async_journal(
+                JOURNAL_OP_COMPLETION,
+                chore_ids=completed,
+                member_names=sorted(members_changed),
+            )
+            LOGGER.info(f"Completed {len(completed)} chore(s) in one batch")
+
+        return {"chores": results}
+
+    async def handle_query_chores(call: ServiceCall) -> ServiceResponse:
+        """Handle the query_chores service call."""
         # Get the first config entry
         entry_id = next(iter(hass.data[DOMAIN]))
         storage = hass.data[DOMAIN][entry_id]["storage"]
-        coordinator = hass.data[DOMAIN][entry_id]["coordinator"]
 
-        # Get chore
-        chore = storage.get_chore(chore_id)
-        if chore is None:
-            LOGGER.error(f"Chore '{chore_id}' not found")
-            return
+        chores = [(chore_id, storage.get_chore(chore_id)) for chore_id in _query_chore_ids(storage, call.data)]
+        sort_key = QUERY_SORT_KEYS[call.data["sort_by"]]
+        chores.sort(key=lambda item: sort_key(item[1]), reverse=call.data["descending"])
+        offset = call.data["offset"]
+        page = chores[offset:offset + call.data["limit"]]
+
+        return {
+            "total": len(chores),
+            "chores": [
+                {
+                    "chore_id": chore_id,
+                    "name": chore.name,
+                    "status": chore.status,
+                    "assigned_to": storage.get_member_name(chore.assigned_to),
+                    "due_date": _iso(chore.due_date),
+                    "area_id": chore.area_id,
+                    "points": chore.points,
+                    "last_completed": _iso(chore.last_completed),
+                }
+                for chore_id, chore in page
+            ],
+        }
+
+    async def handle_forecast(call: ServiceCall) -> ServiceResponse:
+        """Handle the forecast service call."""
+        # Get the first config entry
+        entry_id = next(iter(hass.data[DOMAIN]))
+        storage = hass.data[DOMAIN][entry_id]["storage"]
 
-        # Set the new due date
-        chore.due_date = target_date.isoformat()
-        
-        # Update status based on new due date
-        if target_date < today:
-            chore.status = CHORE_STATE_OVERDUE
-        elif target_date == today:
-            chore.status = CHORE_STATE_PENDING
-        else:
-            chore.status = CHORE_STATE_COMPLETED
+        start = call.data.get("start_date") or dt_util.now().date()
+        end = start + timedelta(days=call.data["days"] - 1)
 
-        # Update chore in storage
-        storage.update_chore(chore_id, chore)
-        
-        # Immediately update coordinator data to refresh UI
-        coordinator.async_set_updated_data(storage.data)
-        
-        # Save to disk in background (don't await to avoid blocking)
-        hass.async_create_task(storage.async_save())
+        # Member name (None if unassigned) -> day -> [chores, points]
+        load: dict[str | None, dict[date, list[int]]] = {}
+        for chore in storage.get_chores().values():
+            if chore.due_date is None:
+                continue
+            # Rotations advance once per occurrence before start; count
+            # those instead of visiting them, and skip whole turns
+            skipped = chore.recurrence.count(chore.due_date, start - timedelta(days=1))
+            assignees = islice(chore.iter_assignees(), skipped % max(1, len(chore.possible_assignees)), None)
+            for day, member_id in zip(chore.iter_occurrences(start, end), assignees):
+                name = storage.get_member_name(member_id)
+                totals = load.setdefault(name, {}).setdefault(day, [0, 0])
+                totals[0] += 1
+                totals[1] += chore.points
+
+        response = {
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "members": {
+                name: _forecast_load(load.get(name, {}))
+                for name in storage.get_members()
+                if call.data.get("member") in (None, name)
+            },
+        }
+        if "member" not in call.data:
+            response["unassigned"] = _forecast_load(load.get(None, {}))
+        return response
+
+    async def handle_recompute_schedule(call: ServiceCall) -> ServiceResponse:
+        """Handle the recompute_schedule service call."""
+        entry_id = next(iter(hass.data[DOMAIN]))
+        storage = hass.data[DOMAIN][entry_id]["storage"]
+        coordinator = hass.data[DOMAIN][entry_id]["coordinator"]
+        today = call.data.get("date") or dt_util.now().date()
+
+        # One index update, one listener call and one save for all chores
+        async with storage.async_batch():
+            changed = storage.reschedule_chores(today)
 
-        LOGGER.info(f"Chore '{chore.name}' rescheduled to {target_date.isoformat()}")
+        if changed:
+            coordinator.async_publish_changes(chore_ids=changed)
+        LOGGER.info(f"Recomputed the schedule for {today}: {len(changed)} chore(s) changed")
+        return {"changed": len(changed)}
 
     # Register services
     hass.services.async_register(
@@ -307,7 +576,42 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         schema=RESCHEDULE_CHORE_SCHEMA,
     )
 
-    LOGGER.debug("Services registered: update_points, reset_points, toggle_chore, update_chores, reschedule_chore")
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_COMPLETE_CHORES,
+        handle_complete_chores,
+        schema=COMPLETE_CHORES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_CHORES,
+        handle_query_chores,
+        schema=QUERY_CHORES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FORECAST,
+        handle_forecast,
+        schema=FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECOMPUTE_SCHEDULE,
+        handle_recompute_schedule,
+        schema=RECOMPUTE_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    LOGGER.debug(
+        "Services registered: update_points, reset_points, toggle_chore, update_chores, "
+        "reschedule_chore, complete_chores, query_chores, forecast, recompute_schedule"
+    )
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
@@ -317,4 +621,8 @@ async def async_unload_services(hass: HomeAssistant) -> None:
     hass.services.async_remove(DOMAIN, SERVICE_TOGGLE_CHORE)
     hass.services.async_remove(DOMAIN, SERVICE_UPDATE_CHORES)
     hass.services.async_remove(DOMAIN, SERVICE_RESCHEDULE_CHORE)
+    hass.services.async_remove(DOMAIN, SERVICE_COMPLETE_CHORES)
+    hass.services.async_remove(DOMAIN, SERVICE_QUERY_CHORES)
+    hass.services.async_remove(DOMAIN, SERVICE_FORECAST)
+    hass.services.async_remove(DOMAIN, SERVICE_RECOMPUTE_SCHEDULE)
     LOGGER.debug("Services unloaded")
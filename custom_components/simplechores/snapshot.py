@@ -0,0 +1,144 @@
+"""Immutable coordinator snapshots for SimpleChores."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from types import MappingProxyType
+from typing import Iterable, Mapping, Tuple
+
+from .const import (
+    CHORE_STATE_PENDING,
+    CHORE_STATE_OVERDUE,
+)
+from .member import TRACKER_PERIODS
+
+
+@dataclass(frozen=True)
+class MemberSnapshot:
+    """Values of a member's entities, per tracker period where applicable."""
+
+    name: str
+    points: Mapping[str, int]
+    chores_completed: Mapping[str, int]
+    pending_chore_ids: Tuple[str, ...]
+    overdue_chore_ids: Tuple[str, ...]
+    assigned_chore_ids: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ChoreSnapshot:
+    """Values of a chore's entities, including derived fields.
+
+    Assignees are resolved from member IDs to member names.
+    """
+
+    chore_id: str
+    name: str
+    points: int
+    status: str
+    assigned_to: str | None
+    possible_assignees: Tuple[str, ...]
+    due_date: date | None
+    due_in_days: int | None
+    last_completed: date | None
+    recurrence_pattern: str
+    recurrence_interval: int
+    area_id: str | None
+
+
+@dataclass(frozen=True)
+class SimpleChoresSnapshot:
+    """Everything the entities show, computed once per coordinator update."""
+
+    today: date
+    members: Mapping[str, MemberSnapshot]
+    chores: Mapping[str, ChoreSnapshot]
+
+
+def build_snapshot(storage, today: date) -> SimpleChoresSnapshot:
+    """Compute the snapshot of the current storage state for a day."""
+    return SimpleChoresSnapshot(
+        today=today,
+        members=MappingProxyType({
+            name: _member_snapshot(storage, name, member, today)
+            for name, member in storage.get_members().items()
+        }),
+        chores=MappingProxyType({
+            chore_id: _chore_snapshot(storage, chore_id, chore, today)
+            for chore_id, chore in storage.get_chores().items()
+        }),
+    )
+
+
+def update_snapshot(
+    snapshot: SimpleChoresSnapshot,
+    storage,
+    chore_ids: Iterable[str] = (),
+    member_names: Iterable[str] = (),
+) -> SimpleChoresSnapshot:
+    """Return a copy of a snapshot with only the given chores and members recomputed."""
+    today = snapshot.today
+    chores = dict(snapshot.chores)
+    for chore_id in chore_ids:
+        chore = storage.get_chore(chore_id)
+        if chore is None:
+            chores.pop(chore_id, None)
+        else:
+            chores[chore_id] = _chore_snapshot(storage, chore_id, chore, today)
+
+    members = dict(snapshot.members)
+    for name in member_names:
+        member = storage.get_member(name)
+        if member is None:
+            members.pop(name, None)
+        else:
+            members[name] = _member_snapshot(storage, name, member, today)
+
+    return SimpleChoresSnapshot(
+        today=today,
+        members=MappingProxyType(members),
+        chores=MappingProxyType(chores),
+    )
+
+
+def _chore_snapshot(storage, chore_id: str, chore, today: date) -> ChoreSnapshot:
+    """Compute the snapshot of one chore."""
+    due_date = chore.due_date
+    return ChoreSnapshot(
+        chore_id=chore_id,
+        name=chore.name,
+        points=chore.points,
+        status=chore.status,
+        assigned_to=storage.get_member_name(chore.assigned_to),
+        possible_assignees=tuple(
+            name
+            for member_id in chore.possible_assignees
+            if (name := storage.get_member_name(member_id)) is not None
+        ),
+        due_date=due_date,
+        due_in_days=(due_date - today).days if due_date is not None else None,
+        last_completed=chore.last_completed,
+        recurrence_pattern=chore.recurrence_pattern,
+        recurrence_interval=chore.recurrence_interval,
+        area_id=chore.area_id,
+    )
+
+
+def _member_snapshot(storage, name: str, member, today: date) -> MemberSnapshot:
+    """Compute the snapshot of one member."""
+    return MemberSnapshot(
+        name=name,
+        points=MappingProxyType(
+            {period: member.get_points(period, today) for period in TRACKER_PERIODS}
+        ),
+        chores_completed=MappingProxyType(
+            {period: member.get_chores_completed(period, today) for period in TRACKER_PERIODS}
+        ),
+        pending_chore_ids=tuple(
+            sorted(storage.get_assigned_chore_ids(name, CHORE_STATE_PENDING))
+        ),
+        overdue_chore_ids=tuple(
+            sorted(storage.get_assigned_chore_ids(name, CHORE_STATE_OVERDUE))
+        ),
+        assigned_chore_ids=tuple(sorted(storage.get_assigned_chore_ids(name))),
+    )
@@ -1,118 +1,657 @@
 # storage_manager.py
 from __future__ import annotations
 
-from typing import Dict
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List
 
+from homeassistant.core import callback
 from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, STORAGE_VERSION, DATA_CHORES, DATA_MEMBERS, STORAGE_KEY_PREFIX_LAST_RESET
-from .member import Member
+from .const import (
+    DOMAIN,
+    LOGGER,
+    STORAGE_VERSION,
+    DATA_CHORES,
+    DATA_MEMBERS,
+    DATA_NEXT_MEMBER_ID,
+    DATA_NEXT_CHORE_ID,
+    STORAGE_KEY_PREFIX_LAST_RESET,
+    CHORE_FIELD_ASSIGNED_TO,
+    CHORE_FIELD_POSSIBLE_ASSIGNEES,
+    MEMBER_FIELD_NAME,
+    MEMBER_FIELD_ID,
+    MEMBER_FIELD_PERIOD_KEYS,
+    SAVE_DELAY,
+    SAVE_MAX_DELAY,
+    DATA_JOURNAL_SEQ,
+    JOURNAL_MAX_RECORDS,
+    JOURNAL_SNAPSHOT_INTERVAL,
+)
+from .index import ChoreIndex
+from .journal import SimpleChoresJournal
+from .member import Member, TRACKER_PERIODS, period_key
 from .chore import Chore
+from .recurrence import next_occurrences
+
+
+class SimpleChoresStore(Store):
+    """Store that migrates data saved by older versions of SimpleChores."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.migrated = False
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Migrate stored data to the current storage version."""
+        if old_major_version < 2:
+            _migrate_member_ids(old_data)
+        self.migrated = True
+        return old_data
+
+
+def _migrate_member_ids(data: Dict[str, Any]) -> None:
+    """Give members saved before member IDs an ID and re-key their data.
+
+    Older versions keyed members by name and referenced assignees by name
+    in every chore.
+    """
+    old_members = data.get(DATA_MEMBERS, {})
+    member_ids = {}
+    members_data = {}
+    for member_id, (name, member_data) in enumerate(old_members.items(), start=1):
+        member_ids[name] = member_id
+        members_data[str(member_id)] = {
+            **member_data,
+            MEMBER_FIELD_NAME: name,
+            MEMBER_FIELD_ID: member_id,
+        }
+    data[DATA_MEMBERS] = members_data
+    data[DATA_NEXT_MEMBER_ID] = len(member_ids) + 1
+
+    for chore_data in data.get(DATA_CHORES, {}).values():
+        chore_data[CHORE_FIELD_ASSIGNED_TO] = member_ids.get(chore_data.get(CHORE_FIELD_ASSIGNED_TO))
+        chore_data[CHORE_FIELD_POSSIBLE_ASSIGNEES] = [
+            member_ids[name]
+            for name in chore_data.get(CHORE_FIELD_POSSIBLE_ASSIGNEES, [])
+            if name in member_ids
+        ]
+    LOGGER.debug(f"Migrated {len(member_ids)} member(s) to member IDs")
 
 
 class SimpleChoresStorageManager:
-    """Handle persistent storage for SimpleChores."""
+    """Handle persistent storage for SimpleChores.
+
+    Chores and members are kept as live typed objects (one instance per
+    chore/member). Reads hand out those instances directly; writes only
+    mark them dirty, and they are serialized back into ``data`` when saving.
+
+    ``chore_index`` keeps secondary indexes (assignee, status, area, due
+    date) over the live chores. It is updated by ``add_chore``,
+    ``update_chore`` and ``delete_chore``, so callers that mutate a chore in
+    place must report it through ``update_chore``.
+
+    Saving is write-behind: ``async_save`` schedules a delayed write through
+    ``Store.async_delay_save`` so bursts of changes end up in a single write.
+    A change is never held back longer than ``SAVE_MAX_DELAY`` seconds, and
+    the store writes any pending data on Home Assistant shutdown. Callers
+    that need the data on disk right away use ``async_flush``.
+
+    Frequent mutations (completions, reschedules, point changes) are written
+    to an append-only journal through ``async_journal`` instead. They are
+    durable as soon as the record is appended, so the full snapshot is only
+    rewritten every ``JOURNAL_MAX_RECORDS`` records or
+    ``JOURNAL_SNAPSHOT_INTERVAL`` seconds. Loading replays the journal tail
+    on top of the snapshot.
+
+    Members are stored under their integer member ID, which chores use to
+    reference their assignees. The public member API is keyed by name;
+    ``get_member_id`` and ``get_member_name`` translate between the two.
+
+    New chores get their ID from ``allocate_chore_id``, a persisted counter,
+    so IDs are never reused and bulk creation needs no collision retries.
+
+    Changes to many chores and members are grouped with ``async_batch``:
+    the index, the chore listeners and the save are handled once when the
+    batch ends, and nothing is kept if the batch raises.
+    """
 
     def __init__(self, hass):
         self.hass = hass
-        self.store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.json")
+        self.store = SimpleChoresStore(hass, STORAGE_VERSION, f"{DOMAIN}.json")
         self.data = {
             DATA_CHORES: {},
             DATA_MEMBERS: {},
         }
+        self._chores: Dict[str, Chore] = {}
+        self._members: Dict[str, Member] = {}
+        self._members_by_id: Dict[int, Member] = {}
+        self._dirty_chores: set[str] = set()
+        self._dirty_members: set[int] = set()
+        self.chore_index = ChoreIndex()
+        self._chore_listeners: List[Callable[[List[str]], None]] = []
+        self._batch_chores: set[str] | None = None
+        self._batch_members: set[int] | None = None
+        self._unsaved_since: float | None = None
+        self._write_scheduled = False
+        self.journal = SimpleChoresJournal(hass)
+        self._journal_records = 0
+        self._status_day: int | None = None
 
     async def async_load(self):
-        """Load stored data from disk."""
+        """Load stored data from disk and replay the journal tail."""
         stored = await self.store.async_load()
         if stored:
             self.data = stored
+        self._replay(await self.journal.async_load())
+        if self.store.migrated:
+            # Journal records appended from now on use the new format, so
+            # the migrated snapshot has to be on disk before the first one
+            await self.async_flush()
+        self._load_objects()
 
     async def async_save(self):
-        """Persist current data to disk."""
-        await self.store.async_save(self.data)
+        """Schedule current data to be persisted to disk (write-behind)."""
+        self.async_schedule_save()
 
-    # convenience helpers for later
-    def get_chores(self) -> Dict[str, Chore]:
-        """Get all chores as Chore objects."""
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write, bounded by the maximum flush latency."""
+        now = time.monotonic()
+        if self._unsaved_since is None:
+            self._unsaved_since = now
+        remaining = SAVE_MAX_DELAY - (now - self._unsaved_since)
+        self._async_delay_write(max(0, min(SAVE_DELAY, remaining)))
+
+    async def async_journal(
+        self,
+        operation: str,
+        chore_ids: Iterable[str] = (),
+        member_names: Iterable[str] = (),
+        **details: Any,
+    ) -> None:
+        """Record a mutation in the journal instead of rewriting the snapshot.
+
+        The post-images of the given chores and members are appended to the
+        journal; ``details`` are stored alongside as an audit trail.
+        """
+        members = [self._members[name] for name in member_names if name in self._members]
+        await self.journal.async_append(
+            operation,
+            chores={
+                chore_id: chore.to_dict() if (chore := self._chores.get(chore_id)) else None
+                for chore_id in chore_ids
+            },
+            members={str(member.member_id): member.to_dict() for member in members},
+            **details,
+        )
+        self._journal_records += 1
+
+        if self._journal_records >= JOURNAL_MAX_RECORDS:
+            await self.async_flush()
+        elif not self._write_scheduled:
+            # The change is already durable, so the snapshot can wait longer
+            self._async_delay_write(JOURNAL_SNAPSHOT_INTERVAL)
+
+    async def async_flush(self):
+        """Write pending changes to disk immediately and compact the journal."""
+        await self.store.async_save(self._data_to_save())
+        self._journal_records = await self.journal.async_compact(
+            self.data[DATA_JOURNAL_SEQ]
+        )
+
+    async def async_remove(self):
+        """Remove the storage file and the journal."""
+        await self.store.async_remove()
+        await self.journal.async_remove()
+
+    @asynccontextmanager
+    async def async_batch(self) -> AsyncIterator[set[str]]:
+        """Group chore and member changes into one transaction.
+
+        Inside the block, ``add_chore``, ``update_chore``, ``delete_chore``
+        and the member methods change the live objects right away, but the
+        index is updated, the chore listeners are called and a save is
+        scheduled only once, when the block ends. The yielded set collects
+        the IDs of the changed chores, to publish them in one go.
+
+        If the block raises, the chores and members it reported are put back
+        to their state when the batch began. As everywhere else, chores
+        mutated in place must be reported through ``update_chore``.
+        Batches do not nest; an inner batch joins the outer one.
+        """
+        if self._batch_chores is not None:
+            yield self._batch_chores
+            return
+
+        # The raw data then holds the state to roll back to
+        self._sync_dirty()
+        chore_ids = self._batch_chores = set()
+        member_ids = self._batch_members = set()
+        try:
+            yield chore_ids
+        except BaseException:
+            self._rollback_batch(chore_ids, member_ids)
+            raise
+        finally:
+            self._batch_chores = None
+            self._batch_members = None
+
+        for chore_id in chore_ids:
+            chore = self._chores.get(chore_id)
+            if chore is None:
+                self.chore_index.remove(chore_id)
+            else:
+                self.chore_index.add(chore_id, chore)
+        self._dirty_chores.update(chore_ids)
+        self._dirty_members.update(member_ids)
+        if chore_ids:
+            self._async_chores_changed(sorted(chore_ids))
+        if chore_ids or member_ids:
+            await self.async_save()
+
+    def _rollback_batch(self, chore_ids: set[str], member_ids: set[int]) -> None:
+        """Restore the chores and members a failed batch changed from the raw data."""
         chores_data = self.data.get(DATA_CHORES, {})
-        return {
-            chore_id: Chore.from_dict(data)
-            for chore_id, data in chores_data.items()
+        for chore_id in chore_ids:
+            if chore_id in chores_data:
+                chore = Chore.from_dict(chores_data[chore_id])
+                chore.chore_id = chore_id
+                self._chores[chore_id] = chore
+            else:
+                self._chores.pop(chore_id, None)
+
+        members_data = self.data.get(DATA_MEMBERS, {})
+        for member_id in member_ids:
+            # The member may have been renamed in the batch
+            self._members_by_id.pop(member_id, None)
+            for name in [name for name, member in self._members.items() if member.member_id == member_id]:
+                del self._members[name]
+            if (member_data := members_data.get(str(member_id))) is not None:
+                member = Member.from_dict(member_data)
+                self._members[member.name] = member
+                self._members_by_id[member_id] = member
+        LOGGER.debug(
+            f"Rolled back a batch of {len(chore_ids)} chore(s) and {len(member_ids)} member(s)"
+        )
+
+    @callback
+    def async_add_chore_listener(self, listener: Callable[[List[str]], None]) -> Callable[[], None]:
+        """Call listener with the IDs of chores whenever chores are added, updated or deleted."""
+        self._chore_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._chore_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_chores_changed(self, chore_ids: List[str]) -> None:
+        """Notify the chore listeners about changed chores."""
+        for listener in list(self._chore_listeners):
+            listener(chore_ids)
+
+    def _chore_changed(self, chore_id: str) -> None:
+        """Index a changed chore and notify the listeners, or defer both to the batch."""
+        if self._batch_chores is not None:
+            self._batch_chores.add(chore_id)
+            return
+        chore = self._chores.get(chore_id)
+        if chore is None:
+            self.chore_index.remove(chore_id)
+        else:
+            self.chore_index.add(chore_id, chore)
+        self._dirty_chores.add(chore_id)
+        self._async_chores_changed([chore_id])
+
+    def _member_changed(self, member_id: int) -> None:
+        """Mark a changed member dirty, or defer it to the batch."""
+        if self._batch_members is not None:
+            self._batch_members.add(member_id)
+        else:
+            self._dirty_members.add(member_id)
+
+    @property
+    def save_pending(self) -> bool:
+        """Return True if a scheduled write has not happened yet."""
+        return self._write_scheduled
+
+    @callback
+    def _async_delay_write(self, delay: float) -> None:
+        """Hand a delayed write to the store."""
+        self._write_scheduled = True
+        self.store.async_delay_save(self._data_to_save, delay)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to write, serializing dirty objects first."""
+        self._sync_dirty()
+        self._unsaved_since = None
+        self._write_scheduled = False
+        self.data[DATA_JOURNAL_SEQ] = self.journal.seq
+        return self.data
+
+    def _replay(self, records: List[Dict[str, Any]]) -> None:
+        """Apply journal records newer than the snapshot to the raw data."""
+        snapshot_seq = self.data.get(DATA_JOURNAL_SEQ, 0)
+        chores_data = self.data.setdefault(DATA_CHORES, {})
+        members_data = self.data.setdefault(DATA_MEMBERS, {})
+        replayed = 0
+
+        for record in records:
+            if record["seq"] <= snapshot_seq:
+                continue
+            for chore_id, chore_data in record.get("chores", {}).items():
+                if chore_data is None:
+                    chores_data.pop(chore_id, None)
+                else:
+                    chores_data[chore_id] = chore_data
+            for member_key, member_data in record.get("members", {}).items():
+                if member_data is None:
+                    members_data.pop(member_key, None)
+                else:
+                    members_data[member_key] = member_data
+            replayed += 1
+
+        self.journal.seq = max(self.journal.seq, snapshot_seq)
+        self._journal_records = len(records)
+        if replayed:
+            LOGGER.debug("Replayed %s journal record(s) on top of the snapshot", replayed)
+
+    def _load_objects(self) -> None:
+        """Build the live Chore and Member objects from the raw data."""
+        self._chores = {}
+        self.chore_index.clear()
+        for chore_id, chore_data in self.data.get(DATA_CHORES, {}).items():
+            chore = Chore.from_dict(chore_data)
+            # The storage key is the authoritative chore ID
+            chore.chore_id = chore_id
+            self._chores[chore_id] = chore
+            self.chore_index.add(chore_id, chore)
+
+        # Journaled chores may be newer than the stored counter, and older
+        # versions stored hashed IDs; continue after the highest ID in use
+        highest = max((int(chore_id) for chore_id in self._chores if chore_id.isdigit()), default=0)
+        self.data[DATA_NEXT_CHORE_ID] = max(self.data.get(DATA_NEXT_CHORE_ID, 1), highest + 1)
+
+        self._migrate_period_keys()
+        self._members = {}
+        self._members_by_id = {}
+        for member_data in self.data.get(DATA_MEMBERS, {}).values():
+            member = Member.from_dict(member_data)
+            self._members[member.name] = member
+            self._members_by_id[member.member_id] = member
+        # Likewise, never hand out a member ID that is already in use
+        self.data[DATA_NEXT_MEMBER_ID] = max(
+            self.data.get(DATA_NEXT_MEMBER_ID, 1), max(self._members_by_id, default=0) + 1
+        )
+        self._dirty_chores.clear()
+        self._dirty_members.clear()
+
+    def _migrate_period_keys(self) -> None:
+        """Stamp counters saved before period keys with their last reset's period.
+
+        Older versions reset the counters at every period boundary and kept
+        the date of the last reset per period; the counters belong to the
+        period containing that date.
+        """
+        last_resets = {
+            period: self.data.pop(f"{STORAGE_KEY_PREFIX_LAST_RESET}_{period}", None)
+            for period in TRACKER_PERIODS
+        }
+        period_keys = {
+            period: period_key(period, datetime.fromisoformat(last_reset).date())
+            for period, last_reset in last_resets.items()
+            if last_reset
         }
-    
+        if not period_keys:
+            return
+
+        for member_data in self.data.get(DATA_MEMBERS, {}).values():
+            member_data.setdefault(MEMBER_FIELD_PERIOD_KEYS, dict(period_keys))
+        LOGGER.debug("Migrated member counters to period keys")
+        self.async_schedule_save()
+
+    def _sync_dirty(self) -> None:
+        """Serialize dirty objects back into the raw data dict."""
+        chores_data = self.data.setdefault(DATA_CHORES, {})
+        for chore_id in self._dirty_chores:
+            chore = self._chores.get(chore_id)
+            if chore is None:
+                chores_data.pop(chore_id, None)
+            else:
+                chores_data[chore_id] = chore.to_dict()
+        self._dirty_chores.clear()
+
+        members_data = self.data.setdefault(DATA_MEMBERS, {})
+        for member_id in self._dirty_members:
+            member = self._members_by_id.get(member_id)
+            if member is None:
+                members_data.pop(str(member_id), None)
+            else:
+                members_data[str(member_id)] = member.to_dict()
+        self._dirty_members.clear()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Return True if there are changes that have not been saved yet."""
+        return bool(self._dirty_chores or self._dirty_members)
+
+    # convenience helpers for later
+    def get_chores(self) -> Dict[str, Chore]:
+        """Get all chores as live Chore objects.
+
+        The returned mapping is the storage's own; do not add or remove keys.
+        """
+        return self._chores
+
     def get_chore(self, chore_id: str) -> Chore | None:
         """Get a specific chore by ID."""
-        chores_data = self.data.get(DATA_CHORES, {})
-        if chore_id in chores_data:
-            return Chore.from_dict(chores_data[chore_id])
-        return None
-    
+        return self._chores.get(chore_id)
+
+    def allocate_chore_id(self) -> str:
+        """Hand out the ID for a new chore."""
+        chore_id = self.data.get(DATA_NEXT_CHORE_ID, 1)
+        self.data[DATA_NEXT_CHORE_ID] = chore_id + 1
+        return str(chore_id)
+
     def add_chore(self, chore_id: str, chore: Chore) -> None:
-        """Add a new chore."""
-        self.data[DATA_CHORES][chore_id] = chore.to_dict()
-    
+        """Add a new chore under an unused ID."""
+        if chore_id in self._chores:
+            raise ValueError(f"Chore ID {chore_id} is already in use")
+        chore.chore_id = chore_id
+        self._chores[chore_id] = chore
+        self._chore_changed(chore_id)
+
     def update_chore(self, chore_id: str, chore: Chore) -> None:
         """Update an existing chore."""
-        self.data[DATA_CHORES][chore_id] = chore.to_dict()
-    
+        # The recurrence settings may have been edited in place
+        chore.invalidate_recurrence()
+        self._chores[chore_id] = chore
+        self._chore_changed(chore_id)
+
     def delete_chore(self, chore_id: str) -> bool:
         """Delete a chore. Returns True if deleted, False if not found."""
-        if chore_id in self.data.get(DATA_CHORES, {}):
-            del self.data[DATA_CHORES][chore_id]
+        if self._chores.pop(chore_id, None) is not None:
+            self._chore_changed(chore_id)
             return True
         return False
-    
+
     def chore_exists(self, chore_id: str) -> bool:
         """Check if a chore exists."""
-        return chore_id in self.data.get(DATA_CHORES, {})
+        return chore_id in self._chores
+
+    def get_chore_ids_by(self, field: str, value: Any) -> set[str]:
+        """Get the IDs of chores whose indexed field equals value."""
+        return self.chore_index.lookup(field, value)
+
+    def get_chore_ids_in_range(self, field: str, start: Any = None, end: Any = None) -> set[str]:
+        """Get the IDs of chores whose indexed field lies within [start, end]."""
+        return self.chore_index.lookup_range(field, start, end)
+
+    def update_chore_statuses(self, today: date, full: bool = False) -> List[str]:
+        """Bring chore statuses up to date for a day and return the changed IDs.
+
+        The first call, and every call with full=True, checks every chore.
+        Later calls only visit the due-day buckets between the previous
+        call's day and today, since no other chore can have crossed a status
+        boundary in between. A full check also repairs statuses that were
+        set by hand against an older due date.
+        """
+        day = today.toordinal()
+        if full or self._status_day is None:
+            chore_ids = list(self._chores)
+        else:
+            chore_ids = sorted(self.chore_index.lookup_due_days(
+                min(self._status_day, day), max(self._status_day, day)
+            ))
+        self._status_day = day
+
+        changed = []
+        for chore_id in chore_ids:
+            chore = self._chores.get(chore_id)
+            if chore is None:
+                # Deleted in a batch whose index update is still pending
+                continue
+            try:
+                if not chore.update_status_for_date(today):
+                    continue
+            except (ValueError, TypeError):
+                LOGGER.warning(f"Invalid due_date for chore '{chore.name}': {chore.due_date}")
+                continue
+            self.update_chore(chore_id, chore)
+            changed.append(chore_id)
+        return changed
+
+    def reschedule_chores(self, today: date) -> List[str]:
+        """Move missed due dates to the next occurrence and return the changed IDs.
+
+        Recurring chores due before today get their first occurrence on or
+        after today, as after a long downtime or restoring an old backup;
+        chores without one keep their due date. The new due dates are
+        computed in bulk on day ordinals, and then every chore's status is
+        checked for today. Run it in a batch, so the listeners are told
+        once.
+        """
+        start = today.toordinal()
+        late_ids = []
+        late = []
+        for chore_id in sorted(self.chore_index.lookup_due_days(date.min.toordinal(), start - 1)):
+            # Inside a batch the index may still list deleted or moved chores
+            chore = self._chores.get(chore_id)
+            if chore is not None and chore.due_date is not None and chore.due_date < today:
+                late_ids.append(chore_id)
+                late.append(chore)
+        ordinals = next_occurrences(
+            [chore.recurrence for chore in late], [chore.due_date.toordinal() for chore in late], start
+        )
+
+        changed = []
+        due_dates: Dict[int, date] = {}
+        for chore_id, chore, ordinal in zip(late_ids, late, ordinals):
+            if ordinal is None:
+                continue
+            if chore.recurrence_count is not None:
+                # The skipped occurrences use up the remaining count; fixed
+                # periods count them on the ordinals, other rules iterate
+                skipped = chore.recurrence.count(chore.due_date, date.fromordinal(start - 1))
+                if skipped > chore.recurrence_count:
+                    continue
+                chore.recurrence_count -= skipped
+            due_date = due_dates.get(ordinal)
+            if due_date is None:
+                due_date = due_dates[ordinal] = date.fromordinal(ordinal)
+            chore.due_date = due_date
+            chore.update_status_for_date(today)
+            self._chore_changed(chore_id)
+            changed.append(chore_id)
+
+        changed.extend(self.update_chore_statuses(today, full=True))
+        return sorted(set(changed))
+
+    def get_assigned_chore_ids(self, member_name: str | None, status: str | None = None) -> set[str]:
+        """Get the IDs of chores assigned to a member, optionally with a status.
+
+        A member_name of None gets the unassigned chores.
+        """
+        member_id = None
+        if member_name is not None:
+            member = self._members.get(member_name)
+            if member is None:
+                return set()
+            member_id = member.member_id
+        if status is None:
+            return self.chore_index.lookup(CHORE_FIELD_ASSIGNED_TO, member_id)
+        return self.chore_index.lookup_assigned(member_id, status)
 
     def get_members(self) -> Dict[str, Member]:
-        """Get all members as Member objects."""
-        members_data = self.data.get(DATA_MEMBERS, {})
-        return {
-            name: Member.from_dict(name, data)
-            for name, data in members_data.items()
-        }
-    
+        """Get all members as live Member objects.
+
+        The returned mapping is the storage's own; do not add or remove keys.
+        """
+        return self._members
+
     def get_member(self, name: str) -> Member | None:
         """Get a specific member by name."""
-        members_data = self.data.get(DATA_MEMBERS, {})
-        if name in members_data:
-            return Member.from_dict(name, members_data[name])
-        return None
-    
+        return self._members.get(name)
+
+    def get_member_by_id(self, member_id: int | None) -> Member | None:
+        """Get a specific member by member ID."""
+        return self._members_by_id.get(member_id)
+
+    def get_member_id(self, name: str | None) -> int | None:
+        """Get the member ID of a member name, or None if there is no such member."""
+        member = self._members.get(name)
+        return member.member_id if member is not None else None
+
+    def get_member_name(self, member_id: int | None) -> str | None:
+        """Get the name of a member ID, or None if there is no such member."""
+        member = self._members_by_id.get(member_id)
+        return member.name if member is not None else None
+
     def add_member(self, member: Member) -> None:
-        """Add a new member."""
-        self.data[DATA_MEMBERS][member.name] = member.to_dict()
-    
+        """Add a new member, handing out a member ID if it has none yet."""
+        if not member.member_id:
+            member.member_id = self.data.get(DATA_NEXT_MEMBER_ID, 1)
+        self.data[DATA_NEXT_MEMBER_ID] = max(
+            self.data.get(DATA_NEXT_MEMBER_ID, 1), member.member_id + 1
+        )
+        self._members[member.name] = member
+        self._members_by_id[member.member_id] = member
+        self._member_changed(member.member_id)
+
     def update_member(self, member: Member) -> None:
         """Update an existing member."""
-        self.data[DATA_MEMBERS][member.name] = member.to_dict()
-    
+        self._members[member.name] = member
+        self._members_by_id[member.member_id] = member
+        self._member_changed(member.member_id)
+
+    def rename_member(self, name: str, new_name: str) -> bool:
+        """Rename a member. Returns True if renamed, False if not found.
+
+        Chores reference the member ID, so only the member record changes.
+        """
+        member = self._members.pop(name, None)
+        if member is None:
+            return False
+        member.name = new_name
+        self._members[new_name] = member
+        self._member_changed(member.member_id)
+        return True
+
     def delete_member(self, name: str) -> bool:
         """Delete a member. Returns True if deleted, False if not found."""
-        if name in self.data.get(DATA_MEMBERS, {}):
-            del self.data[DATA_MEMBERS][name]
+        member = self._members.pop(name, None)
+        if member is not None:
+            self._members_by_id.pop(member.member_id, None)
+            self._member_changed(member.member_id)
             return True
         return False
-    
+
     def member_exists(self, name: str) -> bool:
         """Check if a member exists."""
-        return name in self.data.get(DATA_MEMBERS, {})
-
-    def reset_period_counters(self, period: str):
-        """Reset counters for all members for a given period."""
-        members_data = self.data.get(DATA_MEMBERS, {})
-        for name, data in members_data.items():
-            member = Member.from_dict(name, data)
-            member.reset_points(period)
-            member.reset_chores_completed(period)
-            self.data[DATA_MEMBERS][name] = member.to_dict()
-
-    def get_last_reset(self, period: str) -> str | None:
-        """Get the last reset timestamp for a period."""
-        return self.data.get(f"{STORAGE_KEY_PREFIX_LAST_RESET}_{period}")
-
-    def set_last_reset(self, period: str, timestamp: str):
-        """Set the last reset timestamp for a period."""
-        self.data[f"{STORAGE_KEY_PREFIX_LAST_RESET}_{period}"] = timestamp
+        return name in self._members
@@ -0,0 +1,87 @@
+"""Microbenchmark for the slotted Chore representation.
+
+Compares the slotted Chore with hand-written to_dict against an equivalent
+plain dataclass serialized with dataclasses.asdict (the previous layout).
+
+Run from the repository root:
+
+    python -m custom_components.simplechores.tests.benchmarks.bench_models
+"""
+from __future__ import annotations
+
+import dataclasses
+import gc
+import timeit
+import tracemalloc
+
+from custom_components.simplechores.chore import Chore
+
+N_CHORES = 10_000
+
+
+def _legacy_chore_class() -> type:
+    """Build a plain (unslotted) dataclass with the same fields as Chore."""
+    fields = [
+        (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory, init=f.init))
+        for f in dataclasses.fields(Chore)
+    ]
+    return dataclasses.make_dataclass("LegacyChore", fields)
+
+
+def _sample_data(index: int) -> dict:
+    """Return the stored form of a chore."""
+    return {
+        "name": f"Chore {index}",
+        "points": index % 20,
+        "status": "pending",
+        "last_completed": "2025-06-01",
+        "due_date": "2025-06-11",
+        "assigned_to": 1,
+        "possible_assignees": [1, 2],
+        "recurrence_specific_weekdays": [0, 3],
+        "area_id": "kitchen",
+        "created_at": "2025-01-01T08:00:00",
+    }
+
+
+def _measure_memory(build) -> int:
+    """Return the bytes still allocated by the objects build() returns."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main() -> None:
+    """Print memory and time per representation."""
+    legacy_class = _legacy_chore_class()
+    slotted = [Chore.from_dict(_sample_data(index)) for index in range(N_CHORES)]
+    # Both representations reference the same field values, so only the
+    # per-instance overhead differs
+    kwargs = [
+        {f.name: getattr(chore, f.name) for f in dataclasses.fields(chore) if f.init}
+        for chore in slotted
+    ]
+    legacy = [legacy_class(**values) for values in kwargs]
+
+    def build_slotted():
+        return [Chore(**values) for values in kwargs]
+
+    def build_legacy():
+        return [legacy_class(**values) for values in kwargs]
+
+    print(f"{N_CHORES} chores")
+    print(f"memory  slotted: {_measure_memory(build_slotted) / N_CHORES:8.1f} B/chore")
+    print(f"memory  legacy:  {_measure_memory(build_legacy) / N_CHORES:8.1f} B/chore")
+
+    slotted_time = min(timeit.repeat(lambda: [chore.to_dict() for chore in slotted], number=5, repeat=3))
+    legacy_time = min(timeit.repeat(lambda: [dataclasses.asdict(chore) for chore in legacy], number=5, repeat=3))
+    print(f"to_dict slotted: {slotted_time / (5 * N_CHORES) * 1e6:8.2f} us/chore")
+    print(f"asdict  legacy:  {legacy_time / (5 * N_CHORES) * 1e6:8.2f} us/chore")
+
+
+if __name__ == "__main__":
+    main()
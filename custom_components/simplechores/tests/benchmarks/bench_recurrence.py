@@ -0,0 +1,123 @@
+"""Microbenchmark for compiled recurrence rules.
+
+Compares Chore.next_due_date with compiled (cached) recurrence rules
+against the previous per-call calendar math, kept here as plain functions.
+
+Run from the repository root:
+
+    python -m custom_components.simplechores.tests.benchmarks.bench_recurrence
+"""
+from __future__ import annotations
+
+import calendar
+import timeit
+from datetime import date, timedelta
+
+from custom_components.simplechores.chore import Chore
+
+N_CHORES = 10_000
+FROM_DATE = date(2025, 6, 11)
+
+PATTERNS = [
+    {"recurrence_pattern": "daily"},
+    {"recurrence_pattern": "interval_days", "recurrence_interval": 3},
+    {"recurrence_pattern": "specific_days", "recurrence_specific_weekdays": [0, 3, 5]},
+    {"recurrence_pattern": "monthly_day", "recurrence_day_of_month": -1},
+    {"recurrence_pattern": "monthly_weekday", "recurrence_week_of_month": [1, -1], "recurrence_specific_weekdays": [5]},
+    {"recurrence_pattern": "annual_day", "recurrence_annual_month": 4, "recurrence_annual_day": 15},
+]
+
+
+def _legacy_monthly_day(chore: Chore, from_date: date) -> date:
+    """Return the next monthly day the way the previous implementation did."""
+    def resolve(year: int, month: int) -> date:
+        days_in_month = calendar.monthrange(year, month)[1]
+        target = chore.recurrence_day_of_month
+        day = min(target, days_in_month) if target > 0 else max(1, days_in_month + target + 1)
+        return date(year, month, day)
+
+    this_month = resolve(from_date.year, from_date.month)
+    if this_month > from_date:
+        return this_month
+    if from_date.month == 12:
+        return resolve(from_date.year + 1, 1)
+    return resolve(from_date.year, from_date.month + 1)
+
+
+def _legacy_monthly_weekday(chore: Chore, from_date: date) -> date:
+    """Return the next monthly weekday the way the previous implementation did."""
+    def resolve(year: int, month: int, week: int, weekday: int) -> date | None:
+        first_of_month = date(year, month, 1)
+        occurrence = first_of_month + timedelta(days=(weekday - first_of_month.weekday()) % 7)
+        if week == -1:
+            while (occurrence + timedelta(weeks=1)).month == month:
+                occurrence += timedelta(weeks=1)
+            return occurrence
+        occurrence += timedelta(weeks=week - 1)
+        return occurrence if occurrence.month == month else None
+
+    for month_offset in range(24):
+        month = from_date.month + month_offset
+        year = from_date.year + (month - 1) // 12
+        month = (month - 1) % 12 + 1
+        candidates = [
+            candidate
+            for week in chore.recurrence_week_of_month
+            for weekday in chore.recurrence_specific_weekdays
+            if (candidate := resolve(year, month, week, weekday)) is not None and candidate > from_date
+        ]
+        if candidates:
+            return min(candidates)
+    return from_date + timedelta(days=30)
+
+
+def _legacy_next_due_date(chore: Chore, from_date: date) -> date:
+    """Return the next due date the way the previous implementation did."""
+    pattern = chore.recurrence_pattern
+    if pattern == "interval_days":
+        return (chore.last_completed or chore.due_date or from_date) + timedelta(days=chore.recurrence_interval)
+    if pattern == "specific_days":
+        for i in range(1, 8):
+            check_date = from_date + timedelta(days=i)
+            if check_date.weekday() in chore.recurrence_specific_weekdays:
+                return check_date
+        return from_date + timedelta(days=1)
+    if pattern == "monthly_day":
+        return _legacy_monthly_day(chore, from_date)
+    if pattern == "monthly_weekday":
+        return _legacy_monthly_weekday(chore, from_date)
+    if pattern == "annual_day":
+        for year in range(from_date.year, from_date.year + 9):
+            try:
+                candidate = date(year, chore.recurrence_annual_month, chore.recurrence_annual_day)
+            except ValueError:
+                continue
+            if candidate > from_date:
+                return candidate
+        return from_date + timedelta(days=365)
+    return from_date + timedelta(days=1)
+
+
+def main() -> None:
+    """Print next-occurrence time per pattern and implementation."""
+    print(f"{N_CHORES} chores per pattern, us per next_due_date call")
+    for settings in PATTERNS:
+        chores = [Chore(name=f"Chore {index}", due_date=FROM_DATE, **settings) for index in range(N_CHORES)]
+        for chore in chores:
+            assert chore.next_due_date(FROM_DATE) == _legacy_next_due_date(chore, FROM_DATE)
+
+        compiled_time = min(timeit.repeat(
+            lambda: [chore.next_due_date(FROM_DATE) for chore in chores], number=5, repeat=3
+        ))
+        legacy_time = min(timeit.repeat(
+            lambda: [_legacy_next_due_date(chore, FROM_DATE) for chore in chores], number=5, repeat=3
+        ))
+        print(
+            f"{settings['recurrence_pattern']:16} "
+            f"compiled: {compiled_time / (5 * N_CHORES) * 1e6:6.2f}  "
+            f"legacy: {legacy_time / (5 * N_CHORES) * 1e6:6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
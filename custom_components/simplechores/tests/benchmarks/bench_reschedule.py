@@ -0,0 +1,84 @@
+"""Microbenchmark for bulk rescheduling.
+
+Compares next_occurrences, which moves many missed due dates at once on
+day ordinals, against iterating each chore's occurrences to the first one
+on or after today. Synthetic chores are represented by their compiled
+recurrence rule and the day ordinal of their missed due date.
+
+Count-limited chores also need the number of occurrences they skipped;
+CompiledRule.count is compared against counting the iterated occurrences,
+separately for fixed-period rules (counted on ordinals) and other rules
+(still iterated).
+
+Run from the repository root:
+
+    python -m custom_components.simplechores.tests.benchmarks.bench_reschedule
+"""
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, timedelta
+
+from custom_components.simplechores.chore import Chore
+from custom_components.simplechores.recurrence import next_occurrences
+
+SIZES = (10_000, 100_000, 1_000_000)
+TODAY = date(2025, 6, 11)
+
+PATTERNS = [
+    {"recurrence_pattern": "daily"},
+    {"recurrence_pattern": "interval_days", "recurrence_interval": 3},
+    {"recurrence_pattern": "interval_days", "recurrence_interval": 14},
+    {"recurrence_pattern": "specific_days", "recurrence_specific_weekdays": [0, 3, 5]},
+    {"recurrence_pattern": "monthly_day", "recurrence_day_of_month": -1},
+    {"recurrence_pattern": "monthly_weekday", "recurrence_week_of_month": [1, -1], "recurrence_specific_weekdays": [5]},
+    {"recurrence_pattern": "annual_day", "recurrence_annual_month": 4, "recurrence_annual_day": 15},
+]
+
+
+def main() -> None:
+    """Print the time to reschedule synthetic chores missed up to a year ago."""
+    rules = [Chore(name="Chore", **settings).recurrence for settings in PATTERNS]
+    start = TODAY.toordinal()
+    rng = random.Random(0)
+    for size in SIZES:
+        chore_rules = [rng.choice(rules) for _ in range(size)]
+        firsts = [start - rng.randint(1, 365) for _ in range(size)]
+
+        began = time.perf_counter()
+        bulk = next_occurrences(chore_rules, firsts, start)
+        bulk_time = time.perf_counter() - began
+
+        began = time.perf_counter()
+        looped = [
+            next(rule.iterate(date.fromordinal(first), TODAY)).toordinal()
+            for rule, first in zip(chore_rules, firsts)
+        ]
+        loop_time = time.perf_counter() - began
+
+        assert bulk == looped
+        print(f"{size:>9} chores  bulk: {bulk_time:7.3f} s  per chore: {loop_time:7.3f} s")
+
+        last_skipped = TODAY - timedelta(days=1)
+        limited = [(rule, date.fromordinal(first)) for rule, first in zip(chore_rules, firsts)]
+        for label, fixed in (("fixed-period", True), ("other", False)):
+            group = [(rule, first) for rule, first in limited if (rule._period is not None) == fixed]
+
+            began = time.perf_counter()
+            counted = [rule.count(first, last_skipped) for rule, first in group]
+            count_time = time.perf_counter() - began
+
+            began = time.perf_counter()
+            iterated = [sum(1 for _ in rule.iterate(first, end=last_skipped)) for rule, first in group]
+            iterate_time = time.perf_counter() - began
+
+            assert counted == iterated
+            print(
+                f"{len(group):>9} limited {label} chores  count: {count_time:7.3f} s"
+                f"  iterate: {iterate_time:7.3f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,17 @@ def auto_enable_custom_integrations(enable_custom_integrations):
     yield
 
 
+@pytest.fixture(autouse=True)
+def journal_file(tmp_path):
+    """Keep the storage journal in a per-test temporary directory."""
+    path = tmp_path / "simplechores.journal"
+    with patch(
+        "custom_components.simplechores.journal.journal_path",
+        return_value=str(path),
+    ):
+        yield path
+
+
 @pytest.fixture
 def mock_config_entry_data():
     """Return mock config entry data."""
@@ -50,7 +61,7 @@ def mock_config_entry(mock_config_entry_data):
 def mock_storage(hass: HomeAssistant):
     """Mock storage operations."""
     with patch(
-        "custom_components.simplechores.storage_manager.Store"
+        "custom_components.simplechores.storage_manager.SimpleChoresStore"
     ) as mock_store:
         store_data = {
             "members": {},
@@ -65,5 +76,6 @@ def mock_storage(hass: HomeAssistant):
         
         mock_store.return_value.async_load = async_load
         mock_store.return_value.async_save = async_save
+        mock_store.return_value.migrated = False
         
         yield mock_store
@@ -0,0 +1,154 @@
+"""Test the SimpleChores calendar."""
+from datetime import datetime, time, timedelta
+from unittest.mock import patch
+
+from homeassistant.components.calendar import DOMAIN as CALENDAR_DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simplechores.chore import Chore
+from custom_components.simplechores.const import DOMAIN
+
+CALENDAR_ENTITY_ID = "calendar.chores"
+
+
+def _at_midnight(day) -> datetime:
+    """Return the local midnight starting a day."""
+    return dt_util.as_local(datetime.combine(day, time(), tzinfo=dt_util.DEFAULT_TIME_ZONE))
+
+
+async def test_calendar_events(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that the calendar lists chore occurrences in a range."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    alice, bob = storage.get_member_id("Alice"), storage.get_member_id("Bob")
+    today = dt_util.now().date()
+    storage.add_chore("dishes", Chore(
+        name="Dishes",
+        due_date=today,
+        assignment_mode="rotate",
+        assigned_to=alice,
+        possible_assignees=[alice, bob],
+    ))
+    storage.add_chore("windows", Chore(name="Windows", due_date=today + timedelta(days=1), recurrence_pattern="none"))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    calendar = hass.data[CALENDAR_DOMAIN].get_entity(CALENDAR_ENTITY_ID)
+    events = await calendar.async_get_events(hass, _at_midnight(today), _at_midnight(today + timedelta(days=3)))
+
+    assert [(event.start, event.summary, event.description) for event in events] == [
+        (today, "Dishes", "Assigned to Alice"),
+        (today + timedelta(days=1), "Dishes", "Assigned to Bob"),
+        (today + timedelta(days=1), "Windows", None),
+        (today + timedelta(days=2), "Dishes", "Assigned to Alice"),
+    ]
+    assert events[0].end == today + timedelta(days=1)
+    assert events[0].uid == f"dishes_{today.isoformat()}"
+    assert hass.states.get(CALENDAR_ENTITY_ID).attributes["message"] == "Dishes"
+
+
+async def test_calendar_expands_chores_once(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that queries reuse the index and only changed chores are expanded."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    today = dt_util.now().date()
+    for index in range(5):
+        storage.add_chore(f"chore_{index}", Chore(name=f"Chore {index}", due_date=today))
+    await hass.async_block_till_done()
+
+    calendar = hass.data[CALENDAR_DOMAIN].get_entity(CALENDAR_ENTITY_ID)
+    start, end = _at_midnight(today), _at_midnight(today + timedelta(days=7))
+    await calendar.async_get_events(hass, start, end)
+
+    with patch.object(Chore, "iter_occurrences", autospec=True, side_effect=Chore.iter_occurrences) as expand:
+        for _ in range(3):
+            events = await calendar.async_get_events(hass, start, end)
+        assert len(events) == 5 * 7
+        assert expand.call_count == 0
+
+        chore = storage.get_chore("chore_2")
+        chore.recurrence_interval = 2
+        chore.recurrence_pattern = "interval_days"
+        storage.update_chore("chore_2", chore)
+        await hass.async_block_till_done()
+        assert [call.args[0] for call in expand.call_args_list] == [chore]
+
+        events = await calendar.async_get_events(hass, start, end)
+        assert len(events) == 4 * 7 + 4
+        assert expand.call_count == 1
+
+        # Asking past the horizon expands everything once more
+        far = _at_midnight(today + timedelta(days=200))
+        await calendar.async_get_events(hass, far - timedelta(days=7), far)
+        assert expand.call_count == 1 + 5
+
+
+async def test_calendar_coalesces_changes(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that many chore changes are applied and written once."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    today = dt_util.now().date()
+    for index in range(20):
+        storage.add_chore(f"chore_{index}", Chore(name=f"Chore {index}", due_date=today))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    calendar = hass.data[CALENDAR_DOMAIN].get_entity(CALENDAR_ENTITY_ID)
+    with patch.object(calendar, "async_write_ha_state") as write_state, patch.object(
+        Chore, "iter_occurrences", autospec=True, side_effect=Chore.iter_occurrences
+    ) as expand:
+        for index in range(3):
+            chore = storage.get_chore(f"chore_{index}")
+            chore.due_date = today + timedelta(days=1)
+            storage.update_chore(chore.chore_id, chore)
+        assert write_state.call_count == 0
+        assert expand.call_count == 0
+
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert write_state.call_count == 1
+        assert expand.call_count == 3
+
+
+async def test_calendar_shows_overdue_chores_today(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that an overdue chore is listed on today and is the calendar's event."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    alice, bob = storage.get_member_id("Alice"), storage.get_member_id("Bob")
+    today = dt_util.now().date()
+    storage.add_chore("dishes", Chore(
+        name="Dishes",
+        due_date=today - timedelta(days=3),
+        assignment_mode="rotate",
+        assigned_to=alice,
+        possible_assignees=[alice, bob],
+    ))
+    storage.add_chore("windows", Chore(name="Windows", due_date=today + timedelta(days=1), recurrence_pattern="none"))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    calendar = hass.data[CALENDAR_DOMAIN].get_entity(CALENDAR_ENTITY_ID)
+    events = await calendar.async_get_events(hass, _at_midnight(today), _at_midnight(today + timedelta(days=2)))
+
+    assert [(event.start, event.summary, event.description) for event in events] == [
+        (today, "Dishes", "Assigned to Alice"),
+        (today + timedelta(days=1), "Dishes", "Assigned to Bob"),
+        (today + timedelta(days=1), "Windows", None),
+    ]
+    state = hass.states.get(CALENDAR_ENTITY_ID)
+    assert state.attributes["message"] == "Dishes"
+    assert state.attributes["start_time"] == f"{today.isoformat()} 00:00:00"
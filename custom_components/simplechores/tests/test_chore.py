@@ -0,0 +1,75 @@
+"""Test SimpleChores chore recurrence."""
+import dataclasses
+from datetime import date, timedelta
+from itertools import islice
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.simplechores.chore import Chore
+
+START = date(2025, 6, 11)
+
+CHORES = [
+    Chore(name="Daily", recurrence_pattern="daily"),
+    Chore(name="Interval", recurrence_pattern="interval_days", recurrence_interval=3),
+    Chore(name="Weekdays", recurrence_pattern="specific_days", recurrence_specific_weekdays=[0, 3, 5]),
+    Chore(name="Monthly", recurrence_pattern="monthly_day", recurrence_day_of_month=-1),
+    Chore(
+        name="Monthly weekday",
+        recurrence_pattern="monthly_weekday",
+        recurrence_week_of_month=[1, -1],
+        recurrence_specific_weekdays=[5],
+    ),
+    Chore(name="Annual", recurrence_pattern="annual_day", recurrence_annual_month=2, recurrence_annual_day=29),
+]
+
+
+@pytest.mark.parametrize("chore", CHORES, ids=lambda chore: chore.name)
+def test_occurrences_match_repeated_completion(chore: Chore) -> None:
+    """Test that the occurrences are the due dates of completing on each due date."""
+    chore = dataclasses.replace(chore, due_date=START)
+    stored = chore.to_dict()
+
+    occurrences = list(islice(chore.iter_occurrences(START), 12))
+
+    # Iterating does not change the chore
+    assert chore.to_dict() == stored
+    clone = Chore.from_dict(stored)
+    expected = []
+    for _ in range(12):
+        expected.append(clone.due_date)
+        clone.mark_completed("Alice", completion_date=clone.due_date)
+    assert occurrences == expected
+
+
+@pytest.mark.parametrize("chore", CHORES, ids=lambda chore: chore.name)
+def test_occurrences_skip_to_start_and_stop_at_end(chore: Chore) -> None:
+    """Test that occurrences before start are skipped and the range is closed."""
+    chore = dataclasses.replace(chore, due_date=START - timedelta(days=40))
+    start, end = START, START + timedelta(days=90)
+
+    occurrences = list(chore.iter_occurrences(start, end))
+    everything = list(chore.iter_occurrences(chore.due_date, end + timedelta(days=3000)))
+
+    assert occurrences == [day for day in everything if start <= day <= end]
+
+
+def test_no_occurrences_without_due_date_or_recurrence() -> None:
+    """Test one-off chores and chores that were never scheduled."""
+    assert list(Chore(name="Never").iter_occurrences(START)) == []
+    once = Chore(name="Once", recurrence_pattern="none", due_date=START)
+    assert list(once.iter_occurrences(START - timedelta(days=1))) == [START]
+    assert list(once.iter_occurrences(START + timedelta(days=1))) == []
+
+
+async def test_today_follows_the_home_assistant_time_zone(hass: HomeAssistant) -> None:
+    """Test that completions use the Home Assistant day, not the host's."""
+    # Fourteen hours ahead of and twelve behind UTC: at least one differs from the host day
+    for time_zone in ("Pacific/Kiritimati", "Etc/GMT+12"):
+        hass.config.set_time_zone(time_zone)
+        chore = Chore(name="Dishes", due_date=START)
+        chore.mark_completed("Alice")
+        assert chore.last_completed == dt_util.now().date()
+        assert chore.due_date == dt_util.now().date() + timedelta(days=1)
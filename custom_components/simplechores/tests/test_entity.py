@@ -0,0 +1,105 @@
+"""Test SimpleChores base entities."""
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.simplechores.chore import Chore
+from custom_components.simplechores.const import CHORE_STATE_PENDING, DOMAIN
+
+# (platform, unique ID suffix) of the entities every chore gets
+CHORE_ENTITY_KEYS = (
+    ("select", "status"),
+    ("select", "assigned_to"),
+    ("select", "mark_completed_by"),
+    ("number", "points"),
+    ("date", "due_date"),
+)
+
+
+async def test_device_id_is_cached(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that state writes do not look up the device registry."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    device_reg = dr.async_get(hass)
+    device = device_reg.async_get_device(identifiers={(DOMAIN, "member_1")})
+    assert hass.states.get("sensor.alice_points_earned_today").attributes["device_id"] == device.id
+
+    with patch(
+        "custom_components.simplechores.entity.dr.async_get", wraps=dr.async_get
+    ) as async_get:
+        coordinator.async_update_from_storage()
+        await hass.async_block_till_done()
+        assert async_get.call_count == 0
+
+        # Devices being created or removed invalidate the cached ID
+        device_reg.async_get_or_create(
+            config_entry_id=mock_config_entry.entry_id,
+            identifiers={(DOMAIN, "member_3")},
+        )
+        await hass.async_block_till_done()
+        coordinator.async_publish_changes(member_names=["Alice"])
+        await hass.async_block_till_done()
+        assert async_get.call_count > 0
+
+    assert hass.states.get("sensor.alice_points_earned_today").attributes["device_id"] == device.id
+
+
+async def test_chore_entities_added_and_removed_without_reload(
+    hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test that adding or deleting a chore only touches that chore's entities."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    entity_reg = er.async_get(hass)
+
+    def entity_ids(chore_id: str) -> list:
+        return [
+            entity_reg.async_get_entity_id(domain, DOMAIN, f"{DOMAIN}_{chore_id}_{key}")
+            for domain, key in CHORE_ENTITY_KEYS
+        ]
+
+    with patch.object(hass.config_entries, "async_reload") as async_reload:
+        storage.add_chore("dishes", Chore(name="Dishes", assigned_to=storage.get_member_id("Alice")))
+        coordinator.async_add_chore_entities("dishes")
+        await hass.async_block_till_done()
+
+        dishes = entity_ids("dishes")
+        assert all(dishes)
+        assert all(hass.states.get(entity_id) for entity_id in dishes)
+        assert hass.states.get(dishes[0]).state == CHORE_STATE_PENDING
+
+        storage.add_chore("laundry", Chore(name="Laundry"))
+        coordinator.async_add_chore_entities("laundry")
+        await hass.async_block_till_done()
+
+        storage.delete_chore("dishes")
+        await coordinator.async_remove_chore_entities("dishes")
+        await hass.async_block_till_done()
+
+        assert not any(entity_ids("dishes"))
+        assert all(hass.states.get(entity_id) is None for entity_id in dishes)
+        assert all(hass.states.get(entity_id) for entity_id in entity_ids("laundry"))
+        assert dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "chore_dishes")}) is None
+        async_reload.assert_not_called()
+
+
+async def test_entities_follow_device_renames(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that the cached device ID does not hide device renames from the entities."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    device_reg = dr.async_get(hass)
+    device_id = hass.states.get("sensor.alice_points_earned_today").attributes["device_id"]
+
+    device_reg.async_update_device(device_id, name="Alicia")
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.alice_points_earned_today")
+    assert state.attributes["friendly_name"] == "Alicia Points earned today"
+    assert state.attributes["device_id"] == device_id
@@ -1,8 +1,10 @@
 """Test SimpleChores integration setup."""
+from typing import Any
+
 import pytest
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 from custom_components.simplechores.const import (
     DOMAIN,
@@ -34,7 +36,7 @@ async def test_devices_created(hass: HomeAssistant, mock_config_entry) -> None:
     
     # Check Alice's device
     alice_device = device_reg.async_get_device(
-        identifiers={(DOMAIN, "member_Alice")}
+        identifiers={(DOMAIN, "member_1")}
     )
     assert alice_device is not None
     assert alice_device.name == "Alice"
@@ -43,7 +45,7 @@ async def test_devices_created(hass: HomeAssistant, mock_config_entry) -> None:
 
     # Check Bob's device
     bob_device = device_reg.async_get_device(
-        identifiers={(DOMAIN, "member_Bob")}
+        identifiers={(DOMAIN, "member_2")}
     )
     assert bob_device is not None
     assert bob_device.name == "Bob"
@@ -76,3 +78,40 @@ async def test_unload_entry(hass: HomeAssistant, mock_config_entry) -> None:
     # Services should be unloaded
     assert not hass.services.has_service(DOMAIN, "update_points")
     assert not hass.services.has_service(DOMAIN, "reset_points")
+
+
+async def test_member_registry_migrates_to_member_ids(
+    hass: HomeAssistant, mock_config_entry, hass_storage: dict[str, Any]
+) -> None:
+    """Test that devices and sensors keyed by member name move to the member ID."""
+    hass_storage[f"{DOMAIN}.json"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.json",
+        "data": {"members": {"Alice": {"points_earned_today": 4}, "Bob": {}}, "chores": {}},
+    }
+    mock_config_entry.add_to_hass(hass)
+    device_reg = dr.async_get(hass)
+    entity_reg = er.async_get(hass)
+    device = device_reg.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id, identifiers={(DOMAIN, "member_Alice")}, name="Alice"
+    )
+    old_entry = entity_reg.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{DOMAIN}_Alice_points_earned_today",
+        config_entry=mock_config_entry,
+        device_id=device.id,
+        suggested_object_id="alice_points_earned_today",
+    )
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    alice = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"].get_member_id("Alice")
+    assert device_reg.async_get_device(identifiers={(DOMAIN, f"member_{alice}")}).id == device.id
+    entry = entity_reg.async_get(old_entry.entity_id)
+    assert entry.unique_id == f"{DOMAIN}_member_{alice}_points_earned_today"
+    assert entry.id == old_entry.id
+    assert hass.states.get(old_entry.entity_id).state == "4"
+    # Nothing was registered a second time under the new keys
+    assert len(er.async_entries_for_device(entity_reg, device.id)) == 11
@@ -0,0 +1,55 @@
+"""Test SimpleChores member counters."""
+from datetime import date
+
+from custom_components.simplechores.const import (
+    TRACKER_PERIOD_TODAY,
+    TRACKER_PERIOD_THIS_WEEK,
+    TRACKER_PERIOD_THIS_MONTH,
+    TRACKER_PERIOD_THIS_YEAR,
+)
+from custom_components.simplechores.member import Member, period_key
+
+# Monday and Wednesday of the same week
+MONDAY = date(2025, 6, 9)
+WEDNESDAY = date(2025, 6, 11)
+
+
+def test_period_keys() -> None:
+    """Test the keys identifying the period containing a day."""
+    assert period_key(TRACKER_PERIOD_TODAY, WEDNESDAY) == "2025-06-11"
+    assert period_key(TRACKER_PERIOD_THIS_WEEK, WEDNESDAY) == MONDAY.isoformat()
+    assert period_key(TRACKER_PERIOD_THIS_WEEK, MONDAY) == MONDAY.isoformat()
+    assert period_key(TRACKER_PERIOD_THIS_MONTH, WEDNESDAY) == "2025-06"
+    assert period_key(TRACKER_PERIOD_THIS_YEAR, WEDNESDAY) == "2025"
+
+
+def test_counters_roll_over_lazily() -> None:
+    """Test that counters of an earlier period read as 0 and restart on write."""
+    member = Member(name="Alice")
+    member.add_points(5, MONDAY)
+    member.add_chore_completed(MONDAY)
+
+    # Nothing is reset when the day changes, but the old day reads as 0
+    assert member.points_earned_today == 5
+    assert member.get_points(TRACKER_PERIOD_TODAY, WEDNESDAY) == 0
+    assert member.get_chores_completed(TRACKER_PERIOD_TODAY, WEDNESDAY) == 0
+    assert member.get_points(TRACKER_PERIOD_THIS_WEEK, WEDNESDAY) == 5
+
+    member.add_points(3, WEDNESDAY)
+    assert member.get_points(TRACKER_PERIOD_TODAY, WEDNESDAY) == 3
+    assert member.get_points(TRACKER_PERIOD_THIS_WEEK, WEDNESDAY) == 8
+    assert member.get_chores_completed(TRACKER_PERIOD_THIS_WEEK, WEDNESDAY) == 1
+    assert member.period_keys[TRACKER_PERIOD_TODAY] == WEDNESDAY.isoformat()
+
+    # Catch-up after a long downtime: every period has rolled over
+    assert member.get_points(TRACKER_PERIOD_THIS_YEAR, date(2027, 1, 1)) == 0
+
+
+def test_subtract_points_in_new_period() -> None:
+    """Test that subtracting in a new period starts from 0, not the stale value."""
+    member = Member(name="Alice")
+    member.add_points(5, MONDAY)
+    member.subtract_points(2, WEDNESDAY)
+
+    assert member.get_points(TRACKER_PERIOD_TODAY, WEDNESDAY) == 0
+    assert member.get_points(TRACKER_PERIOD_THIS_WEEK, WEDNESDAY) == 3
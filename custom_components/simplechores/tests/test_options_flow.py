@@ -1,10 +1,13 @@
 """Test SimpleChores options flow."""
+from unittest.mock import patch
+
 import pytest
 
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 
+from custom_components.simplechores.chore import Chore
 from custom_components.simplechores.const import DOMAIN
 
 
@@ -179,3 +182,53 @@ async def test_delete_member(hass: HomeAssistant, mock_config_entry) -> None:
     members = storage.get_members()
     assert "Bob" not in members
     assert "Alice" in members  # Others should remain
+
+
+async def test_rename_member_keeps_device_and_entities(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that renaming a member keeps its device and entities and does not reload."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    device_reg = dr.async_get(hass)
+    entity_reg = er.async_get(hass)
+    device = device_reg.async_get_device(identifiers={(DOMAIN, "member_1")})
+    entity_id = "sensor.alice_points_earned_today"
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    alice = storage.get_member_id("Alice")
+    storage.add_chore("dishes", Chore(name="Dishes", assigned_to=alice, possible_assignees=[alice]))
+    coordinator.async_add_chore_entities("dishes")
+    await hass.async_block_till_done()
+    assigned_to = entity_reg.async_get_entity_id("select", DOMAIN, f"{DOMAIN}_dishes_assigned_to")
+    assert hass.states.get(assigned_to).state == "Alice"
+    unique_id = entity_reg.async_get(entity_id).unique_id
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"next_step_id": "manage_members"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"next_step_id": "edit_member"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"member": "Alice"}
+    )
+    assert result["step_id"] == "edit_member_details"
+
+    with patch.object(hass.config_entries, "async_reload") as async_reload:
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={"new_name": "Alicia", "points_action": "offset", "points_offset": 3},
+        )
+        await hass.async_block_till_done()
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    async_reload.assert_not_called()
+
+    assert device_reg.async_get_device(identifiers={(DOMAIN, "member_1")}).id == device.id
+    assert device_reg.async_get(device.id).name == "Alicia"
+    assert entity_reg.async_get(entity_id).unique_id == unique_id
+    state = hass.states.get(entity_id)
+    assert state.state == "3"
+    assert state.attributes["friendly_name"].startswith("Alicia ")
+    assert hass.states.get(assigned_to).state == "Alicia"
@@ -0,0 +1,226 @@
+"""Test SimpleChores compiled recurrence rules."""
+import calendar
+from datetime import date, timedelta
+from typing import List
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.simplechores.chore import Chore
+from custom_components.simplechores.recurrence import (
+    CompiledRule,
+    RecurrenceRule,
+    compile_rule,
+    month_table,
+    next_occurrences,
+)
+from custom_components.simplechores.storage_manager import SimpleChoresStorageManager
+
+START = date(2025, 6, 11)
+WORKDAYS = [0, 1, 2, 3, 4]
+# A whole Gregorian cycle; the calendar repeats every 400 years
+CYCLE_YEARS = range(2000, 2400)
+
+
+def _walk_monthly_weekday(year: int, month: int, week: int, weekday: int) -> date | None:
+    """Find a weekday of a month by walking week by week, as chores used to."""
+    first_of_month = date(year, month, 1)
+    occurrence = first_of_month + timedelta(days=(weekday - first_of_month.weekday()) % 7)
+    if week == -1:
+        while (occurrence + timedelta(weeks=1)).month == month:
+            occurrence += timedelta(weeks=1)
+        return occurrence
+    occurrence += timedelta(weeks=week - 1)
+    return occurrence if occurrence.month == month else None
+
+
+def _walk_next_monthly_weekday(weeks: List[int], weekdays: List[int], from_date: date) -> date:
+    """Find the next monthly weekday by checking every candidate, as chores used to."""
+    for month_offset in range(24):
+        month = from_date.month + month_offset
+        year = from_date.year + (month - 1) // 12
+        month = (month - 1) % 12 + 1
+        candidates = [
+            candidate
+            for week in weeks
+            for weekday in weekdays
+            if (candidate := _walk_monthly_weekday(year, month, week, weekday)) is not None
+            and candidate > from_date
+        ]
+        if candidates:
+            return min(candidates)
+    return from_date + timedelta(days=30)
+
+
+def test_setpos_picks_from_the_days_of_a_month() -> None:
+    """Test the last workday and the second Saturday or Sunday of a month."""
+    last_workday = Chore(
+        name="Payroll",
+        recurrence_pattern="monthly_weekday",
+        recurrence_specific_weekdays=WORKDAYS,
+        recurrence_setpos=[-1],
+        due_date=START,
+    )
+    assert list(last_workday.iter_occurrences(START, date(2025, 9, 30))) == [
+        START, date(2025, 6, 30), date(2025, 7, 31), date(2025, 8, 29), date(2025, 9, 30),
+    ]
+
+    second_weekend_day = Chore(
+        name="Garage",
+        recurrence_pattern="monthly_weekday",
+        recurrence_specific_weekdays=[5, 6],
+        recurrence_setpos=[2],
+    )
+    # June 2025 starts on a Sunday, so its weekend days are the 1st, 7th, 8th, ...
+    assert second_weekend_day.next_due_date(START) == date(2025, 7, 6)
+    assert second_weekend_day.next_due_date(date(2025, 6, 1)) == date(2025, 6, 7)
+
+
+def test_until_and_exdates_bound_the_occurrences() -> None:
+    """Test that UNTIL ends a chore and EXDATE days are skipped."""
+    chore = Chore(
+        name="Watering",
+        recurrence_pattern="interval_days",
+        recurrence_interval=2,
+        recurrence_until=START + timedelta(days=10),
+        recurrence_exdates=[START + timedelta(days=4)],
+        due_date=START,
+    )
+
+    assert [(day - START).days for day in chore.iter_occurrences(START)] == [0, 2, 6, 8, 10]
+    assert [(day - START).days for day in chore.iter_occurrences(START + timedelta(days=3))] == [6, 8, 10]
+    chore.mark_completed("Alice", completion_date=START + timedelta(days=2))
+    assert chore.due_date == START + timedelta(days=6)
+    chore.mark_completed("Alice", completion_date=START + timedelta(days=10))
+    assert chore.due_date is None
+
+
+def test_count_limits_the_remaining_occurrences() -> None:
+    """Test that a chore stops after its remaining occurrences were done."""
+    chore = Chore(name="Course", recurrence_pattern="specific_days", recurrence_specific_weekdays=[2], recurrence_count=2)
+    chore.due_date = START
+
+    assert list(chore.iter_occurrences(START)) == [START, START + timedelta(weeks=1), START + timedelta(weeks=2)]
+    for week in range(1, 3):
+        chore.mark_completed("Alice", completion_date=chore.due_date)
+        assert chore.due_date == START + timedelta(weeks=week)
+    chore.mark_completed("Alice", completion_date=chore.due_date)
+    assert chore.due_date is None
+    assert chore.recurrence_count == 0
+    assert list(chore.iter_occurrences(START)) == []
+
+
+def test_compiled_rules_are_shared_and_cached() -> None:
+    """Test that equal rules compile once and chores keep their compiled rule."""
+    first = Chore(name="Dishes", recurrence_pattern="specific_days", recurrence_specific_weekdays=[0, 3])
+    second = Chore(name="Trash", recurrence_pattern="specific_days", recurrence_specific_weekdays=[0, 3])
+
+    assert first.recurrence is first.recurrence
+    assert first.recurrence is second.recurrence
+    assert compile_rule(RecurrenceRule("WEEKLY", byday=((None, 0), (None, 3)))) is first.recurrence
+
+
+async def test_updating_a_chore_recompiles_its_rule(hass: HomeAssistant, mock_storage) -> None:
+    """Test that an edited chore is scheduled with its new rule."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    chore = Chore(name="Dishes", recurrence_pattern="daily")
+    storage.add_chore(storage.allocate_chore_id(), chore)
+    assert chore.next_due_date(START) == START + timedelta(days=1)
+
+    chore.recurrence_pattern = "interval_days"
+    chore.recurrence_interval = 5
+    # Until storage is told, the compiled rule is kept
+    assert chore.next_due_date(START) == START + timedelta(days=1)
+    storage.update_chore(chore.chore_id, chore)
+    assert chore.next_due_date(START) == START + timedelta(days=5)
+
+
+def test_month_table_matches_the_calendar() -> None:
+    """Test the month table against the calendar module for 400 years."""
+    for year in CYCLE_YEARS:
+        for month in range(1, 13):
+            assert month_table(year, month) == calendar.monthrange(year, month)
+
+
+def test_monthly_weekdays_match_walking_for_400_years() -> None:
+    """Test monthly weekday scheduling against the week by week walk for 400 years."""
+    rules = [([1, -1], [5]), ([-1], [4]), ([2, 4], [1, 3]), ([5], [0])]
+    for weeks, weekdays in rules:
+        chore = Chore(
+            name="Monthly",
+            recurrence_pattern="monthly_weekday",
+            recurrence_week_of_month=weeks,
+            recurrence_specific_weekdays=weekdays,
+        )
+        for year in CYCLE_YEARS:
+            for month in range(1, 13):
+                for from_date in (date(year, month, 1) - timedelta(days=1), date(year, month, 15)):
+                    assert chore.next_due_date(from_date) == _walk_next_monthly_weekday(weeks, weekdays, from_date)
+
+
+def test_last_workday_matches_walking_for_400_years() -> None:
+    """Test the last workday of each month against the week by week walk."""
+    chore = Chore(
+        name="Payroll",
+        recurrence_pattern="monthly_weekday",
+        recurrence_specific_weekdays=WORKDAYS,
+        recurrence_setpos=[-1],
+    )
+    for year in CYCLE_YEARS:
+        for month in range(1, 13):
+            expected = max(_walk_monthly_weekday(year, month, -1, weekday) for weekday in WORKDAYS)
+            assert chore.next_due_date(date(year, month, 1)) == expected
+
+
+def test_next_occurrences_match_iterating() -> None:
+    """Test bulk next occurrences against iterating each chore."""
+    chores = [
+        Chore(name="Daily", recurrence_pattern="daily"),
+        Chore(name="Interval", recurrence_pattern="interval_days", recurrence_interval=7),
+        Chore(name="Skipping", recurrence_pattern="interval_days", recurrence_interval=2,
+              recurrence_exdates=[START, START + timedelta(days=1)]),
+        Chore(name="Ended", recurrence_pattern="daily", recurrence_until=START - timedelta(days=1)),
+        Chore(name="Weekdays", recurrence_pattern="specific_days", recurrence_specific_weekdays=[1, 5]),
+        Chore(name="Payroll", recurrence_pattern="monthly_weekday", recurrence_specific_weekdays=WORKDAYS,
+              recurrence_setpos=[-1]),
+        Chore(name="Annual", recurrence_pattern="annual_day", recurrence_annual_month=2, recurrence_annual_day=29),
+        Chore(name="Once", recurrence_pattern="none"),
+    ]
+    rules, firsts, expected = [], [], []
+    for chore in chores:
+        for days_before in (0, 1, 5, 40, 1000):
+            chore.due_date = START - timedelta(days=days_before)
+            following = next(chore.iter_occurrences(START), None)
+            rules.append(chore.recurrence)
+            firsts.append(chore.due_date.toordinal())
+            expected.append(None if following is None else following.toordinal())
+
+    assert next_occurrences(rules, firsts, START.toordinal()) == expected
+
+
+def test_count_matches_iterating() -> None:
+    """Test counting occurrences against iterating them."""
+    chores = [
+        Chore(name="Interval", recurrence_pattern="interval_days", recurrence_interval=3,
+              recurrence_exdates=[START + timedelta(days=6), START + timedelta(days=7), START]),
+        Chore(name="Ending", recurrence_pattern="daily", recurrence_until=START + timedelta(days=20)),
+        Chore(name="Weekdays", recurrence_pattern="specific_days", recurrence_specific_weekdays=[1, 5]),
+        Chore(name="Once", recurrence_pattern="none"),
+    ]
+    for chore in chores:
+        rule = chore.recurrence
+        for days in (-1, 0, 1, 6, 7, 30, 400):
+            end = START + timedelta(days=days)
+            assert rule.count(START, end) == len(list(rule.iterate(START, end=end)))
+
+
+def test_limited_iteration_jumps_to_start() -> None:
+    """Test that a count-limited fixed-period chore starts late without walking."""
+    chore = Chore(name="Course", recurrence_pattern="interval_days", recurrence_interval=2, recurrence_count=5)
+    chore.due_date = START
+    expected = [START + timedelta(days=days) for days in (6, 8, 10)]
+
+    with patch.object(CompiledRule, "after", autospec=True, side_effect=CompiledRule.after) as after:
+        assert list(chore.iter_occurrences(START + timedelta(days=5))) == expected
+    assert after.call_count == len(expected)
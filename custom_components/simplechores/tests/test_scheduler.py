@@ -0,0 +1,88 @@
+"""Test SimpleChores scheduler."""
+from datetime import date, timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.simplechores.chore import Chore
+from custom_components.simplechores.const import (
+    CHORE_STATE_COMPLETED,
+    CHORE_STATE_OVERDUE,
+    CHORE_STATE_PENDING,
+)
+from custom_components.simplechores.coordinator import SimpleChoresCoordinator
+from custom_components.simplechores.scheduler import SimpleChoresScheduler
+from custom_components.simplechores.storage_manager import SimpleChoresStorageManager
+
+
+def _start_of(day: date):
+    """Return the start of a local day in UTC."""
+    return dt_util.as_utc(dt_util.start_of_local_day(day))
+
+
+async def _setup(hass: HomeAssistant, **chores: Chore) -> tuple:
+    """Load storage with chores and start a scheduler."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    for chore_id, chore in chores.items():
+        storage.add_chore(chore_id, chore)
+    scheduler = SimpleChoresScheduler(hass, storage, SimpleChoresCoordinator(hass, storage))
+    scheduler.async_start()
+    return storage, scheduler
+
+
+async def test_chore_transitions_at_due_date(hass: HomeAssistant, mock_storage) -> None:
+    """Test that a chore becomes pending and then overdue exactly on time."""
+    tomorrow = dt_util.now().date() + timedelta(days=1)
+    chore = Chore(name="Dishes", status=CHORE_STATE_COMPLETED, due_date=tomorrow.isoformat())
+    storage, scheduler = await _setup(hass, dishes=chore)
+
+    assert scheduler.next_fire == _start_of(tomorrow)
+
+    async_fire_time_changed(hass, _start_of(tomorrow))
+    await hass.async_block_till_done()
+    assert chore.status == CHORE_STATE_PENDING
+    assert storage.get_assigned_chore_ids(None, CHORE_STATE_PENDING) == {"dishes"}
+    assert scheduler.next_fire == _start_of(tomorrow + timedelta(days=1))
+
+    async_fire_time_changed(hass, _start_of(tomorrow + timedelta(days=1)))
+    await hass.async_block_till_done()
+    assert chore.status == CHORE_STATE_OVERDUE
+    # Only the next period boundary is left
+    assert scheduler.next_fire == _start_of(tomorrow + timedelta(days=2))
+
+    scheduler.async_stop()
+
+
+async def test_start_catches_up_missed_transitions(hass: HomeAssistant, mock_storage) -> None:
+    """Test that chores due while Home Assistant was stopped are updated on start."""
+    today = dt_util.now().date()
+    late = Chore(name="Dishes", status=CHORE_STATE_PENDING, due_date=(today - timedelta(days=2)).isoformat())
+    due = Chore(name="Laundry", status=CHORE_STATE_COMPLETED, due_date=today.isoformat())
+    _, scheduler = await _setup(hass, late=late, due=due)
+
+    assert late.status == CHORE_STATE_OVERDUE
+    assert due.status == CHORE_STATE_PENDING
+    assert scheduler.next_fire == _start_of(today + timedelta(days=1))
+
+    scheduler.async_stop()
+
+
+async def test_rescheduled_chore_follows_new_due_date(hass: HomeAssistant, mock_storage) -> None:
+    """Test that storage updates move a chore's transition in the heap."""
+    tomorrow = dt_util.now().date() + timedelta(days=1)
+    chore = Chore(name="Dishes", status=CHORE_STATE_COMPLETED, due_date=(tomorrow + timedelta(days=5)).isoformat())
+    other = Chore(name="Laundry", status=CHORE_STATE_COMPLETED, due_date=tomorrow.isoformat())
+    storage, scheduler = await _setup(hass, dishes=chore, laundry=other)
+
+    chore.due_date = tomorrow
+    storage.update_chore("dishes", chore)
+    storage.delete_chore("laundry")
+
+    async_fire_time_changed(hass, _start_of(tomorrow))
+    await hass.async_block_till_done()
+    assert chore.status == CHORE_STATE_PENDING
+    assert other.status == CHORE_STATE_COMPLETED
+
+    scheduler.async_stop()
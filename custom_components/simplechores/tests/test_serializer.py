@@ -0,0 +1,88 @@
+"""Test SimpleChores model serializers."""
+import dataclasses
+from datetime import date, datetime
+
+import pytest
+
+from custom_components.simplechores.chore import Chore
+from custom_components.simplechores.member import Member
+
+CHORES = [
+    Chore(name="Dishes"),
+    Chore(
+        name="Laundry",
+        points=5,
+        status="overdue",
+        last_completed=date(2025, 6, 1),
+        due_date=date(2025, 6, 8),
+        assignment_mode="rotate",
+        assigned_to=2,
+        possible_assignees=[1, 2],
+        recurrence_pattern="specific_days",
+        recurrence_specific_weekdays=[0, 3],
+        area_id="laundry_room",
+        created_at=datetime(2025, 1, 2, 8, 30),
+    ),
+    Chore(
+        name="Gutters",
+        recurrence_pattern="monthly_weekday",
+        recurrence_week_of_month=[1, -1],
+        recurrence_specific_weekdays=[5],
+    ),
+    Chore(name="Taxes", recurrence_pattern="annual", recurrence_annual_month=4, recurrence_annual_day=15),
+    Chore(
+        name="Payroll",
+        recurrence_pattern="monthly_weekday",
+        recurrence_specific_weekdays=[0, 1, 2, 3, 4],
+        recurrence_setpos=[-1],
+        recurrence_until=date(2026, 12, 31),
+        recurrence_count=10,
+        recurrence_exdates=[date(2025, 12, 31)],
+    ),
+]
+
+
+def _legacy_chore_dict(chore: Chore) -> dict:
+    """Serialize a chore the way dataclasses.asdict did, with ISO dates."""
+    data = dataclasses.asdict(chore)
+    del data["_recurrence"]
+    for key in ("last_completed", "due_date", "recurrence_until", "created_at"):
+        if data[key] is not None:
+            data[key] = data[key].isoformat()
+    data["recurrence_exdates"] = [day.isoformat() for day in data["recurrence_exdates"]]
+    return data
+
+
+@pytest.mark.parametrize("chore", CHORES, ids=lambda chore: chore.name)
+def test_chore_to_dict_matches_asdict(chore: Chore) -> None:
+    """Test that the generated serializer matches the asdict output."""
+    data = chore.to_dict()
+    assert data == _legacy_chore_dict(chore)
+    assert list(data) == [f.name for f in dataclasses.fields(Chore) if f.name != "_recurrence"]
+    # Lists are copied, not shared with the live chore
+    assert data["possible_assignees"] is not chore.possible_assignees
+
+
+@pytest.mark.parametrize("chore", CHORES, ids=lambda chore: chore.name)
+def test_chore_round_trip(chore: Chore) -> None:
+    """Test that a stored chore loads back to an equal chore."""
+    loaded = Chore.from_dict(chore.to_dict())
+    assert _legacy_chore_dict(loaded) == _legacy_chore_dict(chore)
+
+
+def test_chore_from_dict_defaults_and_legacy_values() -> None:
+    """Test missing keys and the single-int week of month of older versions."""
+    chore = Chore.from_dict({"name": "Old", "recurrence_week_of_month": 2, "due_date": "2025-06-11"})
+    assert chore.points == 0
+    assert chore.possible_assignees == []
+    assert chore.recurrence_week_of_month == [2]
+    assert chore.due_date == date(2025, 6, 11)
+
+
+def test_member_to_dict_matches_asdict() -> None:
+    """Test that the generated member serializer matches asdict."""
+    member = Member(name="Alice", member_id=4, points_earned_today=3, chores_completed_this_year=12)
+    data = member.to_dict()
+    assert data == dataclasses.asdict(member)
+    assert data["period_keys"] is not member.period_keys
+    assert Member.from_dict(data) == member
@@ -2,8 +2,12 @@
 import pytest
 from datetime import date, timedelta
 
+from unittest.mock import patch
+
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from custom_components.simplechores.chore import Chore
 from custom_components.simplechores.const import (
@@ -11,9 +15,15 @@ from custom_components.simplechores.const import (
     SERVICE_UPDATE_POINTS,
     SERVICE_RESET_POINTS,
     SERVICE_RESCHEDULE_CHORE,
+    SERVICE_COMPLETE_CHORES,
+    SERVICE_TOGGLE_CHORE,
+    SERVICE_QUERY_CHORES,
+    SERVICE_FORECAST,
+    SERVICE_RECOMPUTE_SCHEDULE,
     TRACKER_PERIOD_TODAY,
     TRACKER_PERIOD_THIS_WEEK,
 )
+from custom_components.simplechores.recurrence import CompiledRule
 
 
 async def test_update_points_service(hass: HomeAssistant, mock_config_entry) -> None:
@@ -190,7 +200,7 @@ async def test_reschedule_chore_service_exact_date(hass: HomeAssistant, mock_con
     await hass.async_block_till_done()
 
     # Call reschedule_chore service with exact date
-    new_due_date = date.today() + timedelta(days=7)
+    new_due_date = dt_util.now().date() + timedelta(days=7)
     await hass.services.async_call(
         DOMAIN,
         SERVICE_RESCHEDULE_CHORE,
@@ -233,7 +243,7 @@ async def test_reschedule_chore_service_days_from_now(hass: HomeAssistant, mock_
 
     # Call reschedule_chore service with days_from_now
     days_from_now = 3
-    expected_date = date.today() + timedelta(days=days_from_now)
+    expected_date = dt_util.now().date() + timedelta(days=days_from_now)
     await hass.services.async_call(
         DOMAIN,
         SERVICE_RESCHEDULE_CHORE,
@@ -275,7 +285,7 @@ async def test_reschedule_chore_service_default_today(hass: HomeAssistant, mock_
     await hass.async_block_till_done()
 
     # Call reschedule_chore service with no date parameters (should default to today)
-    today = date.today()
+    today = dt_util.now().date()
     await hass.services.async_call(
         DOMAIN,
         SERVICE_RESCHEDULE_CHORE,
@@ -287,3 +297,311 @@ async def test_reschedule_chore_service_default_today(hass: HomeAssistant, mock_
     updated_chore = storage.get_chore(test_chore.chore_id)
     assert updated_chore.due_date == today.isoformat()
     assert updated_chore.status == "pending"  # Today = pending status
+
+
+async def test_complete_chores_batch(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test completing several chores with one journal record and one update."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    today = dt_util.now().date().isoformat()
+    alice, bob = storage.get_member_id("Alice"), storage.get_member_id("Bob")
+    storage.add_chore("dishes", Chore(name="Dishes", points=5, due_date=today, area_id="kitchen", assigned_to=alice))
+    storage.add_chore("floor", Chore(name="Floor", points=3, due_date=today, area_id="kitchen", assigned_to=bob))
+    storage.add_chore("done", Chore(name="Done", status="completed", area_id="kitchen", assigned_to=alice))
+    storage.add_chore("laundry", Chore(name="Laundry", points=2, due_date=today, assigned_to=alice))
+
+    with patch.object(
+        storage, "async_journal", wraps=storage.async_journal
+    ) as async_journal, patch.object(
+        coordinator, "async_publish_changes", wraps=coordinator.async_publish_changes
+    ) as publish:
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_COMPLETE_CHORES,
+            {"area_id": "kitchen", "chore_id": ["laundry", "missing"]},
+            blocking=True,
+            return_response=True,
+        )
+
+    results = response["chores"]
+    assert results["dishes"]["result"] == "completed"
+    assert results["dishes"]["completed_by"] == "Alice"
+    assert results["floor"]["completed_by"] == "Bob"
+    assert results["laundry"]["result"] == "completed"
+    assert results["done"]["result"] == "already_completed"
+    assert results["missing"]["result"] == "not_found"
+    assert async_journal.call_count == 1
+    assert publish.call_count == 1
+
+    assert storage.get_member("Alice").get_points(TRACKER_PERIOD_TODAY) == 7
+    assert storage.get_member("Bob").get_points(TRACKER_PERIOD_TODAY) == 3
+
+
+async def test_service_targets_resolved_without_states(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that entity, device and chore ID targets resolve through the registries."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    today = dt_util.now().date()
+    for chore_id in ("dishes", "floor", "laundry"):
+        storage.add_chore(chore_id, Chore(
+            name=chore_id.capitalize(),
+            due_date=today.isoformat(),
+            assigned_to=storage.get_member_id("Alice"),
+        ))
+        coordinator.async_add_chore_entities(chore_id)
+    await hass.async_block_till_done()
+
+    entity_id = er.async_get(hass).async_get_entity_id("number", DOMAIN, f"{DOMAIN}_dishes_points")
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "chore_floor")})
+    # Services must not depend on the state machine
+    hass.states.async_remove(entity_id)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_RESCHEDULE_CHORE,
+        {"entity_id": entity_id, "device_id": device.id, "days_from_now": 3},
+        blocking=True,
+    )
+
+    due = today + timedelta(days=3)
+    assert storage.get_chore("dishes").due_date == due
+    assert storage.get_chore("floor").due_date == due
+    assert storage.get_chore("laundry").due_date == today
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_TOGGLE_CHORE,
+        {"chore_id": "laundry", "member": "Bob"},
+        blocking=True,
+    )
+    assert storage.get_chore("laundry").status == "completed"
+
+
+async def test_query_chores(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test filtering, sorting and paginating chores with query_chores."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    today = dt_util.now().date()
+    for offset, (chore_id, assignee, status) in enumerate([
+        ("dishes", "Alice", "pending"),
+        ("floor", "Alice", "overdue"),
+        ("laundry", "Bob", "pending"),
+        ("trash", "Alice", "completed"),
+        ("windows", "Alice", "pending"),
+    ]):
+        storage.add_chore(chore_id, Chore(
+            name=chore_id.capitalize(),
+            status=status,
+            assigned_to=storage.get_member_id(assignee),
+            due_date=(today + timedelta(days=offset)).isoformat(),
+            area_id="kitchen" if chore_id != "windows" else None,
+        ))
+
+    async def query(**data):
+        return await hass.services.async_call(
+            DOMAIN, SERVICE_QUERY_CHORES, data, blocking=True, return_response=True
+        )
+
+    response = await query(member="Alice", status=["pending", "overdue"])
+    assert response["total"] == 3
+    assert [chore["chore_id"] for chore in response["chores"]] == ["dishes", "floor", "windows"]
+
+    response = await query(
+        area_id="kitchen",
+        due_from=today + timedelta(days=1),
+        due_to=today + timedelta(days=3),
+        sort_by="name",
+        descending=True,
+    )
+    assert [chore["chore_id"] for chore in response["chores"]] == ["trash", "laundry", "floor"]
+
+    response = await query(limit=2, offset=3)
+    assert response["total"] == 5
+    assert [chore["chore_id"] for chore in response["chores"]] == ["trash", "windows"]
+
+
+async def test_forecast(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test the per-member, per-day load forecast."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    alice, bob = storage.get_member_id("Alice"), storage.get_member_id("Bob")
+    start = date(2025, 6, 9)  # A Monday
+    storage.add_chore("dishes", Chore(
+        name="Dishes",
+        points=2,
+        due_date=start,
+        assignment_mode="rotate",
+        assigned_to=bob,
+        possible_assignees=[alice, bob],
+    ))
+    storage.add_chore("trash", Chore(
+        name="Trash",
+        points=5,
+        due_date=start + timedelta(days=3),
+        recurrence_pattern="specific_days",
+        recurrence_specific_weekdays=[3],
+        assigned_to=alice,
+        possible_assignees=[alice],
+    ))
+    storage.add_chore("windows", Chore(name="Windows", points=1, due_date=start, recurrence_pattern="none"))
+    due_dates = {chore_id: chore.due_date for chore_id, chore in storage.get_chores().items()}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FORECAST,
+        {"start_date": start, "days": 14},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["end_date"] == "2025-06-22"
+    alice_load = response["members"]["Alice"]
+    bob_load = response["members"]["Bob"]
+    # Dishes rotate daily starting with Bob; trash is every Thursday
+    assert bob_load["chores"] == 7
+    assert alice_load["chores"] == 7 + 2
+    assert bob_load["days"]["2025-06-09"] == {"chores": 1, "points": 2}
+    assert alice_load["days"]["2025-06-12"] == {"chores": 2, "points": 7}
+    assert alice_load["points"] == 7 * 2 + 2 * 5
+    assert response["unassigned"]["days"] == {"2025-06-09": {"chores": 1, "points": 1}}
+    # Forecasting does not touch the chores
+    assert {chore_id: chore.due_date for chore_id, chore in storage.get_chores().items()} == due_dates
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_FORECAST, {"start_date": start, "days": 1, "member": "Alice"},
+        blocking=True, return_response=True,
+    )
+    assert list(response["members"]) == ["Alice"]
+    assert "unassigned" not in response
+
+
+async def test_forecast_starting_after_due_date(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that rotations advance over the occurrences before the forecast starts."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    alice, bob = storage.get_member_id("Alice"), storage.get_member_id("Bob")
+    due = date(2025, 10, 17)
+    storage.add_chore("dishes", Chore(
+        name="Dishes",
+        due_date=due,
+        assignment_mode="rotate",
+        assigned_to=alice,
+        possible_assignees=[alice, bob],
+    ))
+    storage.add_chore("trash", Chore(
+        name="Trash",
+        due_date=due,
+        assignment_mode="always",
+        assigned_to=alice,
+        possible_assignees=[alice, bob],
+    ))
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_FORECAST, {"start_date": due + timedelta(days=1), "days": 2},
+        blocking=True, return_response=True,
+    )
+
+    # Alice does the dishes on the 17th, so Bob has them on the 18th
+    assert response["members"]["Bob"]["days"] == {"2025-10-18": {"chores": 1, "points": 0}}
+    assert response["members"]["Alice"]["days"] == {
+        "2025-10-18": {"chores": 1, "points": 0},
+        "2025-10-19": {"chores": 2, "points": 0},
+    }
+
+
+async def test_forecast_skips_a_long_backlog(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that a chore overdue for years is forecast without walking its backlog."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    alice, bob = storage.get_member_id("Alice"), storage.get_member_id("Bob")
+    start = date(2025, 10, 18)
+    storage.add_chore("dishes", Chore(
+        name="Dishes",
+        due_date=date(2016, 1, 1),
+        recurrence_pattern="daily",
+        assignment_mode="rotate",
+        assigned_to=alice,
+        possible_assignees=[alice, bob],
+    ))
+
+    with patch.object(CompiledRule, "after", autospec=True, side_effect=CompiledRule.after) as after:
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_FORECAST, {"start_date": start, "days": 2},
+            blocking=True, return_response=True,
+        )
+    assert after.call_count <= 2
+
+    # 3578 days lie between the due date and the 18th, an even number of turns
+    assert (start - date(2016, 1, 1)).days == 3578
+    assert response["members"]["Alice"]["days"] == {"2025-10-18": {"chores": 1, "points": 0}}
+    assert response["members"]["Bob"]["days"] == {"2025-10-19": {"chores": 1, "points": 0}}
+
+
+async def test_recompute_schedule(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that missed due dates move to the next occurrence and statuses are fixed."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    storage = hass.data[DOMAIN][mock_config_entry.entry_id]["storage"]
+    today = date(2025, 6, 11)  # A Wednesday
+    long_ago = today - timedelta(days=100)
+    storage.add_chore("watering", Chore(
+        name="Watering", due_date=long_ago, recurrence_pattern="interval_days", recurrence_interval=3
+    ))
+    storage.add_chore("trash", Chore(
+        name="Trash", due_date=long_ago, recurrence_pattern="specific_days", recurrence_specific_weekdays=[3]
+    ))
+    storage.add_chore("course", Chore(
+        name="Course", due_date=today - timedelta(days=14), recurrence_pattern="specific_days",
+        recurrence_specific_weekdays=[2], recurrence_count=3,
+    ))
+    storage.add_chore("lessons", Chore(
+        name="Lessons", due_date=today - timedelta(days=70), recurrence_pattern="interval_days",
+        recurrence_interval=7, recurrence_count=20, recurrence_exdates=[today - timedelta(days=35)],
+    ))
+    storage.add_chore("windows", Chore(name="Windows", due_date=long_ago, recurrence_pattern="none"))
+    # Restored with a stale status
+    storage.add_chore("dishes", Chore(name="Dishes", due_date=today, status="completed"))
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_RECOMPUTE_SCHEDULE, {"date": today}, blocking=True, return_response=True,
+    )
+
+    assert response == {"changed": 6}
+    chores = storage.get_chores()
+    # 100 days after the due date, the next day of the every-3-days grid is 2 days ahead
+    assert chores["watering"].due_date == today + timedelta(days=2)
+    assert chores["watering"].status == "completed"
+    assert chores["trash"].due_date == today + timedelta(days=1)
+    # Two of the three remaining occurrences were missed
+    assert chores["course"].due_date == today
+    assert chores["course"].status == "pending"
+    assert chores["course"].recurrence_count == 1
+    # Ten weekly occurrences were missed, one of them excluded
+    assert chores["lessons"].due_date == today
+    assert chores["lessons"].recurrence_count == 11
+    # One-off chores stay overdue
+    assert chores["windows"].due_date == long_ago
+    assert chores["windows"].status == "overdue"
+    assert chores["dishes"].status == "pending"
@@ -0,0 +1,155 @@
+"""Test SimpleChores coordinator snapshots."""
+import dataclasses
+from datetime import date, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.simplechores.chore import Chore
+from custom_components.simplechores.const import DOMAIN
+from custom_components.simplechores.coordinator import (
+    KEY_CHORE,
+    KEY_MEMBER,
+    SimpleChoresCoordinator,
+)
+from custom_components.simplechores.member import Member
+from custom_components.simplechores.snapshot import build_snapshot
+from custom_components.simplechores.storage_manager import SimpleChoresStorageManager
+
+TODAY = date(2025, 6, 11)
+
+
+async def test_snapshot_values(hass: HomeAssistant, mock_storage) -> None:
+    """Test the precomputed member and chore values."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    alice = Member(name="Alice")
+    alice.add_points(7, TODAY)
+    storage.add_member(alice)
+    member_id = alice.member_id
+    storage.add_chore("b", Chore(name="Dishes", assigned_to=member_id, due_date=TODAY.isoformat()))
+    storage.add_chore("a", Chore(name="Laundry", assigned_to=member_id, status="overdue", due_date="2025-06-09"))
+    storage.add_chore("c", Chore(name="Trash", assigned_to=member_id, status="completed", due_date="2025-06-14"))
+
+    snapshot = build_snapshot(storage, TODAY)
+
+    member = snapshot.members["Alice"]
+    assert member.points["today"] == 7
+    assert member.points["this_week"] == 7
+    assert member.chores_completed["today"] == 0
+    assert member.pending_chore_ids == ("b",)
+    assert member.overdue_chore_ids == ("a",)
+    assert member.assigned_chore_ids == ("a", "b", "c")
+    assert snapshot.chores["a"].due_in_days == -2
+    assert snapshot.chores["c"].due_date == date(2025, 6, 14)
+    assert snapshot.chores["c"].due_in_days == 3
+    # Member IDs are resolved to names
+    assert snapshot.chores["a"].assigned_to == "Alice"
+
+    # The same storage read on the next day only changes the day-bound values
+    assert build_snapshot(storage, TODAY + timedelta(days=1)).members["Alice"].points["today"] == 0
+
+
+async def test_snapshot_is_immutable(hass: HomeAssistant, mock_storage) -> None:
+    """Test that entities cannot modify a snapshot."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    storage.add_chore("a", Chore(name="Dishes"))
+    snapshot = build_snapshot(storage, TODAY)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.chores["a"].points = 3
+    with pytest.raises(TypeError):
+        snapshot.members["Alice"].points["today"] = 3
+    with pytest.raises(TypeError):
+        snapshot.chores["b"] = snapshot.chores["a"]
+
+
+async def test_sensors_read_from_snapshot(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test that member sensors show the coordinator snapshot."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entry_data = hass.data[DOMAIN][mock_config_entry.entry_id]
+    storage = entry_data["storage"]
+    storage.get_member("Alice").add_points(5)
+    storage.update_member(storage.get_member("Alice"))
+
+    # Storage changes show up only once a new snapshot is published
+    assert hass.states.get("sensor.alice_points_earned_today").state == "0"
+    entry_data["coordinator"].async_update_from_storage()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.alice_points_earned_today").state == "5"
+
+    # A published member change updates the member's subscribed sensors
+    storage.get_member("Alice").add_points(3)
+    storage.update_member(storage.get_member("Alice"))
+    entry_data["coordinator"].async_publish_changes(member_names=["Alice"])
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.alice_points_earned_today").state == "8"
+
+
+async def test_publish_changes_updates_only_subscribers(hass: HomeAssistant, mock_storage) -> None:
+    """Test that published changes reach only the chores and members they concern."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    for name in ("Alice", "Bob", "Carol"):
+        storage.add_member(Member(name=name))
+    dishes = Chore(name="Dishes", assigned_to=storage.get_member_id("Alice"))
+    storage.add_chore("a", dishes)
+    storage.add_chore("b", Chore(name="Laundry", assigned_to=storage.get_member_id("Carol")))
+    coordinator = SimpleChoresCoordinator(hass, storage)
+    await coordinator.async_refresh()
+
+    calls = []
+    everything = Mock()
+    coordinator.async_add_listener(everything)
+    alice, bob, carol = (storage.get_member_id(name) for name in ("Alice", "Bob", "Carol"))
+    for key in [(KEY_CHORE, "a"), (KEY_CHORE, "b")] + [(KEY_MEMBER, n) for n in (alice, bob, carol)]:
+        coordinator.async_add_key_listener(key, lambda key=key: calls.append(key))
+
+    dishes.assigned_to = bob
+    storage.update_chore("a", dishes)
+    coordinator.async_publish_changes(chore_ids=["a"])
+
+    # The chore and both its old and new assignee, nothing else
+    assert sorted(calls) == [(KEY_CHORE, "a"), (KEY_MEMBER, alice), (KEY_MEMBER, bob)]
+    everything.assert_not_called()
+    assert coordinator.data.members["Bob"].assigned_chore_ids == ("a",)
+    assert coordinator.data.members["Alice"].assigned_chore_ids == ()
+
+
+async def test_dates_are_only_parsed_on_load(hass: HomeAssistant, mock_storage) -> None:
+    """Test that coordinator ticks work on native dates without parsing."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    for offset in range(-2, 3):
+        chore = Chore.from_dict({
+            "name": f"Chore {offset}",
+            "assigned_to": 1,
+            "due_date": (TODAY + timedelta(days=offset)).isoformat(),
+            "last_completed": (TODAY - timedelta(days=7)).isoformat(),
+            "created_at": "2025-01-01T08:00:00",
+        })
+        assert isinstance(chore.due_date, date)
+        storage.add_chore(str(offset), chore)
+    coordinator = SimpleChoresCoordinator(hass, storage)
+
+    with patch(
+        "custom_components.simplechores.chore._parse_date"
+    ) as parse_date, patch(
+        "custom_components.simplechores.chore._parse_datetime"
+    ) as parse_datetime:
+        storage.update_chore_statuses(TODAY)
+        await coordinator.async_refresh()
+        coordinator.async_publish_changes(chore_ids=["0"])
+        snapshot = build_snapshot(storage, TODAY + timedelta(days=1))
+
+    assert parse_date.call_count == 0
+    assert parse_datetime.call_count == 0
+    assert snapshot.chores["1"].due_in_days == 0
+    assert storage.get_chore("-1").to_dict()["due_date"] == (TODAY - timedelta(days=1)).isoformat()
@@ -0,0 +1,499 @@
+"""Test SimpleChores storage manager."""
+from datetime import date, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.simplechores.const import (
+    DOMAIN,
+    JOURNAL_OP_COMPLETION,
+    JOURNAL_OP_POINTS_OFFSET,
+    SAVE_DELAY,
+    SAVE_MAX_DELAY,
+    STORAGE_VERSION,
+)
+from custom_components.simplechores.chore import Chore
+from custom_components.simplechores.member import Member
+from custom_components.simplechores.storage_manager import SimpleChoresStorageManager
+
+
+async def test_reads_return_live_objects(hass: HomeAssistant, mock_storage) -> None:
+    """Test that repeated reads return the same chore and member objects."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+
+    chore = Chore(name="Dishes", points=5)
+    storage.add_chore(storage.allocate_chore_id(), chore)
+    storage.add_member(Member(name="Alice"))
+
+    assert storage.get_chore(chore.chore_id) is chore
+    assert storage.get_chores()[chore.chore_id] is chore
+    assert storage.get_member("Alice") is storage.get_members()["Alice"]
+
+
+async def test_serializes_only_dirty_objects_on_save(hass: HomeAssistant, mock_storage) -> None:
+    """Test that objects are converted to dicts only when saving, and only if dirty."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+
+    first = Chore(name="Dishes")
+    second = Chore(name="Laundry")
+    storage.add_chore(storage.allocate_chore_id(), first)
+    storage.add_chore(storage.allocate_chore_id(), second)
+    await storage.async_flush()
+    assert not storage.is_dirty
+
+    with patch.object(Chore, "to_dict", autospec=True, side_effect=Chore.to_dict) as to_dict:
+        first.points = 3
+        storage.update_chore(first.chore_id, first)
+        assert to_dict.call_count == 0
+
+        await storage.async_flush()
+        assert to_dict.call_count == 1
+
+    assert storage.data["chores"][first.chore_id]["points"] == 3
+
+
+async def test_load_restores_chore_id_from_storage_key(hass: HomeAssistant, mock_storage) -> None:
+    """Test that loaded chores keep the ID they are stored under."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    chore = Chore(name="Dishes")
+    storage.add_chore("123456", chore)
+    storage.add_member(Member(name="Alice", points_earned_today=4))
+    await storage.async_flush()
+
+    reloaded = SimpleChoresStorageManager(hass)
+    await reloaded.async_load()
+
+    assert reloaded.get_chore("123456").chore_id == "123456"
+    assert reloaded.get_member("Alice").points_earned_today == 4
+
+
+async def test_delete_is_persisted(hass: HomeAssistant, mock_storage) -> None:
+    """Test that deleting objects removes them from the saved data."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    chore = Chore(name="Dishes")
+    storage.add_chore(storage.allocate_chore_id(), chore)
+    storage.add_member(Member(name="Alice"))
+    await storage.async_flush()
+
+    assert storage.delete_chore(chore.chore_id)
+    assert storage.delete_member("Alice")
+    assert not storage.delete_member("Alice")
+    await storage.async_flush()
+
+    assert chore.chore_id not in storage.data["chores"]
+    assert storage.data["members"] == {}
+
+
+async def test_saves_are_coalesced(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test that saves are handed to the store as one delayed write."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+
+    with patch.object(storage.store, "async_delay_save") as delay_save:
+        storage.add_member(Member(name="Alice"))
+        await storage.async_save()
+        storage.add_member(Member(name="Bob"))
+        await storage.async_save()
+
+    assert f"{DOMAIN}.json" not in hass_storage
+    assert storage.save_pending
+    assert [call.args[1] for call in delay_save.call_args_list] == [SAVE_DELAY, SAVE_DELAY]
+
+    # The store serializes lazily through the data function when it writes
+    data_func = delay_save.call_args.args[0]
+    assert set(data_func()["members"]) == {"1", "2"}
+    assert not storage.save_pending
+
+
+async def test_save_latency_is_bounded(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test that a steady stream of saves cannot postpone the write forever."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+
+    with patch.object(storage.store, "async_delay_save") as delay_save, patch(
+        "custom_components.simplechores.storage_manager.time.monotonic"
+    ) as monotonic:
+        for elapsed in range(0, SAVE_MAX_DELAY, SAVE_DELAY - 1):
+            monotonic.return_value = elapsed
+            await storage.async_save()
+            write_at = elapsed + delay_save.call_args.args[1]
+            assert write_at <= SAVE_MAX_DELAY
+
+
+async def test_flush_writes_immediately(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test that a forced flush writes pending changes right away."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    await storage.async_save()
+
+    await storage.async_flush()
+
+    assert hass_storage[f"{DOMAIN}.json"]["data"]["members"]["1"]["name"] == "Alice"
+    assert not storage.save_pending
+
+
+async def test_journaled_change_is_replayed_on_load(
+    hass: HomeAssistant, mock_storage, journal_file
+) -> None:
+    """Test that a journaled mutation survives a restart without a snapshot write."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    chore = Chore(name="Dishes", points=5)
+    storage.add_chore("123456", chore)
+    storage.add_member(Member(name="Alice"))
+    await storage.async_flush()
+
+    chore.mark_completed("Alice", storage)
+    storage.update_chore("123456", chore)
+    await storage.async_journal(
+        JOURNAL_OP_COMPLETION, chore_ids=["123456"], member_names=["Alice"]
+    )
+
+    # Only the journal was written; the snapshot still has the old state
+    assert storage.data["chores"]["123456"]["status"] == "pending"
+    assert len(journal_file.read_text().splitlines()) == 1
+
+    reloaded = SimpleChoresStorageManager(hass)
+    await reloaded.async_load()
+
+    assert reloaded.get_chore("123456").status == "completed"
+    assert reloaded.get_member("Alice").points_earned_this_year == 5
+
+
+async def test_journal_is_compacted_into_snapshot(
+    hass: HomeAssistant, mock_storage, journal_file
+) -> None:
+    """Test that the snapshot is rewritten and the journal truncated after N records."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    member = storage.get_member("Alice")
+
+    with patch(
+        "custom_components.simplechores.storage_manager.JOURNAL_MAX_RECORDS", 3
+    ):
+        for _ in range(3):
+            member.add_points(1)
+            await storage.async_journal(
+                JOURNAL_OP_POINTS_OFFSET, member_names=["Alice"], offset=1
+            )
+
+    assert storage.data["members"]["1"]["points_earned_this_year"] == 3
+    assert storage.data["journal_seq"] == 3
+    assert journal_file.read_text() == ""
+
+    reloaded = SimpleChoresStorageManager(hass)
+    await reloaded.async_load()
+    assert reloaded.get_member("Alice").points_earned_this_year == 3
+
+
+async def test_truncated_journal_record_is_ignored(
+    hass: HomeAssistant, mock_storage, journal_file
+) -> None:
+    """Test that a partially written last record does not break loading."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    storage.get_member("Alice").add_points(2)
+    await storage.async_journal(JOURNAL_OP_POINTS_OFFSET, member_names=["Alice"])
+
+    with open(journal_file, "a", encoding="utf-8") as journal:
+        journal.write('{"seq": 2, "op": "points_off')
+
+    reloaded = SimpleChoresStorageManager(hass)
+    await reloaded.async_load()
+
+    assert reloaded.get_member("Alice").points_earned_this_year == 2
+    assert reloaded.journal.seq == 1
+
+
+async def test_chore_index_follows_updates(hass: HomeAssistant, mock_storage) -> None:
+    """Test that the secondary indexes track add, in-place update and delete."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    storage.add_member(Member(name="Bob"))
+    alice, bob = storage.get_member_id("Alice"), storage.get_member_id("Bob")
+    dishes = Chore(name="Dishes", assigned_to=alice, area_id="kitchen", due_date="2025-01-01")
+    laundry = Chore(name="Laundry", assigned_to=alice, status="overdue")
+    storage.add_chore("1", dishes)
+    storage.add_chore("2", laundry)
+
+    assert storage.get_assigned_chore_ids("Alice") == {"1", "2"}
+    assert storage.get_assigned_chore_ids("Alice", "pending") == {"1"}
+    assert storage.get_chore_ids_by("area_id", "kitchen") == {"1"}
+    assert storage.get_chore_ids_by("due_date", date(2025, 1, 1)) == {"1"}
+
+    dishes.assigned_to = bob
+    dishes.status = "overdue"
+    storage.update_chore("1", dishes)
+
+    assert storage.get_assigned_chore_ids("Alice") == {"2"}
+    assert storage.get_assigned_chore_ids("Alice", "pending") == set()
+    assert storage.get_assigned_chore_ids("Bob", "overdue") == {"1"}
+    assert storage.get_chore_ids_by("status", "overdue") == {"1", "2"}
+
+    storage.delete_chore("2")
+    assert storage.get_assigned_chore_ids("Alice") == set()
+    assert storage.get_chore_ids_by("status", "overdue") == {"1"}
+
+    await storage.async_flush()
+    reloaded = SimpleChoresStorageManager(hass)
+    await reloaded.async_load()
+    assert reloaded.get_assigned_chore_ids("Bob", "overdue") == {"1"}
+
+
+async def test_status_updates_visit_only_due_buckets(hass: HomeAssistant, mock_storage) -> None:
+    """Test that later status updates only look at chores due since the last one."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    today = date(2025, 3, 10)
+    for offset in range(-30, 30):
+        due = today + timedelta(days=offset)
+        storage.add_chore(str(offset), Chore(name=str(offset), status="completed", due_date=due.isoformat()))
+
+    with patch.object(
+        Chore, "update_status_for_date", autospec=True, side_effect=Chore.update_status_for_date
+    ) as update_status:
+        changed = storage.update_chore_statuses(today)
+        assert update_status.call_count == 60
+        assert len(changed) == 31
+        assert storage.get_chore_ids_by("status", "pending") == {"0"}
+
+        update_status.reset_mock()
+        changed = storage.update_chore_statuses(today + timedelta(days=1))
+        # Only the buckets of the previous day and the new day are visited
+        assert update_status.call_count == 2
+        assert changed == ["0", "1"]
+        assert storage.get_chore("0").status == "overdue"
+        assert storage.get_chore("1").status == "pending"
+
+    # A status set by hand against an older due date is only repaired by a full check
+    stale = storage.get_chore("-20")
+    stale.status = "completed"
+    storage.update_chore("-20", stale)
+    assert storage.update_chore_statuses(today + timedelta(days=1)) == []
+    assert storage.update_chore_statuses(today + timedelta(days=1), full=True) == ["-20"]
+    assert stale.status == "overdue"
+
+
+async def test_status_updates_skip_chores_deleted_in_a_batch(hass: HomeAssistant, mock_storage) -> None:
+    """Test that chores the index still lists during a batch are skipped."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    today = date(2025, 3, 10)
+    storage.add_chore("1", Chore(name="Old", due_date=today - timedelta(days=3)))
+    storage.add_chore("2", Chore(name="Kept", due_date=today - timedelta(days=3)))
+    storage.update_chore_statuses(today - timedelta(days=5))
+
+    async with storage.async_batch():
+        storage.delete_chore("1")
+        assert storage.update_chore_statuses(today) == ["2"]
+        assert storage.reschedule_chores(today) == ["2"]
+
+
+def _store_version_1(hass_storage: dict[str, Any], data: dict[str, Any]) -> None:
+    """Put data saved by a storage version 1 release on disk."""
+    hass_storage[f"{DOMAIN}.json"] = {"version": 1, "key": f"{DOMAIN}.json", "data": data}
+
+
+async def test_counters_migrate_to_period_keys(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test that counters saved with last reset dates get matching period keys."""
+    _store_version_1(hass_storage, {
+        "members": {"Alice": {"points_earned_today": 4, "points_earned_this_year": 9}},
+        "chores": {},
+        "last_reset_today": "2020-03-02",
+        "last_reset_this_year": "2020-01-01T00:00:00",
+    })
+
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    alice = storage.get_member("Alice")
+
+    assert alice.period_keys["today"] == "2020-03-02"
+    assert alice.period_keys["this_year"] == "2020"
+    assert alice.get_points("this_year", date(2020, 3, 5)) == 9
+    assert alice.get_points("today", date(2020, 3, 5)) == 0
+    assert "last_reset_today" not in storage.data
+
+
+async def test_members_migrate_to_member_ids(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test that name-keyed members and name references in chores get member IDs."""
+    _store_version_1(hass_storage, {
+        "members": {"Alice": {"points_earned_today": 4}, "Bob": {}},
+        "chores": {
+            "123456": {
+                "name": "Dishes",
+                "assigned_to": "Bob",
+                "possible_assignees": ["Alice", "Bob", "Carol"],
+            },
+        },
+    })
+
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+
+    assert storage.get_member_id("Alice") == 1
+    assert storage.get_member_id("Bob") == 2
+    assert storage.get_member("Alice").points_earned_today == 4
+    chore = storage.get_chore("123456")
+    assert chore.assigned_to == 2
+    assert chore.possible_assignees == [1, 2]
+    assert storage.get_assigned_chore_ids("Bob") == {"123456"}
+    assert set(storage.data["members"]) == {"1", "2"}
+
+    # The migrated data is written right away, with the current version
+    stored = hass_storage[f"{DOMAIN}.json"]
+    assert stored["version"] == STORAGE_VERSION
+    assert set(stored["data"]["members"]) == {"1", "2"}
+
+    storage.add_member(Member(name="Carol"))
+    assert storage.get_member_id("Carol") == 3
+
+
+async def test_migration_follows_the_storage_version(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test that the storage version, not the member ID counter, decides the migration."""
+    # A version 1 file that already has the counter is still migrated
+    _store_version_1(hass_storage, {
+        "members": {"Alice": {}},
+        "chores": {"1": {"name": "Dishes", "assigned_to": "Alice"}},
+        "next_member_id": 7,
+    })
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    assert storage.get_member_id("Alice") == 1
+    assert storage.get_chore("1").assigned_to == 1
+
+    # A current file without the counter is left alone
+    hass_storage[f"{DOMAIN}.json"] = {
+        "version": STORAGE_VERSION,
+        "key": f"{DOMAIN}.json",
+        "data": {
+            "members": {"4": {"name": "Bob", "member_id": 4}},
+            "chores": {"1": {"name": "Dishes", "assigned_to": 4}},
+        },
+    }
+    storage = SimpleChoresStorageManager(hass)
+    with patch.object(SimpleChoresStorageManager, "async_flush") as flush:
+        await storage.async_load()
+    assert flush.call_count == 0
+    assert storage.get_member_id("Bob") == 4
+    assert storage.get_chore("1").assigned_to == 4
+    storage.add_member(Member(name="Carol"))
+    assert storage.get_member_id("Carol") == 5
+
+
+async def test_rename_member_touches_one_record(hass: HomeAssistant, mock_storage) -> None:
+    """Test that renaming a member rewrites neither chores nor their index."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    member_id = storage.get_member_id("Alice")
+    storage.add_chore("1", Chore(name="Dishes", assigned_to=member_id, possible_assignees=[member_id]))
+    await storage.async_flush()
+
+    with patch.object(Chore, "to_dict", autospec=True, side_effect=Chore.to_dict) as to_dict:
+        assert storage.rename_member("Alice", "Alicia")
+        await storage.async_flush()
+        assert to_dict.call_count == 0
+
+    assert storage.get_member("Alice") is None
+    assert storage.get_member_id("Alicia") == member_id
+    assert storage.get_member_name(storage.get_chore("1").assigned_to) == "Alicia"
+    assert storage.get_assigned_chore_ids("Alicia") == {"1"}
+    assert storage.data["members"][str(member_id)]["name"] == "Alicia"
+
+
+async def test_chore_ids_are_allocated_from_a_persisted_counter(hass: HomeAssistant, mock_storage) -> None:
+    """Test that bulk-created chores get distinct IDs that are not reused after a reload."""
+    stored = await mock_storage.return_value.async_load()
+    # A hashed ID of an older version
+    stored["chores"]["481516"] = {"name": "Legacy"}
+
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    chore_ids = [storage.allocate_chore_id() for _ in range(10_000)]
+    for chore_id in chore_ids:
+        storage.add_chore(chore_id, Chore(name="Bulk", created_at="2025-01-01T08:00:00"))
+
+    assert len(storage.get_chores()) == 10_001
+    assert chore_ids[0] == "481517"
+    with pytest.raises(ValueError):
+        storage.add_chore(chore_ids[0], Chore(name="Duplicate"))
+
+    storage.delete_chore(chore_ids[-1])
+    await storage.async_flush()
+    reloaded = SimpleChoresStorageManager(hass)
+    await reloaded.async_load()
+    assert int(reloaded.allocate_chore_id()) == int(chore_ids[-1]) + 1
+
+
+async def test_batch_applies_changes_once(hass: HomeAssistant, mock_storage) -> None:
+    """Test that a batch updates the index, notifies and saves once for all changes."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    for chore_id in ("1", "2", "3"):
+        storage.add_chore(chore_id, Chore(name=chore_id, area_id="kitchen"))
+    await storage.async_flush()
+    changes = []
+    storage.async_add_chore_listener(changes.append)
+
+    with patch.object(storage, "async_save", wraps=storage.async_save) as async_save:
+        async with storage.async_batch() as changed:
+            storage.delete_chore("1")
+            chore = storage.get_chore("2")
+            chore.area_id = "hall"
+            storage.update_chore("2", chore)
+            storage.add_chore("4", Chore(name="4", area_id="kitchen"))
+            storage.delete_member("Alice")
+            # The index is only updated when the batch ends
+            assert storage.get_chore_ids_by("area_id", "kitchen") == {"1", "2", "3"}
+            assert changes == []
+
+    assert changed == {"1", "2", "4"}
+    assert changes == [["1", "2", "4"]]
+    assert async_save.call_count == 1
+    assert storage.get_chore_ids_by("area_id", "kitchen") == {"3", "4"}
+    assert storage.get_chore_ids_by("area_id", "hall") == {"2"}
+
+    await storage.async_flush()
+    assert set(storage.data["chores"]) == {"2", "3", "4"}
+    assert storage.data["members"] == {}
+
+
+async def test_failed_batch_is_rolled_back(hass: HomeAssistant, mock_storage) -> None:
+    """Test that nothing a failing batch reported is kept."""
+    storage = SimpleChoresStorageManager(hass)
+    await storage.async_load()
+    storage.add_member(Member(name="Alice"))
+    storage.add_chore("1", Chore(name="Dishes", points=1))
+    storage.add_chore("2", Chore(name="Laundry"))
+    changes = []
+    storage.async_add_chore_listener(changes.append)
+
+    with pytest.raises(RuntimeError):
+        async with storage.async_batch():
+            chore = storage.get_chore("1")
+            chore.points = 5
+            storage.update_chore("1", chore)
+            storage.delete_chore("2")
+            storage.add_chore("3", Chore(name="Trash"))
+            storage.rename_member("Alice", "Alicia")
+            raise RuntimeError
+
+    assert storage.get_chore("1").points == 1
+    assert storage.get_chore("2").name == "Laundry"
+    assert storage.get_chore("3") is None
+    assert storage.get_member("Alice") is not None
+    assert storage.get_member("Alicia") is None
+    assert storage.get_chore_ids_by("status", "pending") == {"1", "2"}
+    assert changes == []
+    assert not storage.is_dirty